@@ -0,0 +1,87 @@
+"""
+Benchmark for response compression over a simulated slow link.
+
+Serves a get_all_records response from a local HTTP server that throttles its output to the given bandwidth,
+and times a call through PooledTransport with and without compression (parsing included).
+Run with `python benchmarks/bench_compression.py [number of VMs] [bandwidth in Mbit/s]`
+"""
+import http.server
+import os
+import socketserver
+import sys
+import threading
+import time
+import xmlrpc.client
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from xenbridge.xenconnection import PooledTransport
+from bench_converters import make_records
+
+
+class SlowLinkServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, body: bytes, bandwidth: float):
+        super().__init__(('127.0.0.1', 0), SlowLinkHandler)
+        self.bodies = {
+            'identity': body,
+            'gzip': _compress(body, zlib.MAX_WBITS | 16),
+            'deflate': _compress(body, zlib.MAX_WBITS),
+        }
+        self.bandwidth = bandwidth      # Bytes per second
+
+
+def _compress(body: bytes, wbits: int) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, wbits)
+    return compressor.compress(body) + compressor.flush()
+
+
+class SlowLinkHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        accepted = [encoding.strip() for encoding in self.headers.get('Accept-Encoding', '').split(',')]
+        encoding = next((encoding for encoding in ('gzip', 'deflate') if encoding in accepted), 'identity')
+        body = self.server.bodies[encoding]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(body)))
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        # Send the body in 10ms slices of the bandwidth
+        step = max(int(self.server.bandwidth / 100), 1)
+        for start in range(0, len(body), step):
+            self.wfile.write(body[start:start + step])
+            time.sleep(0.01)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(count=2000, bandwidth=20):
+    records = make_records(count)
+    body = xmlrpc.client.dumps(({'Status': 'Success', 'Value': records},), methodresponse=True).encode('utf-8')
+    server = SlowLinkServer(body, bandwidth * 1e6 / 8)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f'127.0.0.1:{server.server_address[1]}'
+    request = xmlrpc.client.dumps(('OpaqueRef:session',), 'VM.get_all_records').encode('utf-8')
+
+    print(f'get_all_records for {count} VMs over a {bandwidth} Mbit/s link')
+    print(f"{'encoding':<12}{'body':>10}{'time':>10}")
+    for name, compression, encoding in [('identity', False, 'identity'), ('gzip', True, 'gzip')]:
+        transport = PooledTransport(compression=compression)
+        start = time.perf_counter()
+        result, = transport.request(host, '/', request)
+        duration = time.perf_counter() - start
+        assert len(result['Value']) == count
+        size = len(server.bodies[encoding])
+        print(f'{name:<12}{size / 2**20:>8.1f}MB{duration:>9.2f}s')
+        transport.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark for the conversion of API return values to python types.
+
+Compares the compiled converters from xenobject.compile_converter against the reflective
+walker that inspected the type hint for every single value.
+Run with `python benchmarks/bench_converters.py [number of VMs]`
+"""
+import datetime
+import inspect
+import os
+import sys
+import timeit
+import typing
+import xmlrpc.client
+from typing import Dict, Any, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import xenbridge
+from xenbridge.xenobject import XenObject, XenEnum, compile_converter
+from xenbridge.vm import VmPowerState
+
+
+class Connection:
+    """Stand-in for a XenConnection, conversion doesn't make any API calls"""
+    asynchronous = False
+
+
+def reflective_ref2xen(connection, obj, typehint):
+    """The previous implementation of XenEndpoint.ref2xen, walking the type hint for every value"""
+    def issubclass_(cls, classinfo):
+        return inspect.isclass(cls) and issubclass(cls, classinfo)
+    if typehint is None or issubclass_(typehint, None.__class__):
+        return None
+    if typing.get_origin(typehint) is list:
+        hint_args = typing.get_args(typehint)
+        return [reflective_ref2xen(connection, itm, hint_args[0]) for itm in obj]
+    if typing.get_origin(typehint) is dict:
+        key_hint, val_hint = typing.get_args(typehint)
+        return {reflective_ref2xen(connection, key, key_hint): reflective_ref2xen(connection, val, val_hint)
+                for (key, val) in obj.items()}
+    if typing.get_origin(typehint) is typing.Union:
+        hint_arg = [arg for arg in typing.get_args(typehint) if not issubclass_(arg, None.__class__)][0]
+        return None if obj is None else reflective_ref2xen(connection, obj, hint_arg)
+    if issubclass_(typehint, (bool, int, float)):
+        return typehint(obj)
+    if issubclass_(typehint, XenObject):
+        return typehint(connection, obj)
+    if issubclass_(typehint, XenEnum):
+        return typehint(obj)
+    if typehint is datetime.datetime:
+        date = datetime.datetime.strptime(obj.value, '%Y%m%dT%H:%M:%SZ')
+        return date.replace(tzinfo=datetime.timezone.utc)
+    return obj
+
+
+def make_records(count: int):
+    records = {}
+    for i in range(count):
+        record = {f'other_field_{n}': str(n) for n in range(80)}
+        record.update({
+            'uuid': f'uuid-{i}',
+            'name_label': f'vm-{i}',
+            'power_state': 'Running',
+            'VCPUs_max': '4',
+            'memory_static_max': str(4 << 30),
+            'resident_on': 'OpaqueRef:host',
+            'VBDs': [f'OpaqueRef:vbd-{i}-{n}' for n in range(4)],
+            'other_config': {f'key{n}': f'value{n}' for n in range(5)},
+            'start_time': xmlrpc.client.DateTime('20240101T10:00:00Z'),
+        })
+        records[f'OpaqueRef:vm-{i}'] = record
+    return records
+
+
+def main(count=5000, repeat=5):
+    connection = Connection()
+    records = make_records(count)
+    cases = [
+        ('get_all_records()', Dict[xenbridge.VM, Dict[str, Any]], records),
+        ('List[VM]', List[xenbridge.VM], list(records)),
+        ('Dict[VM, VmPowerState]', Dict[xenbridge.VM, VmPowerState], {ref: 'Running' for ref in records}),
+        ('Dict[VM, List[VBD]]', Dict[xenbridge.VM, List[xenbridge.VBD]],
+         {ref: rec['VBDs'] for ref, rec in records.items()}),
+    ]
+    print(f'Converting values for {count} VMs, best of {repeat}')
+    print(f"{'type hint':<26}{'reflective':>12}{'compiled':>12}{'speed-up':>10}")
+    for name, hint, value in cases:
+        reflective = min(timeit.repeat(lambda: reflective_ref2xen(connection, value, hint), number=1, repeat=repeat))
+        compiled = min(timeit.repeat(lambda: compile_converter(hint)(connection, value), number=1, repeat=repeat))
+        print(f'{name:<26}{reflective * 1000:>10.1f}ms{compiled * 1000:>10.1f}ms{reflective / compiled:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark for decoding get_all_records responses with XML-RPC and JSON-RPC.
+
+Encodes the same records as both protocols would send them, then compares the size of the response body,
+the time to decode it and the peak memory allocated while decoding.
+Run with `python benchmarks/bench_protocols.py [number of VMs]`
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+import xmlrpc.client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from xenbridge import jsonrpc
+from bench_converters import make_records
+
+
+def xmlrpc_body(records) -> bytes:
+    return xmlrpc.client.dumps(({'Status': 'Success', 'Value': records},), methodresponse=True).encode('utf-8')
+
+
+def jsonrpc_body(records) -> bytes:
+    return json.dumps({'jsonrpc': '2.0', 'result': records, 'id': 0},
+                      default=lambda obj: obj.value).encode('utf-8')     # DateTime is sent as a string
+
+
+def xmlrpc_decode(body: bytes):
+    (result,), _ = xmlrpc.client.loads(body)
+    return result
+
+
+def peak_memory(decode, body: bytes) -> int:
+    tracemalloc.start()
+    result = decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main(count=5000, repeat=5):
+    records = make_records(count)
+    cases = [
+        ('XML-RPC', xmlrpc_body(records), xmlrpc_decode),
+        ('JSON-RPC', jsonrpc_body(records), jsonrpc.loads),
+    ]
+    print(f'Decoding get_all_records for {count} VMs, best of {repeat}')
+    print(f"{'protocol':<12}{'body':>10}{'decode':>12}{'peak memory':>14}")
+    for name, body, decode in cases:
+        duration = min(timeit.repeat(lambda: decode(body), number=1, repeat=repeat))
+        peak = peak_memory(decode, body)
+        print(f'{name:<12}{len(body) / 2**20:>8.1f}MB{duration * 1000:>10.1f}ms{peak / 2**20:>12.1f}MB')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
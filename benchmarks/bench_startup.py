@@ -0,0 +1,48 @@
+"""
+Benchmark for the start-up cost of the package.
+
+Times a fresh interpreter that imports xenbridge and uses the VM and Host endpoints, against one that
+loads every class module, as `import xenbridge` did before the class modules were imported lazily.
+No connection is made, the endpoints are created on a connection object that isn't logged in.
+Run with `python benchmarks/bench_startup.py [repeat]`
+"""
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+USE_ENDPOINTS = '''
+xen = xenbridge.XenConnection.__new__(xenbridge.XenConnection)
+xen.VM, xen.Host
+'''
+
+CASES = [
+    ('interpreter', 'pass'),
+    ('import xenbridge', 'import xenbridge'),
+    ('VM and Host', 'import xenbridge' + USE_ENDPOINTS),
+    ('all classes', 'import xenbridge\n[getattr(xenbridge, name) for name in xenbridge._lazy_names]' + USE_ENDPOINTS),
+]
+
+
+def run(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=ROOT)
+    return time.perf_counter() - start
+
+
+def main(repeat=10):
+    print(f'Start-up time of a fresh interpreter, best of {repeat}')
+    baseline = None
+    for name, code in CASES:
+        duration = min(run(code) for _ in range(repeat))
+        if baseline is None:
+            baseline = duration
+            print(f'{name:<20}{duration * 1000:>8.1f}ms')
+        else:
+            print(f'{name:<20}{duration * 1000:>8.1f}ms  (+{(duration - baseline) * 1000:.1f}ms)')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -29,7 +29,7 @@ class AccessType(enum.Enum):
 class Argument:
     def __init__(self, name: str, type: str):
         self.name = sanitize_name(name)
-        self.type = parse_type(type)
+        self.type = parse_type(type, records=False)
     def __str__(self):
         if self.type is None: return self.name
         else: return f'{self.name}: {self.type}'
@@ -48,9 +48,24 @@ class XenMethod:
             body = '...'
         body = textwrap.indent(body, INDENTATION)
         return f"@XenMethod\ndef {self.name}({', '.join(argstr)}){returnstr}:\n{body}"
+# Fields that are grouped in a namespace of the xapi datamodel (like VM memory/static_max) are stored in the
+# database as namespace__field. The documentation doesn't show namespaces, so they are listed here per class.
+NAMESPACES = {
+    'VM': ('memory', 'VCPUs', 'actions', 'PV', 'HVM'),
+    'VM_metrics': ('memory', 'VCPUs'),
+    'host': ('API_version', 'memory'),
+    'host_metrics': ('memory',),
+}
+
+
 class XenProperty:
-    def __init__(self, name: str, type: str, access: str, description: str=None):
+    def __init__(self, name: str, type: str, access: str, description: str=None, class_name: str=None):
         self.name = sanitize_name(name)
+        # Name of the database column, used in get_all_records_where queries
+        self.column = None
+        for namespace in NAMESPACES.get(class_name, ()):
+            if name.startswith(namespace + '_'):
+                self.column = namespace + '__' + name[len(namespace) + 1:]
         self.type = parse_type(type)
         self.description = description
         if re.search('RO', access):
@@ -64,7 +79,8 @@ class XenProperty:
     def code(self):
         annotation = f': {self.type}' if self.type is not None else ''
         description = f", {repr(unidecode(self.description))}" if self.description is not None else ''
-        return f'{self.name}{annotation} = XenProperty({self.access.code()}{description})'
+        column = f", column='{self.column}'" if self.column is not None else ''
+        return f'{self.name}{annotation} = XenProperty({self.access.code()}{description}{column})'
 class XenEnum:
     def __init__(self, name: str, values: List[str] = None):
         name = ''.join([word.title() for word in name.split('_')])
@@ -85,6 +101,8 @@ class XenRef:
         if isinstance(other, XenRef):
             return self.name == other.name
         return False
+class XenRecordRef(XenRef):
+    def __str__(self): return f"'{self.scope}{self.name}.Record'"
 class XenClass:
     def __init__(self, name: str, enums: Dict[str, XenEnum],
                                   properties: Dict[str, XenProperty],
@@ -118,7 +136,8 @@ class XenClass:
             code += '\n'
 
         code += f'class {self.class_name}(XenObject):\n'
-        code += f"    xenpath='{self.name}'\n\n"
+        code += f"    xenpath='{self.name}'\n"
+        code += '    __slots__ = ()\n\n'
 
         for group in (self.properties, self.boundmethods):
             if len(group):
@@ -132,6 +151,7 @@ class XenClass:
 
         code += f'\nclass {self.class_name}Endpoint(XenEndpoint):\n'
         code += f"    xenpath='{self.name}'\n"
+        code += '    __slots__ = ()\n'
         if self.staticmethods:
             for name, member in self.staticmethods.items():
                 code += textwrap.indent(member.code(), INDENTATION)
@@ -189,7 +209,7 @@ def parse_page(url: str):
                 type = elem.find(class_='inline-type').text
                 access = elem.find(class_='inline-qualifier').text
                 description = elem.find(class_='field-description').text.strip()
-                properties[name] = XenProperty(name, type, access, description)
+                properties[name] = XenProperty(name, type, access, description, class_name)
             # Parse Methods
             elif doc_section == 'messages':
                 name = elem.find(class_='field-name').text
@@ -212,7 +232,7 @@ def parse_page(url: str):
     return XenClass(class_name, enums, properties, methods)
 
 
-def parse_type(type_str: str):
+def parse_type(type_str: str, records: bool = True):
     type_str = type_str.strip()
     if type_str == 'string': return 'str'
     if type_str == 'int': return 'int'
@@ -222,15 +242,17 @@ def parse_type(type_str: str):
     if type_str == 'void': return 'None'
     if RE_SET.match(type_str):
         type_str = RE_SET.match(type_str).group(1)
-        return f'List[{parse_type(type_str)}]'
+        return f'List[{parse_type(type_str, records)}]'
     if RE_DICT.match(type_str):
         key, value = RE_DICT.match(type_str).groups()
-        return f'Dict[{parse_type(key)}, {parse_type(value)}]'
+        return f'Dict[{parse_type(key, records)}, {parse_type(value, records)}]'
     if RE_RECORD.match(type_str):
+        if records:
+            return XenRecordRef(RE_RECORD.match(type_str).group(1))
         return 'Dict[str, Any]'
     if RE_OPTION.match(type_str):
         type_str = RE_OPTION.match(type_str).group(1)
-        return f'Optional[{parse_type(type_str)}]'
+        return f'Optional[{parse_type(type_str, records)}]'
     if RE_XEN.match(type_str):
         type_str = RE_XEN.match(type_str).group(1)
         return XenRef(type_str)
@@ -257,24 +279,55 @@ resp.raise_for_status()
 main_page = BeautifulSoup(resp.text, features='html.parser')
 navbar = main_page.find(id='sidebar')
 endpoints = {}
+lazy_names = {}
+for url in navbar.find_all('a', recursive=False):
+    print(f'--- {url.text} ---')
+    page_url = urllib.parse.urljoin(main_url, url['href'])
+    cls = parse_page(page_url)
+    with open(f'xenbridge/{cls.name.lower()}.py', 'w') as f:
+        f.write(f'#Automatically generated from {page_url}\n')
+        f.write('import xenbridge\n')
+        f.write('from .xenobject import XenObject, XenEndpoint, XenMethod, XenProperty, XenEnum\n')
+        f.write('from typing import List, Dict, Any, Optional\n')
+        f.write('import datetime\n')
+        f.write('\n\n')
+        f.write(cls.code())
+    lazy_names[cls.name.lower()] = cls.all()
+    endpoints[cls.class_name] = f'{cls.class_name}Endpoint'
+
 with open('xenbridge/__init__.py', 'w') as init_f:
-    for url in navbar.find_all('a', recursive=False):
-        print(f'--- {url.text} ---')
-        page_url = urllib.parse.urljoin(main_url, url['href'])
-        cls = parse_page(page_url)
-        with open(f'xenbridge/{cls.name.lower()}.py', 'w') as f:
-            f.write(f'#Automatically generated from {page_url}\n')
-            f.write('import xenbridge\n')
-            f.write('from .xenobject import XenObject, XenEndpoint, XenMethod, XenProperty, XenEnum\n')
-            f.write('from typing import List, Dict, Any, Optional\n')
-            f.write('import datetime\n')
-            f.write('\n\n')
-            f.write(cls.code())
-        init_f.write(f'from .{cls.name.lower()} import {cls.all()}\n')
-        endpoints[cls.class_name] = f'{cls.class_name}Endpoint'
-    init_f.write('from .xenobject import XenObject, XenEndpoint\n')
+    # Class modules are imported on first use of one of their names, through the module's __getattr__.
+    # It has to be defined before the imports below, as xenconnection imports Session from the package
+    init_f.write('import importlib\n')
+    init_f.write('\n# The class modules are only imported when one of their names is first used (PEP 562)\n')
+    init_f.write('_lazy_names = {\n')
+    for module, names in lazy_names.items():
+        init_f.write('    ' + ' '.join(f"'{name}': '{module}'," for name in names.split(', ')) + '\n')
+    init_f.write('    # Optional parts, which import asyncio and concurrent.futures\n')
+    init_f.write("    'AsyncXenConnectionBase': 'asyncconnection', 'AsyncXenConnection': 'asyncconnection',\n")
+    init_f.write("    'TaskFuture': 'tasks',\n")
+    init_f.write('}\n')
+    init_f.write('''
+
+def __getattr__(name):
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
+''')
+    init_f.write('from .xenobject import XenObject, XenEndpoint, XenError\n')
+    init_f.write('from .query import XenQuery\n')
     init_f.write('from .xenconnection import XenConnectionBase\n')
-    # init_f.write('from .xenobject import XenObject, XenEndpoint, XenConnectionBase\n')
     init_f.write('\nclass XenConnection(XenConnectionBase):\n')
     for name, type in endpoints.items():
-        init_f.write(f'    {name}: {type}\n')
+        init_f.write(f"    {name}: '{type}'\n")
+    init_f.write('\n\n__all__ = [*_lazy_names, \'XenObject\', \'XenEndpoint\', \'XenError\', \'XenQuery\', '
+                 '\'XenConnectionBase\', \'XenConnection\']\n')
@@ -1,134 +1,161 @@
-from .auth import Auth, AuthEndpoint
-from .blob import Blob, BlobEndpoint
-from .bond import Bond, BondEndpoint
-from .certificate import Certificate, CertificateEndpoint
-from .cluster import Cluster, ClusterEndpoint
-from .cluster_host import ClusterHost, ClusterHostEndpoint
-from .console import Console, ConsoleEndpoint
-from .crashdump import Crashdump, CrashdumpEndpoint
-from .data_source import DataSource, DataSourceEndpoint
-from .dr_task import DRTask, DRTaskEndpoint
-from .event import Event, EventEndpoint
-from .feature import Feature, FeatureEndpoint
-from .gpu_group import GPUGroup, GPUGroupEndpoint
-from .host import Host, HostEndpoint
-from .host_cpu import HostCpu, HostCpuEndpoint
-from .host_crashdump import HostCrashdump, HostCrashdumpEndpoint
-from .host_metrics import HostMetrics, HostMetricsEndpoint
-from .host_patch import HostPatch, HostPatchEndpoint
-from .lvhd import LVHD, LVHDEndpoint
-from .message import Message, MessageEndpoint
-from .network import Network, NetworkEndpoint
-from .network_sriov import NetworkSriov, NetworkSriovEndpoint
-from .pbd import PBD, PBDEndpoint
-from .pci import PCI, PCIEndpoint
-from .pgpu import PGPU, PGPUEndpoint
-from .pif import PIF, PIFEndpoint
-from .pif_metrics import PIFMetrics, PIFMetricsEndpoint
-from .pool import Pool, PoolEndpoint
-from .pool_patch import PoolPatch, PoolPatchEndpoint
-from .pool_update import PoolUpdate, PoolUpdateEndpoint
-from .probe_result import ProbeResult, ProbeResultEndpoint
-from .pusb import PUSB, PUSBEndpoint
-from .pvs_cache_storage import PVSCacheStorage, PVSCacheStorageEndpoint
-from .pvs_proxy import PVSProxy, PVSProxyEndpoint
-from .pvs_server import PVSServer, PVSServerEndpoint
-from .pvs_site import PVSSite, PVSSiteEndpoint
-from .role import Role, RoleEndpoint
-from .sdn_controller import SDNController, SDNControllerEndpoint
-from .secret import Secret, SecretEndpoint
-from .session import Session, SessionEndpoint
-from .sm import SM, SMEndpoint
-from .sr import SR, SREndpoint
-from .sr_stat import SrStat, SrStatEndpoint
-from .subject import Subject, SubjectEndpoint
-from .task import Task, TaskEndpoint
-from .tunnel import Tunnel, TunnelEndpoint
-from .usb_group import USBGroup, USBGroupEndpoint
-from .user import User, UserEndpoint
-from .vbd import VBD, VBDEndpoint
-from .vbd_metrics import VBDMetrics, VBDMetricsEndpoint
-from .vdi import VDI, VDIEndpoint
-from .vdi_nbd_server_info import VdiNbdServerInfo, VdiNbdServerInfoEndpoint
-from .vgpu import VGPU, VGPUEndpoint
-from .vgpu_type import VGPUType, VGPUTypeEndpoint
-from .vif import VIF, VIFEndpoint
-from .vif_metrics import VIFMetrics, VIFMetricsEndpoint
-from .vlan import VLAN, VLANEndpoint
-from .vm import VM, VMEndpoint
-from .vm_appliance import VMAppliance, VMApplianceEndpoint
-from .vm_guest_metrics import VMGuestMetrics, VMGuestMetricsEndpoint
-from .vm_metrics import VMMetrics, VMMetricsEndpoint
-from .vmpp import VMPP, VMPPEndpoint
-from .vmss import VMSS, VMSSEndpoint
-from .vtpm import VTPM, VTPMEndpoint
-from .vusb import VUSB, VUSBEndpoint
+import importlib
+
+# The class modules are only imported when one of their names is first used (PEP 562)
+_lazy_names = {
+    'Auth': 'auth', 'AuthEndpoint': 'auth',
+    'Blob': 'blob', 'BlobEndpoint': 'blob',
+    'Bond': 'bond', 'BondEndpoint': 'bond',
+    'Certificate': 'certificate', 'CertificateEndpoint': 'certificate',
+    'Cluster': 'cluster', 'ClusterEndpoint': 'cluster',
+    'ClusterHost': 'cluster_host', 'ClusterHostEndpoint': 'cluster_host',
+    'Console': 'console', 'ConsoleEndpoint': 'console',
+    'Crashdump': 'crashdump', 'CrashdumpEndpoint': 'crashdump',
+    'DataSource': 'data_source', 'DataSourceEndpoint': 'data_source',
+    'DRTask': 'dr_task', 'DRTaskEndpoint': 'dr_task',
+    'Event': 'event', 'EventEndpoint': 'event',
+    'Feature': 'feature', 'FeatureEndpoint': 'feature',
+    'GPUGroup': 'gpu_group', 'GPUGroupEndpoint': 'gpu_group',
+    'Host': 'host', 'HostEndpoint': 'host',
+    'HostCpu': 'host_cpu', 'HostCpuEndpoint': 'host_cpu',
+    'HostCrashdump': 'host_crashdump', 'HostCrashdumpEndpoint': 'host_crashdump',
+    'HostMetrics': 'host_metrics', 'HostMetricsEndpoint': 'host_metrics',
+    'HostPatch': 'host_patch', 'HostPatchEndpoint': 'host_patch',
+    'LVHD': 'lvhd', 'LVHDEndpoint': 'lvhd',
+    'Message': 'message', 'MessageEndpoint': 'message',
+    'Network': 'network', 'NetworkEndpoint': 'network',
+    'NetworkSriov': 'network_sriov', 'NetworkSriovEndpoint': 'network_sriov',
+    'PBD': 'pbd', 'PBDEndpoint': 'pbd',
+    'PCI': 'pci', 'PCIEndpoint': 'pci',
+    'PGPU': 'pgpu', 'PGPUEndpoint': 'pgpu',
+    'PIF': 'pif', 'PIFEndpoint': 'pif',
+    'PIFMetrics': 'pif_metrics', 'PIFMetricsEndpoint': 'pif_metrics',
+    'Pool': 'pool', 'PoolEndpoint': 'pool',
+    'PoolPatch': 'pool_patch', 'PoolPatchEndpoint': 'pool_patch',
+    'PoolUpdate': 'pool_update', 'PoolUpdateEndpoint': 'pool_update',
+    'ProbeResult': 'probe_result', 'ProbeResultEndpoint': 'probe_result',
+    'PUSB': 'pusb', 'PUSBEndpoint': 'pusb',
+    'PVSCacheStorage': 'pvs_cache_storage', 'PVSCacheStorageEndpoint': 'pvs_cache_storage',
+    'PVSProxy': 'pvs_proxy', 'PVSProxyEndpoint': 'pvs_proxy',
+    'PVSServer': 'pvs_server', 'PVSServerEndpoint': 'pvs_server',
+    'PVSSite': 'pvs_site', 'PVSSiteEndpoint': 'pvs_site',
+    'Role': 'role', 'RoleEndpoint': 'role',
+    'SDNController': 'sdn_controller', 'SDNControllerEndpoint': 'sdn_controller',
+    'Secret': 'secret', 'SecretEndpoint': 'secret',
+    'Session': 'session', 'SessionEndpoint': 'session',
+    'SM': 'sm', 'SMEndpoint': 'sm',
+    'SR': 'sr', 'SREndpoint': 'sr',
+    'SrStat': 'sr_stat', 'SrStatEndpoint': 'sr_stat',
+    'Subject': 'subject', 'SubjectEndpoint': 'subject',
+    'Task': 'task', 'TaskEndpoint': 'task',
+    'Tunnel': 'tunnel', 'TunnelEndpoint': 'tunnel',
+    'USBGroup': 'usb_group', 'USBGroupEndpoint': 'usb_group',
+    'User': 'user', 'UserEndpoint': 'user',
+    'VBD': 'vbd', 'VBDEndpoint': 'vbd',
+    'VBDMetrics': 'vbd_metrics', 'VBDMetricsEndpoint': 'vbd_metrics',
+    'VDI': 'vdi', 'VDIEndpoint': 'vdi',
+    'VdiNbdServerInfo': 'vdi_nbd_server_info', 'VdiNbdServerInfoEndpoint': 'vdi_nbd_server_info',
+    'VGPU': 'vgpu', 'VGPUEndpoint': 'vgpu',
+    'VGPUType': 'vgpu_type', 'VGPUTypeEndpoint': 'vgpu_type',
+    'VIF': 'vif', 'VIFEndpoint': 'vif',
+    'VIFMetrics': 'vif_metrics', 'VIFMetricsEndpoint': 'vif_metrics',
+    'VLAN': 'vlan', 'VLANEndpoint': 'vlan',
+    'VM': 'vm', 'VMEndpoint': 'vm',
+    'VMAppliance': 'vm_appliance', 'VMApplianceEndpoint': 'vm_appliance',
+    'VMGuestMetrics': 'vm_guest_metrics', 'VMGuestMetricsEndpoint': 'vm_guest_metrics',
+    'VMMetrics': 'vm_metrics', 'VMMetricsEndpoint': 'vm_metrics',
+    'VMPP': 'vmpp', 'VMPPEndpoint': 'vmpp',
+    'VMSS': 'vmss', 'VMSSEndpoint': 'vmss',
+    'VTPM': 'vtpm', 'VTPMEndpoint': 'vtpm',
+    'VUSB': 'vusb', 'VUSBEndpoint': 'vusb',
+    # Optional parts, which import asyncio and concurrent.futures
+    'AsyncXenConnectionBase': 'asyncconnection', 'AsyncXenConnection': 'asyncconnection',
+    'TaskFuture': 'tasks',
+}
+
+
+def __getattr__(name):
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
 from .xenobject import XenObject, XenEndpoint, XenError
+from .query import XenQuery
 from .xenconnection import XenConnectionBase
 
 class XenConnection(XenConnectionBase):
-    Auth: AuthEndpoint
-    Blob: BlobEndpoint
-    Bond: BondEndpoint
-    Certificate: CertificateEndpoint
-    Cluster: ClusterEndpoint
-    ClusterHost: ClusterHostEndpoint
-    Console: ConsoleEndpoint
-    Crashdump: CrashdumpEndpoint
-    DataSource: DataSourceEndpoint
-    DRTask: DRTaskEndpoint
-    Event: EventEndpoint
-    Feature: FeatureEndpoint
-    GPUGroup: GPUGroupEndpoint
-    Host: HostEndpoint
-    HostCpu: HostCpuEndpoint
-    HostCrashdump: HostCrashdumpEndpoint
-    HostMetrics: HostMetricsEndpoint
-    HostPatch: HostPatchEndpoint
-    LVHD: LVHDEndpoint
-    Message: MessageEndpoint
-    Network: NetworkEndpoint
-    NetworkSriov: NetworkSriovEndpoint
-    PBD: PBDEndpoint
-    PCI: PCIEndpoint
-    PGPU: PGPUEndpoint
-    PIF: PIFEndpoint
-    PIFMetrics: PIFMetricsEndpoint
-    Pool: PoolEndpoint
-    PoolPatch: PoolPatchEndpoint
-    PoolUpdate: PoolUpdateEndpoint
-    ProbeResult: ProbeResultEndpoint
-    PUSB: PUSBEndpoint
-    PVSCacheStorage: PVSCacheStorageEndpoint
-    PVSProxy: PVSProxyEndpoint
-    PVSServer: PVSServerEndpoint
-    PVSSite: PVSSiteEndpoint
-    Role: RoleEndpoint
-    SDNController: SDNControllerEndpoint
-    Secret: SecretEndpoint
-    Session: SessionEndpoint
-    SM: SMEndpoint
-    SR: SREndpoint
-    SrStat: SrStatEndpoint
-    Subject: SubjectEndpoint
-    Task: TaskEndpoint
-    Tunnel: TunnelEndpoint
-    USBGroup: USBGroupEndpoint
-    User: UserEndpoint
-    VBD: VBDEndpoint
-    VBDMetrics: VBDMetricsEndpoint
-    VDI: VDIEndpoint
-    VdiNbdServerInfo: VdiNbdServerInfoEndpoint
-    VGPU: VGPUEndpoint
-    VGPUType: VGPUTypeEndpoint
-    VIF: VIFEndpoint
-    VIFMetrics: VIFMetricsEndpoint
-    VLAN: VLANEndpoint
-    VM: VMEndpoint
-    VMAppliance: VMApplianceEndpoint
-    VMGuestMetrics: VMGuestMetricsEndpoint
-    VMMetrics: VMMetricsEndpoint
-    VMPP: VMPPEndpoint
-    VMSS: VMSSEndpoint
-    VTPM: VTPMEndpoint
-    VUSB: VUSBEndpoint
+    Auth: 'AuthEndpoint'
+    Blob: 'BlobEndpoint'
+    Bond: 'BondEndpoint'
+    Certificate: 'CertificateEndpoint'
+    Cluster: 'ClusterEndpoint'
+    ClusterHost: 'ClusterHostEndpoint'
+    Console: 'ConsoleEndpoint'
+    Crashdump: 'CrashdumpEndpoint'
+    DataSource: 'DataSourceEndpoint'
+    DRTask: 'DRTaskEndpoint'
+    Event: 'EventEndpoint'
+    Feature: 'FeatureEndpoint'
+    GPUGroup: 'GPUGroupEndpoint'
+    Host: 'HostEndpoint'
+    HostCpu: 'HostCpuEndpoint'
+    HostCrashdump: 'HostCrashdumpEndpoint'
+    HostMetrics: 'HostMetricsEndpoint'
+    HostPatch: 'HostPatchEndpoint'
+    LVHD: 'LVHDEndpoint'
+    Message: 'MessageEndpoint'
+    Network: 'NetworkEndpoint'
+    NetworkSriov: 'NetworkSriovEndpoint'
+    PBD: 'PBDEndpoint'
+    PCI: 'PCIEndpoint'
+    PGPU: 'PGPUEndpoint'
+    PIF: 'PIFEndpoint'
+    PIFMetrics: 'PIFMetricsEndpoint'
+    Pool: 'PoolEndpoint'
+    PoolPatch: 'PoolPatchEndpoint'
+    PoolUpdate: 'PoolUpdateEndpoint'
+    ProbeResult: 'ProbeResultEndpoint'
+    PUSB: 'PUSBEndpoint'
+    PVSCacheStorage: 'PVSCacheStorageEndpoint'
+    PVSProxy: 'PVSProxyEndpoint'
+    PVSServer: 'PVSServerEndpoint'
+    PVSSite: 'PVSSiteEndpoint'
+    Role: 'RoleEndpoint'
+    SDNController: 'SDNControllerEndpoint'
+    Secret: 'SecretEndpoint'
+    Session: 'SessionEndpoint'
+    SM: 'SMEndpoint'
+    SR: 'SREndpoint'
+    SrStat: 'SrStatEndpoint'
+    Subject: 'SubjectEndpoint'
+    Task: 'TaskEndpoint'
+    Tunnel: 'TunnelEndpoint'
+    USBGroup: 'USBGroupEndpoint'
+    User: 'UserEndpoint'
+    VBD: 'VBDEndpoint'
+    VBDMetrics: 'VBDMetricsEndpoint'
+    VDI: 'VDIEndpoint'
+    VdiNbdServerInfo: 'VdiNbdServerInfoEndpoint'
+    VGPU: 'VGPUEndpoint'
+    VGPUType: 'VGPUTypeEndpoint'
+    VIF: 'VIFEndpoint'
+    VIFMetrics: 'VIFMetricsEndpoint'
+    VLAN: 'VLANEndpoint'
+    VM: 'VMEndpoint'
+    VMAppliance: 'VMApplianceEndpoint'
+    VMGuestMetrics: 'VMGuestMetricsEndpoint'
+    VMMetrics: 'VMMetricsEndpoint'
+    VMPP: 'VMPPEndpoint'
+    VMSS: 'VMSSEndpoint'
+    VTPM: 'VTPMEndpoint'
+    VUSB: 'VUSBEndpoint'
+
+
+__all__ = [*_lazy_names, 'XenObject', 'XenEndpoint', 'XenError', 'XenQuery', 'XenConnectionBase', 'XenConnection']
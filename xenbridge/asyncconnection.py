@@ -0,0 +1,278 @@
+import asyncio
+import collections
+import copy
+import itertools
+import ssl as ssl_module
+import time
+import urllib.parse
+import weakref
+import xmlrpc.client
+import zlib
+from . import Session, XenConnection, XenError, jsonrpc
+from .batch import map_async
+from .xenconnection import XenConnectionBase, is_long_poll, is_read_method
+
+
+class AsyncXenConnectionBase(XenConnectionBase):
+    """
+    Connection to the Xen API where every API call returns a coroutine
+
+    Logging in is done by awaiting `login()`, or by using the connection as an async context manager:
+    ```
+    async with AsyncXenConnection('http://XEN_HOSTNAME', 'root', 'password') as xen:
+        vm = await xen.VM.get_by_uuid('UUID_OF_VM')
+        print(await vm.power_state)
+    ```
+    """
+    asynchronous = True
+    current_session = None
+    event_pump = None
+    task_monitor = None
+
+    def __init__(self, host: str, user: str, passwd: str, version='1.0', emergency_mode=False,
+                 pool_size=100, idle_timeout=60.0, max_requests=0, coalesce=False, protocol='xmlrpc',
+                 compression=True, timeout=None, context=None):
+        if protocol not in ('xmlrpc', 'jsonrpc'):
+            raise ValueError(f'Unknown protocol {protocol!r}, use \'xmlrpc\' or \'jsonrpc\'')
+        self.host = host
+        self.protocol = protocol
+        self._request_ids = itertools.count()
+        self.flights = {} if coalesce else None     # (method, args) -> Task of the call in flight
+        self._identity_map = weakref.WeakValueDictionary()
+        self.cache = None
+        if protocol == 'jsonrpc':
+            self.transport = AsyncTransport(host.rstrip('/') + '/jsonrpc', pool_size=pool_size,
+                                            idle_timeout=idle_timeout, max_requests=max_requests, timeout=timeout,
+                                            context=context, content_type='application/json',
+                                            compression=compression)
+        else:
+            self.transport = AsyncTransport(host, pool_size=pool_size, idle_timeout=idle_timeout,
+                                            max_requests=max_requests, timeout=timeout, context=context,
+                                            compression=compression)
+        self.user = user
+        self.passwd = passwd
+        self.api_version = version
+        self.emergency_mode = emergency_mode
+        self.current_session = None
+
+    async def login(self):
+        if self.emergency_mode:
+            self.current_session = await self.slave_local_login_with_password(self.user, self.passwd)
+        else:
+            self.current_session = await self.login_with_password(self.user, self.passwd,
+                                                                  version=self.api_version, originator='XenBridge')
+        return self
+
+    async def login_with_password(self, uname, pwd, version, originator) -> Session:
+        """Attempt to authenticate the user, returning a session reference if successful"""
+        session_ref = await self._call_api('session.login_with_password', uname, pwd, version, originator)
+        return Session(self, session_ref)
+
+    async def slave_local_login_with_password(self, uname: str, pwd: str) -> Session:
+        """Authenticate locally against a slave in emergency mode.
+         Note the resulting sessions are only good for use on this host."""
+        session_ref = await self._call_api('session.slave_local_login_with_password', uname, pwd)
+        return Session(self, session_ref)
+
+    def batch(self, max_concurrency: int = None):
+        raise TypeError('Batches run in threads, use map() or asyncio.gather() on an asynchronous connection')
+
+    def enable_cache(self, classes, timeout: float = 30.0, path: str = None, indexes=None):
+        raise TypeError('The cache runs in a thread, use a synchronous connection')
+
+    def subscribe(self, classes=('*',), predicate=None, maxsize: int = 1000):
+        raise TypeError('The event pump runs in a thread, use events() on an asynchronous connection')
+
+    async def map(self, fn, objects, max_concurrency: int = None) -> list:
+        """Await `fn(obj)` for every object, at most `max_concurrency` at once (by default the pool size).
+        Returns the results in order, with the XenError in place of the result for calls that failed."""
+        return await map_async(fn, objects, max_concurrency or self.transport.pool_size)
+
+    async def close(self):
+        """Close all persistent connections to the server"""
+        await self.transport.close()
+
+    async def call(self, method, *args):
+        if self.flights is None or not is_read_method(method):
+            return await self._call_session(method, *args)
+        # Identical reads that are already in flight share their result
+        key = (method, repr(args))
+        task = self.flights.get(key)
+        leader = task is None
+        if leader:
+            task = self.flights[key] = asyncio.ensure_future(self._call_session(method, *args))
+            task.add_done_callback(lambda _: self.flights.pop(key, None))
+        # Shielded, so a caller that is cancelled doesn't cancel the call for the others
+        result = await asyncio.shield(task)
+        # The other callers get a copy, so they can't see each other's changes to it
+        return result if leader else copy.deepcopy(result)
+
+    async def _call_session(self, method, *args):
+        # Make a call with our session ID, logging in again if the session has expired
+        session = self.current_session
+        try:
+            return await self._call_api(method, session.ref, *args)
+        except XenError as e:
+            if e.error_code != 'SESSION_INVALID':
+                raise
+        if self.current_session is session:
+            await self.login()
+        return await self._call_api(method, self.current_session.ref, *args)
+
+    async def _call_api(self, method: str, *args):
+        # A long poll would hold a connection of the pool until it returns, starving other calls
+        bounded = not is_long_poll(method)
+        if self.protocol == 'jsonrpc':
+            request_body = jsonrpc.dumps(method, args, next(self._request_ids))
+            return self._unwrap(jsonrpc.loads(await self.transport.request(request_body, bounded)))
+        request_body = xmlrpc.client.dumps(args, method).encode('utf-8')
+        response = await self.transport.request(request_body, bounded)
+        (result,), _ = xmlrpc.client.loads(response)
+        return self._unwrap(result)
+
+    async def __aenter__(self):
+        return await self.login()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncTransport:
+    """
+    Non-blocking HTTP/1.1 client for XMLRPC (or JSON-RPC) requests, keeping a pool of persistent connections
+
+    At most `pool_size` requests are in flight at once, other requests wait for a free connection. Requests
+    that are not `bounded`, like long polls, don't count towards the limit. With `compression`, the server may send gzip or deflate compressed responses.
+    """
+    user_agent = 'XenBridge (asyncio)'
+
+    def __init__(self, url: str, pool_size=100, idle_timeout=60.0, max_requests=0, timeout=None, context=None,
+                 content_type='text/xml', compression=True):
+        parts = urllib.parse.urlsplit(url)
+        self.use_https = parts.scheme == 'https'
+        self.hostname = parts.hostname
+        self.port = parts.port or (443 if self.use_https else 80)
+        self.handler = parts.path or '/'
+        self.host_header = parts.netloc.rpartition('@')[2]
+        if self.use_https and context is None:
+            context = ssl_module.create_default_context()
+        self.context = context
+        self.content_type = content_type
+        self.compression = compression
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self._idle = collections.deque()
+        self._slots = None      # Created on first use, so it binds to the running event loop
+
+    async def request(self, request_body: bytes, bounded=True) -> bytes:
+        if not bounded:
+            return await self._request(request_body)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        async with self._slots:
+            return await self._request(request_body)
+
+    async def _request(self, request_body: bytes) -> bytes:
+        # Retry once on a fresh connection if a reused connection has gone cold
+        for fresh in (False, True):
+            conn = await self._acquire(fresh)
+            try:
+                status, reason, headers, body = await asyncio.wait_for(self._roundtrip(conn, request_body),
+                                                                       self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                conn.close()
+                if fresh or conn.requests == 0:
+                    raise
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            self._release(conn, headers.get('connection', '').lower() != 'close')
+            if status != 200:
+                raise xmlrpc.client.ProtocolError(self.host_header + self.handler, status, reason, headers)
+            return body
+
+    async def close(self):
+        idle, self._idle = self._idle, collections.deque()
+        for conn in idle:
+            conn.close()
+
+    async def _acquire(self, fresh=False):
+        now = time.monotonic()
+        while self._idle and not fresh:
+            conn = self._idle.pop()
+            if now - conn.last_used <= self.idle_timeout and not conn.reader.at_eof():
+                return conn
+            conn.close()
+        reader, writer = await asyncio.open_connection(self.hostname, self.port, ssl=self.context)
+        return _AsyncPooledConnection(reader, writer)
+
+    def _release(self, conn, reusable=True):
+        conn.requests += 1
+        if not reusable or (self.max_requests and conn.requests >= self.max_requests):
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        self._idle.append(conn)
+
+    async def _roundtrip(self, conn, request_body: bytes):
+        head = (f'POST {self.handler} HTTP/1.1\r\n'
+                f'Host: {self.host_header}\r\n'
+                f'User-Agent: {self.user_agent}\r\n'
+                f'Content-Type: {self.content_type}\r\n'
+                f'Content-Length: {len(request_body)}\r\n')
+        if self.compression:
+            head += 'Accept-Encoding: gzip, deflate\r\n'
+        head += '\r\n'
+        conn.writer.write(head.encode('latin-1') + request_body)
+        await conn.writer.drain()
+
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Connection closed by server')
+        _, status, *reason = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        headers = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await conn.reader.readline()).split(b';', 1)[0], 16)
+                if size == 0:
+                    await conn.reader.readline()
+                    break
+                chunks.append(await conn.reader.readexactly(size))
+                await conn.reader.readexactly(2)
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await conn.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await conn.reader.read()
+            headers['connection'] = 'close'
+        if headers.get('content-encoding', '').lower() in ('gzip', 'deflate'):
+            body = zlib.decompress(body, zlib.MAX_WBITS | 32)      # Detects the gzip or zlib header
+        return int(status), ''.join(reason), headers, body
+
+
+class _AsyncPooledConnection:
+    __slots__ = ('reader', 'writer', 'last_used', 'requests')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+        self.requests = 0
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncXenConnection(AsyncXenConnectionBase, XenConnection):
+    ...
@@ -7,10 +7,12 @@ import datetime
 
 class Auth(XenObject):
     xenpath='auth'
+    __slots__ = ()
 
 
 class AuthEndpoint(XenEndpoint):
     xenpath='auth'
+    __slots__ = ()
     @XenMethod
     def get_group_membership(self, subject_identifier: str) -> List[str]:
         """This calls queries the external directory service to obtain the transitively-
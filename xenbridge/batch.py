@@ -0,0 +1,78 @@
+import concurrent.futures
+from typing import Any, Callable, Iterable, List
+from .xenobject import XenError
+
+
+class XenBatch:
+    """
+    Independent API calls dispatched over a bounded pool of worker threads
+
+    Every worker uses its own pooled HTTP connection, so up to `max_concurrency` calls are in flight at once:
+    ```
+    with xen.batch() as batch:
+        for vm in vms:
+            batch.add(vm.get_record)
+    records = batch.results()
+    ```
+    Results are returned in the order the calls were added. A call that fails with a XenError has the error
+    in place of its result, other exceptions are raised by `results()`.
+    """
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency should be at least 1')
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_concurrency, thread_name_prefix='XenBatch')
+        self._futures: List[concurrent.futures.Future] = []
+
+    def add(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule `fn(*args, **kwargs)`, returning a Future of its result"""
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def results(self) -> List[Any]:
+        """Wait for all calls, returning their results (or XenErrors) in order"""
+        return [_result(future) for future in self._futures]
+
+    def close(self):
+        """Wait for all calls and stop the workers"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            for future in self._futures:
+                future.cancel()
+        self.close()
+
+
+def _result(future: concurrent.futures.Future):
+    try:
+        return future.result()
+    except XenError as e:
+        return e
+
+
+def map_sync(fn: Callable, items: Iterable, max_concurrency: int) -> List[Any]:
+    with XenBatch(max_concurrency) as batch:
+        for item in items:
+            batch.add(fn, item)
+    return batch.results()
+
+
+async def map_async(fn: Callable, items: Iterable, max_concurrency: int) -> List[Any]:
+    import asyncio
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency should be at least 1')
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def run(item):
+        async with slots:
+            try:
+                return await fn(item)
+            except XenError as e:
+                return e
+
+    return await asyncio.gather(*[run(item) for item in items])
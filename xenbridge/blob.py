@@ -7,6 +7,7 @@ import datetime
 
 class Blob(XenObject):
     xenpath='blob'
+    __slots__ = ()
 
     last_updated: datetime.datetime = XenProperty(XenProperty.READONLY, 'Time at which the data in the blob was last updated')
     mime_type: str = XenProperty(XenProperty.READONLY, "The mime type associated with this object. Defaults to 'application/octet-stream' if the empty string is supplied")
@@ -20,12 +21,13 @@ class Blob(XenObject):
     def destroy(self) -> None:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Blob.Record':
         """Get a record containing the current state of the given blob."""
 
 
 class BlobEndpoint(XenEndpoint):
     xenpath='blob'
+    __slots__ = ()
     @XenMethod
     def create(self, mime_type: str, public: bool) -> 'xenbridge.Blob':
         """Create a placeholder for a binary blob"""
@@ -33,7 +35,7 @@ class BlobEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Blob']:
         """Return a list of all the blobs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Blob', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Blob', 'xenbridge.Blob.Record']:
         """Return a map of blob references to blob records for all blobs known to the
         system."""
     @XenMethod
@@ -12,6 +12,7 @@ class BondMode(XenEnum):
 
 class Bond(XenObject):
     xenpath='Bond'
+    __slots__ = ()
 
     auto_update_mac: bool = XenProperty(XenProperty.READONLY, 'true if the MAC was taken from the primary slave when the bond was created, and false if the client specified the MAC')
     links_up: int = XenProperty(XenProperty.READONLY, 'Number of links up in this bond')
@@ -30,7 +31,7 @@ class Bond(XenObject):
     def destroy(self) -> None:
         """Destroy an interface bond"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Bond.Record':
         """Get a record containing the current state of the given Bond."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -43,6 +44,7 @@ class Bond(XenObject):
 
 class BondEndpoint(XenEndpoint):
     xenpath='Bond'
+    __slots__ = ()
     @XenMethod
     def create(self, network: 'xenbridge.Network', members: List['xenbridge.PIF'], MAC: str, mode: BondMode, properties: Dict[str, str]) -> 'xenbridge.Bond':
         """Create an interface bond"""
@@ -50,7 +52,7 @@ class BondEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Bond']:
         """Return a list of all the Bonds known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Bond', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Bond', 'xenbridge.Bond.Record']:
         """Return a map of Bond references to Bond records for all Bonds known to the
         system."""
     @XenMethod
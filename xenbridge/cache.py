@@ -0,0 +1,331 @@
+import datetime
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+import xmlrpc.client
+from typing import Dict, Iterable, Optional, Union, Any, List, Set, Tuple
+from .xenobject import XenObject, XenEnum, XenEndpoint, XenError, RecordField, xenclass, compile_converter, \
+    resolve_typehint
+from .events import NETWORK_ERRORS, current_token
+
+
+class XenCache:
+    """
+    Local mirror of the records of a set of classes, kept up to date with event.from
+
+    The cache is filled with get_all_records for every class, after which a background thread consumes
+    event.from to apply changes. While the cache is running, properties of cached objects are read from
+    memory without making an API call; their values lag the server by the latency of the event system.
+
+    If the thread fails, the cache stops (see `error`) and properties are read from the API again.
+
+    When a path is given, the cache is saved there by `save()`, and restored from it by `start()`. Only the
+    changes since the saved event token are then fetched, instead of downloading all records again.
+    """
+    FILE_VERSION = 2
+
+    def __init__(self, connection, classes: Iterable[Union[str, type]], timeout: float = 30.0, path: str = None,
+                 indexes: Dict[Union[str, type], Iterable[str]] = None):
+        self.connection = connection
+        self.classes = [cls if isinstance(cls, type) else xenclass(cls) for cls in classes]
+        self.timeout = timeout
+        self.path = path
+        self.token = ''
+        # Lowercase API class name (as used by the event system) -> {ref: raw record}
+        self.records: Dict[str, Dict[str, Dict[str, Any]]] = {cls.xenpath.lower(): {} for cls in self.classes}
+        # Lowercase API class name -> {field: index}
+        self.indexes: Dict[str, Dict[str, XenIndex]] = {name: {} for name in self.records}
+        self._lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped: Optional[threading.Event] = None        # Stop flag of the current background thread
+        self.error: Optional[BaseException] = None     # Why the background thread stopped, if it failed
+        for cls, fields in (indexes or {}).items():
+            for field in fields:
+                self.index(cls, field)
+
+    @property
+    def running(self):
+        return self._stopped is not None and not self._stopped.is_set()
+
+    def start(self):
+        """Fill the cache and start following events in a background thread"""
+        if self.running:
+            return
+        loaded = self.load() if self.path is not None else set()
+        if loaded:
+            self._download([cls for cls in self.classes if cls.xenpath.lower() not in loaded])
+            self.catch_up()
+        else:
+            self.synchronize()
+        self.error = None
+        # Every thread gets its own flag, so a thread that is still waiting on event.from after stop()
+        # exits even when the cache is started again in the meantime
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stopped,), name='XenCache', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop following events, the background thread exits when its current event.from call returns"""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    def synchronize(self):
+        """(Re)load all records of the cached classes"""
+        # Take an event token before downloading the records, so no change is missed in between.
+        # Events that are already included in the records are harmless to apply again.
+        token = current_token(self.connection)
+        self._download(self.classes)
+        self.token = token
+
+    def catch_up(self):
+        """Apply all events since the current token, without waiting for new ones"""
+        try:
+            result = self.connection.call('event.from', list(self.records), self.token, 0.0)
+        except XenError as e:
+            if e.error_code != 'EVENTS_LOST':
+                raise
+            self.synchronize()
+            return
+        with self._lock:
+            self.apply(result['events'])
+            self.token = result['token']
+
+    def save(self, path: str = None):
+        """Write the records and the event token to a file"""
+        path = path or self.path
+        with self._lock:
+            # Encoded while holding the lock, as the background thread changes the records in place
+            data = json.dumps({'version': self.FILE_VERSION, 'host': self.connection.host, 'token': self.token,
+                               'records': self.records}, default=_encode_value, separators=(',', ':'))
+        # Write to a temporary file first, so an interrupted save doesn't corrupt an existing file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.xencache')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, path: str = None) -> set:
+        """Restore records and the event token from a file written by `save()`.
+        Returns the names of the classes that were restored, which is empty if the file is missing,
+        unreadable or belongs to another host. The file only holds data (JSON), so loading it doesn't run code."""
+        path = path or self.path
+        try:
+            with open(path, 'rb') as f:
+                data = json.loads(f.read(), object_hook=_decode_value)
+        except (OSError, ValueError):
+            return set()
+        if not isinstance(data, dict) or data.get('version') != self.FILE_VERSION \
+                or data.get('host') != self.connection.host or not isinstance(data.get('records'), dict):
+            return set()
+        loaded = {name: table for name, table in data['records'].items() if name in self.records}
+        with self._lock:
+            self._replace(loaded)
+            self.token = data['token']
+        return set(loaded)
+
+    def _download(self, classes):
+        records = {cls.xenpath.lower(): self.connection.call(f'{cls.xenpath}.get_all_records') for cls in classes}
+        with self._lock:
+            self._replace(records)
+
+    def _replace(self, records: Dict[str, Dict[str, Dict[str, Any]]]):
+        self.records.update(records)
+        for name, table in records.items():
+            for index in self.indexes[name].values():
+                index.rebuild(table)
+
+    def apply(self, events):
+        """Apply a batch of events, as returned by event.from"""
+        with self._lock:
+            for event in events:
+                table = self.records.get(event['class'])
+                if table is None:
+                    continue
+                if event['operation'] == 'del':
+                    table.pop(event['ref'], None)
+                    snapshot = None
+                else:
+                    snapshot = table[event['ref']] = event['snapshot']
+                for index in self.indexes[event['class']].values():
+                    index.update(event['ref'], snapshot)
+
+    def index(self, cls: Union[str, type], field: str) -> 'XenIndex':
+        """Index of the cached objects of a class by the value of a field, created on first use"""
+        if not isinstance(cls, type):
+            cls = xenclass(cls)
+        name = cls.xenpath.lower()
+        if name not in self.records:
+            raise ValueError(f'Class {cls.xenpath} is not cached')
+        with self._lock:
+            index = self.indexes[name].get(field)
+            if index is None:
+                index = self.indexes[name][field] = XenIndex(self, cls, field)
+                index.rebuild(self.records[name])
+        return index
+
+    def __contains__(self, obj: XenObject):
+        return self.get_raw(obj) is not None
+
+    def get_raw(self, obj: XenObject) -> Optional[Dict[str, Any]]:
+        """Raw record of an object, or None if the object isn't cached"""
+        table = self.records.get(obj.xenpath.lower())
+        if table is None:
+            return None
+        return table.get(obj.ref)
+
+    def get_record(self, obj: XenObject):
+        """Record of an object, or None if the object isn't cached"""
+        raw = self.get_raw(obj)
+        if raw is None:
+            return None
+        return obj.Record(self.connection, raw)
+
+    def get_all_records(self, cls: Union[str, type]) -> Dict[XenObject, Any]:
+        """All cached records of a class, like Endpoint.get_all_records()"""
+        if not isinstance(cls, type):
+            cls = xenclass(cls)
+        table = self.records[cls.xenpath.lower()]
+        with self._lock:
+            items = list(table.items())
+        return {cls(self.connection, ref): cls.Record(self.connection, raw) for ref, raw in items}
+
+    def _run(self, stopped: threading.Event):
+        classes = list(self.records)
+        retry_delay = 1
+        lost = False
+        try:
+            while not stopped.is_set():
+                try:
+                    if lost:
+                        # The server dropped events for our token, start over
+                        self.synchronize()
+                        lost = False
+                    result = self.connection.call('event.from', classes, self.token, self.timeout)
+                except XenError as e:
+                    if e.error_code != 'EVENTS_LOST':
+                        raise
+                    lost = True
+                    continue
+                except NETWORK_ERRORS:
+                    # Network problem, try again from the same token (or synchronize again)
+                    time.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, 30)
+                    continue
+                retry_delay = 1
+                with self._lock:
+                    if stopped.is_set():
+                        return
+                    self.apply(result['events'])
+                    self.token = result['token']
+        except Exception as e:
+            # The records can't be kept up to date anymore, stop serving them
+            if not stopped.is_set():
+                self.error = e
+                stopped.set()
+
+
+def _encode_value(value):
+    # Raw values are JSON types, except for dates of XMLRPC connections
+    if isinstance(value, xmlrpc.client.DateTime):
+        return {'__DateTime__': value.value}
+    raise TypeError(f'Cannot save {type(value).__name__} in the cache file')
+
+
+def _decode_value(obj: dict):
+    if len(obj) == 1 and '__DateTime__' in obj:
+        return xmlrpc.client.DateTime(obj['__DateTime__'])
+    return obj
+
+
+class XenIndex:
+    """
+    Lookup of cached objects by the value of a field, kept up to date as events arrive
+
+    `index[value]` returns the list of objects with that value, in O(1). Objects with a list field (like tags)
+    are indexed under every item, objects with a map field (like other_config) under every key.
+    Values can be given as their python type or as the string the API sends for them, so index[host] and
+    index['OpaqueRef:...'] both work, as do index[4] and index['4'] for an int field.
+    """
+
+    def __init__(self, cache: XenCache, cls: type, field: str):
+        descriptor = getattr(cls.Record, field, None)
+        if not isinstance(descriptor, RecordField):
+            raise ValueError(f'{cls.__name__} has no field {field!r}')
+        self.cache = cache
+        self.cls = cls
+        self.field = field
+        self.key = descriptor.property.key
+        hint = typing.Any
+        if descriptor.property.type is not inspect.Signature.empty:
+            hint = resolve_typehint(descriptor.property.type, cls.__module__)
+        self._container = typing.get_origin(hint)
+        if self._container in (list, dict):
+            hint = typing.get_args(hint)[0]
+        self._convert = compile_converter(hint)
+        # The API sends references, enums, numbers and dates as strings (but booleans as booleans)
+        self._parse_strings = XenEndpoint.issubclass(hint, (XenObject, XenEnum, int, float, datetime.datetime)) \
+            and not XenEndpoint.issubclass(hint, bool)
+        self._refs: Dict[Any, Set[str]] = {}        # value -> refs of objects with that value
+        self._values: Dict[str, Tuple] = {}         # ref -> values the object is indexed under
+
+    def update(self, ref: str, raw: Optional[Dict[str, Any]]):
+        """Re-index an object after a change, or remove it when `raw` is None"""
+        for value in self._values.pop(ref, ()):
+            refs = self._refs[value]
+            refs.discard(ref)
+            if not refs:
+                del self._refs[value]
+        if raw is None or self.key not in raw:
+            return
+        connection = self.cache.connection
+        raw_value = raw[self.key]
+        if self._container in (list, dict):
+            values = tuple({self._convert(connection, item) for item in raw_value})
+        else:
+            values = (self._convert(connection, raw_value),)
+        self._values[ref] = values
+        for value in values:
+            self._refs.setdefault(value, set()).add(ref)
+
+    def rebuild(self, table: Dict[str, Dict[str, Any]]):
+        self._refs.clear()
+        self._values.clear()
+        for ref, raw in table.items():
+            self.update(ref, raw)
+
+    def __getitem__(self, value) -> List[XenObject]:
+        value = self._normalize(value)
+        with self.cache._lock:
+            refs = list(self._refs.get(value, ()))
+        return [self.cls(self.cache.connection, ref) for ref in refs]
+
+    def get(self, value, default=None):
+        return self[value] if value in self else default
+
+    def __contains__(self, value):
+        return self._normalize(value) in self._refs
+
+    def __iter__(self):
+        with self.cache._lock:
+            return iter(list(self._refs))
+
+    def keys(self):
+        return list(self)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def _normalize(self, value):
+        if isinstance(value, str) and self._parse_strings:
+            try:
+                return self._convert(self.cache.connection, value)
+            except ValueError:
+                pass
+        return value
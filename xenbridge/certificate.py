@@ -7,6 +7,7 @@ import datetime
 
 class Certificate(XenObject):
     xenpath='Certificate'
+    __slots__ = ()
 
     fingerprint: str = XenProperty(XenProperty.READONLY, "The certificate's fingerprint / hash")
     host: 'xenbridge.Host' = XenProperty(XenProperty.READONLY, 'The host where the certificate is installed')
@@ -15,17 +16,18 @@ class Certificate(XenObject):
     uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier/object reference')
 
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Certificate.Record':
         """Get a record containing the current state of the given Certificate."""
 
 
 class CertificateEndpoint(XenEndpoint):
     xenpath='Certificate'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.Certificate']:
         """Return a list of all the Certificates known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Certificate', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Certificate', 'xenbridge.Certificate.Record']:
         """Return a map of Certificate references to Certificate records for all
         Certificates known to the system."""
     @XenMethod
@@ -14,6 +14,7 @@ class ClusterOperation(XenEnum):
 
 class Cluster(XenObject):
     xenpath='Cluster'
+    __slots__ = ()
 
     allowed_operations: List[ClusterOperation] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
     cluster_config: Dict[str, str] = XenProperty(XenProperty.READONLY, 'Contains read-only settings for the cluster, such as timeouts and other options. It can only be set at cluster create time')
@@ -39,7 +40,7 @@ class Cluster(XenObject):
         """Returns the network used by the cluster for inter-host communication, i.e. the
         network shared by all cluster host PIFs"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Cluster.Record':
         """Get a record containing the current state of the given Cluster."""
     @XenMethod
     def pool_destroy(self) -> None:
@@ -60,6 +61,7 @@ class Cluster(XenObject):
 
 class ClusterEndpoint(XenEndpoint):
     xenpath='Cluster'
+    __slots__ = ()
     @XenMethod
     def create(self, PIF: 'xenbridge.PIF', cluster_stack: str, pool_auto_join: bool, token_timeout: float, token_timeout_coefficient: float) -> 'xenbridge.Cluster':
         """Creates a Cluster object and one Cluster_host object as its first member"""
@@ -67,7 +69,7 @@ class ClusterEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Cluster']:
         """Return a list of all the Clusters known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Cluster', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Cluster', 'xenbridge.Cluster.Record']:
         """Return a map of Cluster references to Cluster records for all Clusters known to
         the system."""
     @XenMethod
@@ -12,6 +12,7 @@ class ClusterHostOperation(XenEnum):
 
 class ClusterHost(XenObject):
     xenpath='Cluster_host'
+    __slots__ = ()
 
     PIF: 'xenbridge.PIF' = XenProperty(XenProperty.READONLY, 'Reference to the PIF object')
     allowed_operations: List[ClusterHostOperation] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
@@ -36,12 +37,13 @@ class ClusterHost(XenObject):
     def force_destroy(self) -> None:
         """Remove a host from an existing cluster forcefully."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.ClusterHost.Record':
         """Get a record containing the current state of the given Cluster_host."""
 
 
 class ClusterHostEndpoint(XenEndpoint):
     xenpath='Cluster_host'
+    __slots__ = ()
     @XenMethod
     def create(self, cluster: 'xenbridge.Cluster', host: 'xenbridge.Host', pif: 'xenbridge.PIF') -> 'xenbridge.ClusterHost':
         """Add a new host to an existing cluster."""
@@ -49,7 +51,7 @@ class ClusterHostEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.ClusterHost']:
         """Return a list of all the Cluster_hosts known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.ClusterHost', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.ClusterHost', 'xenbridge.ClusterHost.Record']:
         """Return a map of Cluster_host references to Cluster_host records for all
         Cluster_hosts known to the system."""
     @XenMethod
@@ -12,6 +12,7 @@ class ConsoleProtocol(XenEnum):
 
 class Console(XenObject):
     xenpath='console'
+    __slots__ = ()
 
     VM: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'VM to which this console is attached')
     location: str = XenProperty(XenProperty.READONLY, 'URI for the console service')
@@ -26,7 +27,7 @@ class Console(XenObject):
     def destroy(self) -> None:
         """Destroy the specified console instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Console.Record':
         """Get a record containing the current state of the given console."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -36,6 +37,7 @@ class Console(XenObject):
 
 class ConsoleEndpoint(XenEndpoint):
     xenpath='console'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.Console':
         """Create a new console instance, and return its handle. The constructor args are:
@@ -44,7 +46,7 @@ class ConsoleEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Console']:
         """Return a list of all the consoles known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Console', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Console', 'xenbridge.Console.Record']:
         """Return a map of console references to console records for all consoles known to
         the system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class Crashdump(XenObject):
     xenpath='crashdump'
+    __slots__ = ()
 
     VDI: 'xenbridge.VDI' = XenProperty(XenProperty.READONLY, 'the virtual disk')
     VM: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'the virtual machine')
@@ -20,7 +21,7 @@ class Crashdump(XenObject):
     def destroy(self) -> None:
         """Destroy the specified crashdump"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Crashdump.Record':
         """Get a record containing the current state of the given crashdump."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -30,11 +31,12 @@ class Crashdump(XenObject):
 
 class CrashdumpEndpoint(XenEndpoint):
     xenpath='crashdump'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.Crashdump']:
         """Return a list of all the crashdumps known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Crashdump', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Crashdump', 'xenbridge.Crashdump.Record']:
         """Return a map of crashdump references to crashdump records for all crashdumps
         known to the system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class DataSource(XenObject):
     xenpath='data_source'
+    __slots__ = ()
 
     enabled: bool = XenProperty(XenProperty.READONLY, 'true if the data source is being logged')
     max: float = XenProperty(XenProperty.READONLY, 'the maximum value of the data source')
@@ -20,4 +21,5 @@ class DataSource(XenObject):
 
 class DataSourceEndpoint(XenEndpoint):
     xenpath='data_source'
+    __slots__ = ()
     ...
@@ -7,6 +7,7 @@ import datetime
 
 class DRTask(XenObject):
     xenpath='DR_task'
+    __slots__ = ()
 
     introduced_SRs: List['xenbridge.SR'] = XenProperty(XenProperty.READONLY, 'All SRs introduced by this appliance')
     uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier/object reference')
@@ -16,12 +17,13 @@ class DRTask(XenObject):
         """Destroy the disaster recovery task, detaching and forgetting any SRs introduced
         which are no longer required"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.DRTask.Record':
         """Get a record containing the current state of the given DR_task."""
 
 
 class DRTaskEndpoint(XenEndpoint):
     xenpath='DR_task'
+    __slots__ = ()
     @XenMethod
     def create(self, type: str, device_config: Dict[str, str], whitelist: List[str]) -> 'xenbridge.DRTask':
         """Create a disaster recovery task which will query the supplied list of devices"""
@@ -29,7 +31,7 @@ class DRTaskEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.DRTask']:
         """Return a list of all the DR_tasks known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.DRTask', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.DRTask', 'xenbridge.DRTask.Record']:
         """Return a map of DR_task references to DR_task records for all DR_tasks known to
         the system."""
     @XenMethod
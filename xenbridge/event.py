@@ -12,6 +12,7 @@ class EventOperation(XenEnum):
 
 class Event(XenObject):
     xenpath='event'
+    __slots__ = ()
 
     class_: str = XenProperty(XenProperty.READONLY, 'The name of the class of the object that changed')
     id: int = XenProperty(XenProperty.READONLY, 'An ID, monotonically increasing, and local to the current session')
@@ -24,6 +25,7 @@ class Event(XenObject):
 
 class EventEndpoint(XenEndpoint):
     xenpath='event'
+    __slots__ = ()
     @XenMethod
     def from_(self, classes: List[str], token: str, timeout: float):
         """Blocking call which returns a new token and a (possibly empty) batch of events.
@@ -40,7 +42,7 @@ class EventEndpoint(XenEndpoint):
         and wait until the token returned by consecutive event.from calls is
         lexicographically greater than the one returned by event.inject."""
     @XenMethod
-    def next(self) -> List[Dict[str, Any]]:
+    def next(self) -> List['xenbridge.Event.Record']:
         """Blocking call which returns a (possibly empty) batch of events. This method is
         only recommended for legacy use. New development should use event.from which
         supercedes this method."""
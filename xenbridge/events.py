@@ -0,0 +1,316 @@
+import collections
+import http.client
+import queue
+import threading
+import time
+import xmlrpc.client
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from .xenobject import XenObject, XenError, xenclass
+
+# Errors after which event.from can be called again with the same token
+# (EOFError covers asyncio.IncompleteReadError, without importing asyncio)
+NETWORK_ERRORS = (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError, EOFError)
+
+
+def current_token(connection) -> str:
+    """Event token of the current moment, so event.from only returns changes from now on"""
+    # event.inject needs an object, there is always exactly one pool
+    pool_ref = connection.call('pool.get_all')[0]
+    return connection.call('event.inject', 'pool', pool_ref)
+
+
+async def current_token_async(connection) -> str:
+    pool_ref = (await connection.call('pool.get_all'))[0]
+    return await connection.call('event.inject', 'pool', pool_ref)
+
+
+class XenEvent:
+    """
+    Change of an object, as returned by event.from
+
+    `ref` is the object that changed, as its XenObject subclass, and `snapshot` its record after the change,
+    typed like the records of get_record(). Objects of classes that xenbridge doesn't know are given by their
+    reference string, with the snapshot as a dict.
+    """
+    __slots__ = ('id', 'class_', 'operation', 'ref', 'snapshot')
+
+    def __init__(self, connection, raw: Dict[str, Any]):
+        from .event import EventOperation      # Not imported with the package, see xenbridge.__getattr__
+        self.id = int(raw['id'])
+        self.class_: str = raw['class']
+        self.operation = EventOperation(raw['operation'])
+        snapshot = raw.get('snapshot')
+        try:
+            cls = xenclass(self.class_)
+        except ValueError:
+            self.ref = raw['ref']
+            self.snapshot = snapshot
+            return
+        self.ref: XenObject = cls(connection, raw['ref'])
+        self.snapshot = None if snapshot is None else cls.Record(connection, snapshot)
+
+    def __repr__(self):
+        return f'<XenEvent {self.operation.value} {self.ref!r}>'
+
+
+class XenEventStream:
+    """
+    Iterator over the changes of objects of a set of classes, following event.from
+
+    The stream starts at `token`: by default from the moment it is created (on asynchronous connections, from
+    the first iteration), or from the state of every object (as 'add' events) when the token is an empty string. After every batch, `token` is updated, so a stream can
+    be resumed later with `xen.events(classes, token=stream.token)`. Network errors are retried from the same
+    token; XenErrors are raised, EVENTS_LOST means the server has dropped the events since the token.
+
+    On asynchronous connections, the stream is iterated with `async for`.
+    """
+
+    def __init__(self, connection, classes: Iterable[str] = ('*',), token: Optional[str] = None,
+                 timeout: float = 30.0):
+        self.connection = connection
+        self.classes = [cls.lower() for cls in classes]
+        self.token = token
+        self.timeout = timeout
+        self._events = collections.deque()
+        if token is None and not connection.asynchronous:
+            self.token = current_token(connection)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> XenEvent:
+        retry_delay = 1
+        while not self._events:
+            try:
+                if self.token is None:
+                    self.token = current_token(self.connection)
+                result = self.connection.call('event.from', self.classes, self.token, self.timeout)
+            except NETWORK_ERRORS:
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30)
+                continue
+            retry_delay = 1
+            self._receive(result)
+        return self._events.popleft()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> XenEvent:
+        import asyncio
+        retry_delay = 1
+        while not self._events:
+            try:
+                if self.token is None:
+                    self.token = await current_token_async(self.connection)
+                result = await self.connection.call('event.from', self.classes, self.token, self.timeout)
+            except NETWORK_ERRORS:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30)
+                continue
+            retry_delay = 1
+            self._receive(result)
+        return self._events.popleft()
+
+    def _receive(self, result: Dict[str, Any]):
+        self._events.extend(XenEvent(self.connection, event) for event in result['events'])
+        self.token = result['token']
+
+
+class EventPump:
+    """
+    Single event.from loop for a connection, fanning the events out to any number of subscribers
+
+    The pump follows the union of the classes of its subscriptions, so the load on the server doesn't depend on
+    the number of subscribers. It runs in a background thread while there are subscriptions. Events are put in
+    a bounded queue per subscription; when a subscriber falls behind, its oldest events are dropped and counted.
+    """
+
+    def __init__(self, connection, timeout: float = 30.0):
+        self.connection = connection
+        self.timeout = timeout
+        self.token: Optional[str] = None
+        self.events_lost = 0        # Number of times the server dropped events (EVENTS_LOST)
+        self.error: Optional[BaseException] = None
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, classes: Iterable[str] = ('*',), predicate: Callable[[XenEvent], bool] = None,
+                  maxsize: int = 1000) -> 'Subscription':
+        """Receive the events of objects of `classes` (like ['vm', 'host'], or '*' for all) for which
+        `predicate(event)` is true, from now on. At most `maxsize` events are queued."""
+        subscription = Subscription(self, classes, predicate, maxsize)
+        with self._lock:
+            new_classes = not subscription.classes <= self._classes()
+            start = self._thread is None
+            if start:
+                # Before the subscription is added, so it isn't left behind when this fails
+                self.error = None
+                self.token = current_token(self.connection)
+                self._thread = threading.Thread(target=self._run, name='XenEventPump', daemon=True)
+            self._subscriptions.append(subscription)
+        if start:
+            self._thread.start()
+        elif new_classes:
+            self._wake()
+        return subscription
+
+    def stop(self):
+        """Close all subscriptions, the background thread exits when its current event.from call returns"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.close()
+
+    def _unsubscribe(self, subscription: 'Subscription'):
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            classes = self._classes()
+            self._subscriptions.remove(subscription)
+            # Waking the pump costs two calls and an event on the pool, only do it when it follows other classes
+            changed = self._classes() != classes
+        if changed:
+            self._wake()
+
+    def _classes(self) -> frozenset:
+        classes = frozenset().union(*(subscription.classes for subscription in self._subscriptions))
+        return frozenset('*') if '*' in classes else classes
+
+    def _wake(self):
+        # The pump always follows the pool, an event on it makes the running event.from return,
+        # so the next call picks up the new set of classes
+        try:
+            current_token(self.connection)
+        except (XenError, *NETWORK_ERRORS):
+            pass        # The change is picked up when the current call times out
+
+    def _run(self):
+        try:
+            self._follow()
+        except Exception as e:
+            self._fail(e)
+
+    def _follow(self):
+        retry_delay = 1
+        lost = False
+        while True:
+            with self._lock:
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+                classes = self._classes()
+            classes = ['*'] if '*' in classes else sorted(classes | {'pool'})
+            try:
+                if lost:
+                    self.token = current_token(self.connection)
+                    lost = False
+                result = self.connection.call('event.from', classes, self.token, self.timeout)
+            except XenError as e:
+                if e.error_code != 'EVENTS_LOST':
+                    raise
+                self.events_lost += 1
+                lost = True
+                continue
+            except NETWORK_ERRORS:
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30)
+                continue
+            retry_delay = 1
+            self.token = result['token']
+            events = [XenEvent(self.connection, raw) for raw in result['events']]
+            with self._lock:
+                subscriptions = list(self._subscriptions)
+            for event in events:
+                for subscription in subscriptions:
+                    subscription._offer(event)
+
+    def _fail(self, error: BaseException):
+        with self._lock:
+            self.error = error
+            subscriptions, self._subscriptions = self._subscriptions, []
+            self._thread = None
+        for subscription in subscriptions:
+            subscription._fail(error)
+
+
+class Subscription:
+    """
+    Events of an EventPump for one subscriber, iterate over it or call `get()`
+
+    `received` counts the events that were queued, `dropped` the events that were discarded because the queue
+    was full. Closing the subscription (or leaving its `with` block) ends the iteration.
+    """
+
+    def __init__(self, pump: EventPump, classes: Iterable[str], predicate: Optional[Callable[[XenEvent], bool]],
+                 maxsize: int):
+        if maxsize < 1:
+            raise ValueError('maxsize should be at least 1')
+        self.pump = pump
+        self.classes = frozenset(cls.lower() for cls in classes)
+        self.predicate = predicate
+        self.maxsize = maxsize
+        self.received = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue = collections.deque()
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+    def get(self, timeout: float = None) -> XenEvent:
+        """Next event, waiting at most `timeout` seconds (raises queue.Empty).
+        Raises StopIteration once the subscription is closed, and the error of the pump if it failed."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._queue or self.closed, timeout):
+                raise queue.Empty
+            if self._queue:
+                return self._queue.popleft()
+            if self._error is not None:
+                raise self._error
+            raise StopIteration
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> XenEvent:
+        return self.get()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        self.pump._unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _offer(self, event: XenEvent):
+        # Called from the pump's thread
+        if '*' not in self.classes and event.class_ not in self.classes:
+            return
+        try:
+            if self.predicate is not None and not self.predicate(event):
+                return
+        except Exception as e:
+            self._fail(e)
+            self.pump._unsubscribe(self)
+            return
+        with self._condition:
+            if self.closed:
+                return
+            if len(self._queue) >= self.maxsize:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(event)
+            self.received += 1
+            self._condition.notify()
+
+    def _fail(self, error: BaseException):
+        with self._condition:
+            self._error = error
+            self.closed = True
+            self._condition.notify_all()
@@ -7,6 +7,7 @@ import datetime
 
 class Feature(XenObject):
     xenpath='Feature'
+    __slots__ = ()
 
     enabled: bool = XenProperty(XenProperty.READONLY, 'Indicates whether the feature is enabled')
     experimental: bool = XenProperty(XenProperty.READONLY, 'Indicates whether the feature is experimental (as opposed to stable and fully supported)')
@@ -17,17 +18,18 @@ class Feature(XenObject):
     version: str = XenProperty(XenProperty.READONLY, 'The version of this feature')
 
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Feature.Record':
         """Get a record containing the current state of the given Feature."""
 
 
 class FeatureEndpoint(XenEndpoint):
     xenpath='Feature'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.Feature']:
         """Return a list of all the Features known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Feature', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Feature', 'xenbridge.Feature.Record']:
         """Return a map of Feature references to Feature records for all Features known to
         the system."""
     @XenMethod
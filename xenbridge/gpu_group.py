@@ -11,6 +11,7 @@ class AllocationAlgorithm(XenEnum):
 
 class GPUGroup(XenObject):
     xenpath='GPU_group'
+    __slots__ = ()
 
     GPU_types: List[str] = XenProperty(XenProperty.READONLY, 'List of GPU types (vendor+device ID) that can be in this group')
     PGPUs: List['xenbridge.PGPU'] = XenProperty(XenProperty.READONLY, 'List of pGPUs in the group')
@@ -30,7 +31,7 @@ class GPUGroup(XenObject):
     def destroy(self) -> None:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.GPUGroup.Record':
         """Get a record containing the current state of the given GPU_group."""
     @XenMethod
     def get_remaining_capacity(self, vgpu_type: 'xenbridge.VGPUType') -> int:
@@ -43,6 +44,7 @@ class GPUGroup(XenObject):
 
 class GPUGroupEndpoint(XenEndpoint):
     xenpath='GPU_group'
+    __slots__ = ()
     @XenMethod
     def create(self, name_label: str, name_description: str, other_config: Dict[str, str]) -> 'xenbridge.GPUGroup':
         ...
@@ -50,7 +52,7 @@ class GPUGroupEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.GPUGroup']:
         """Return a list of all the GPU_groups known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.GPUGroup', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.GPUGroup', 'xenbridge.GPUGroup.Record']:
         """Return a map of GPU_group references to GPU_group records for all GPU_groups
         known to the system."""
     @XenMethod
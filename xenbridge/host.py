@@ -22,11 +22,12 @@ class HostDisplay(XenEnum):
 
 class Host(XenObject):
     xenpath='host'
+    __slots__ = ()
 
-    API_version_major: int = XenProperty(XenProperty.READONLY, 'major version number')
-    API_version_minor: int = XenProperty(XenProperty.READONLY, 'minor version number')
-    API_version_vendor: str = XenProperty(XenProperty.READONLY, 'identification of vendor')
-    API_version_vendor_implementation: Dict[str, str] = XenProperty(XenProperty.READONLY, 'details of vendor implementation')
+    API_version_major: int = XenProperty(XenProperty.READONLY, 'major version number', column='API_version__major')
+    API_version_minor: int = XenProperty(XenProperty.READONLY, 'minor version number', column='API_version__minor')
+    API_version_vendor: str = XenProperty(XenProperty.READONLY, 'identification of vendor', column='API_version__vendor')
+    API_version_vendor_implementation: Dict[str, str] = XenProperty(XenProperty.READONLY, 'details of vendor implementation', column='API_version__vendor_implementation')
     PBDs: List['xenbridge.PBD'] = XenProperty(XenProperty.READONLY, 'physical blockdevices')
     PCIs: List['xenbridge.PCI'] = XenProperty(XenProperty.READONLY, 'List of PCI devices in the host')
     PGPUs: List['xenbridge.PGPU'] = XenProperty(XenProperty.READONLY, 'List of physical GPUs in the host')
@@ -63,7 +64,7 @@ class Host(XenObject):
     license_server: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'Contact information of the license server')
     local_cache_sr: 'xenbridge.SR' = XenProperty(XenProperty.READONLY, 'The SR that is used as a local cache')
     logging: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'logging configuration')
-    memory_overhead: int = XenProperty(XenProperty.READONLY, 'Virtualization memory overhead (bytes).')
+    memory_overhead: int = XenProperty(XenProperty.READONLY, 'Virtualization memory overhead (bytes).', column='memory__overhead')
     metrics: 'xenbridge.HostMetrics' = XenProperty(XenProperty.READONLY, 'metrics associated with this host')
     multipathing: bool = XenProperty(XenProperty.READONLY, 'Specifies whether multipathing is enabled')
     name_description: str = XenProperty(XenProperty.READWRITE, 'a notes field containing human-readable description')
@@ -176,7 +177,7 @@ class Host(XenObject):
     def forget_data_source_archives(self, data_source: str) -> None:
         """Forget the recorded statistics related to the specified data source"""
     @XenMethod
-    def get_data_sources(self) -> List[Dict[str, Any]]:
+    def get_data_sources(self) -> List['xenbridge.DataSource.Record']:
         ...
     @XenMethod
     def get_log(self) -> str:
@@ -185,7 +186,7 @@ class Host(XenObject):
     def get_management_interface(self) -> 'xenbridge.PIF':
         """Returns the management interface for the specified host"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Host.Record':
         """Get a record containing the current state of the given host."""
     @XenMethod
     def get_server_certificate(self) -> str:
@@ -304,6 +305,7 @@ class Host(XenObject):
 
 class HostEndpoint(XenEndpoint):
     xenpath='host'
+    __slots__ = ()
     @XenMethod
     def emergency_ha_disable(self, soft: bool) -> None:
         """This call disables HA on the local host. This should only be used with extreme
@@ -316,7 +318,7 @@ class HostEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Host']:
         """Return a list of all the hosts known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Host', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Host', 'xenbridge.Host.Record']:
         """Return a map of host references to host records for all hosts known to the
         system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class HostCpu(XenObject):
     xenpath='host_cpu'
+    __slots__ = ()
 
     family: int = XenProperty(XenProperty.READONLY, 'the family (number) of the physical CPU')
     features: str = XenProperty(XenProperty.READONLY, 'the physical CPU feature bitmap')
@@ -26,7 +27,7 @@ class HostCpu(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given host_cpu."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.HostCpu.Record':
         """Get a record containing the current state of the given host_cpu."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -36,11 +37,12 @@ class HostCpu(XenObject):
 
 class HostCpuEndpoint(XenEndpoint):
     xenpath='host_cpu'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.HostCpu']:
         """Return a list of all the host_cpus known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.HostCpu', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.HostCpu', 'xenbridge.HostCpu.Record']:
         """Return a map of host_cpu references to host_cpu records for all host_cpus known
         to the system."""
     @XenMethod
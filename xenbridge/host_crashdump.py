@@ -7,6 +7,7 @@ import datetime
 
 class HostCrashdump(XenObject):
     xenpath='host_crashdump'
+    __slots__ = ()
 
     host: 'xenbridge.Host' = XenProperty(XenProperty.READONLY, 'Host the crashdump relates to')
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'additional configuration')
@@ -22,7 +23,7 @@ class HostCrashdump(XenObject):
     def destroy(self) -> None:
         """Destroy specified host crash dump, removing it from the disk."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.HostCrashdump.Record':
         """Get a record containing the current state of the given host_crashdump."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -35,11 +36,12 @@ class HostCrashdump(XenObject):
 
 class HostCrashdumpEndpoint(XenEndpoint):
     xenpath='host_crashdump'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.HostCrashdump']:
         """Return a list of all the host_crashdumps known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.HostCrashdump', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.HostCrashdump', 'xenbridge.HostCrashdump.Record']:
         """Return a map of host_crashdump references to host_crashdump records for all
         host_crashdumps known to the system."""
     @XenMethod
@@ -7,11 +7,12 @@ import datetime
 
 class HostMetrics(XenObject):
     xenpath='host_metrics'
+    __slots__ = ()
 
     last_updated: datetime.datetime = XenProperty(XenProperty.READONLY, 'Time at which this information was last updated')
     live: bool = XenProperty(XenProperty.READONLY, 'Pool master thinks this host is live')
-    memory_free: int = XenProperty(XenProperty.READONLY, 'Free host memory (bytes)')
-    memory_total: int = XenProperty(XenProperty.READONLY, 'Total host memory (bytes)')
+    memory_free: int = XenProperty(XenProperty.READONLY, 'Free host memory (bytes)', column='memory__free')
+    memory_total: int = XenProperty(XenProperty.READONLY, 'Total host memory (bytes)', column='memory__total')
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'additional configuration')
     uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier/object reference')
 
@@ -20,7 +21,7 @@ class HostMetrics(XenObject):
         """Add the given key-value pair to the other_config field of the given
         host_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.HostMetrics.Record':
         """Get a record containing the current state of the given host_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -30,11 +31,12 @@ class HostMetrics(XenObject):
 
 class HostMetricsEndpoint(XenEndpoint):
     xenpath='host_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.HostMetrics']:
         """Return a list of all the host_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.HostMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.HostMetrics', 'xenbridge.HostMetrics.Record']:
         """Return a map of host_metrics references to host_metrics records for all
         host_metrics instances known to the system."""
     @XenMethod
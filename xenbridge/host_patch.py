@@ -7,6 +7,7 @@ import datetime
 
 class HostPatch(XenObject):
     xenpath='host_patch'
+    __slots__ = ()
 
     applied: bool = XenProperty(XenProperty.READONLY, 'True if the patch has been applied')
     host: 'xenbridge.Host' = XenProperty(XenProperty.READONLY, 'Host the patch relates to')
@@ -30,7 +31,7 @@ class HostPatch(XenObject):
         """Destroy the specified host patch, removing it from the disk. This does NOT
         reverse the patch"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.HostPatch.Record':
         """Get a record containing the current state of the given host_patch."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -40,11 +41,12 @@ class HostPatch(XenObject):
 
 class HostPatchEndpoint(XenEndpoint):
     xenpath='host_patch'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.HostPatch']:
         """Return a list of all the host_patchs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.HostPatch', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.HostPatch', 'xenbridge.HostPatch.Record']:
         """Return a map of host_patch references to host_patch records for all host_patchs
         known to the system."""
     @XenMethod
@@ -0,0 +1,67 @@
+import datetime
+import itertools
+import json
+import urllib.parse
+import xmlrpc.client
+from typing import Any, Dict
+
+
+def dumps(method: str, params: tuple, request_id: int) -> bytes:
+    """Encode a JSON-RPC 2.0 request"""
+    return json.dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': request_id},
+                      default=_default).encode('utf-8')
+
+
+def _default(obj):
+    if isinstance(obj, xmlrpc.client.DateTime):
+        return obj.value
+    if isinstance(obj, datetime.datetime):
+        # Dates are in UTC in the API, naive datetimes are taken to be UTC already
+        if obj.tzinfo is not None:
+            obj = obj.astimezone(datetime.timezone.utc)
+        return obj.strftime('%Y%m%dT%H:%M:%SZ')
+    raise TypeError(f'Object of type {obj.__class__.__name__} can\'t be sent over JSON-RPC')
+
+
+def loads(body: bytes) -> Dict[str, Any]:
+    """Decode a JSON-RPC response into the {'Status': ..., 'Value'/'ErrorDescription': ...} envelope of XMLRPC,
+    so errors are reported the same way for both protocols"""
+    response = json.loads(body)
+    error = response.get('error')
+    if error is None:
+        return {'Status': 'Success', 'Value': response.get('result')}
+    description = [str(error.get('message'))] + [str(arg) for arg in error.get('data') or ()]
+    return {'Status': 'Failure', 'ErrorDescription': description}
+
+
+class JsonRpcProxy:
+    """
+    Stand-in for xmlrpc.client.ServerProxy that makes calls over JSON-RPC, at the /jsonrpc path of the server
+
+    The transport is a PooledTransport (or any transport with the same `request()` method) that returns the
+    raw response body, like JsonRpcTransport.
+    """
+
+    def __init__(self, uri: str, transport):
+        parts = urllib.parse.urlsplit(uri)
+        self._host = parts.netloc
+        self._handler = parts.path.rstrip('/') + '/jsonrpc'
+        self._transport = transport
+        self._ids = itertools.count()
+
+    def __getattr__(self, method: str):
+        if method.startswith('__'):
+            raise AttributeError(method)
+        return lambda *params: self._request(method, params)
+
+    def __call__(self, attr: str):
+        # Same as ServerProxy, gives access to the transport and its close() method
+        if attr == 'close':
+            return self._transport.close
+        if attr == 'transport':
+            return self._transport
+        raise AttributeError(f'Attribute {attr!r} not found')
+
+    def _request(self, method: str, params: tuple):
+        body = self._transport.request(self._host, self._handler, dumps(method, params, next(self._ids)))
+        return loads(body)
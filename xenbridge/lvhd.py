@@ -7,16 +7,18 @@ import datetime
 
 class LVHD(XenObject):
     xenpath='LVHD'
+    __slots__ = ()
 
     uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier/object reference')
 
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.LVHD.Record':
         """Get a record containing the current state of the given LVHD."""
 
 
 class LVHDEndpoint(XenEndpoint):
     xenpath='LVHD'
+    __slots__ = ()
     @XenMethod
     def enable_thin_provisioning(self, host: 'xenbridge.Host', SR: 'xenbridge.SR', initial_allocation: int, allocation_quantum: int) -> str:
         """Upgrades an LVHD SR to enable thin-provisioning. Future VDIs created in this SR
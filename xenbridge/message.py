@@ -17,6 +17,7 @@ class Cls(XenEnum):
 
 class Message(XenObject):
     xenpath='message'
+    __slots__ = ()
 
     body: str = XenProperty(XenProperty.READONLY, 'The body of the message')
     cls: Cls = XenProperty(XenProperty.READONLY, 'The class of the object this message is associated with')
@@ -30,30 +31,31 @@ class Message(XenObject):
     def destroy(self) -> None:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Message.Record':
         ...
 
 
 class MessageEndpoint(XenEndpoint):
     xenpath='message'
+    __slots__ = ()
     @XenMethod
     def create(self, name: str, priority: int, cls: Cls, obj_uuid: str, body: str) -> 'xenbridge.Message':
         ...
     @XenMethod
-    def get(self, cls: Cls, obj_uuid: str, since: datetime.datetime) -> Dict['xenbridge.Message', Dict[str, Any]]:
+    def get(self, cls: Cls, obj_uuid: str, since: datetime.datetime) -> Dict['xenbridge.Message', 'xenbridge.Message.Record']:
         ...
     @XenMethod
     def get_all(self) -> List['xenbridge.Message']:
         ...
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Message', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Message', 'xenbridge.Message.Record']:
         ...
     @XenMethod
-    def get_all_records_where(self, expr: str) -> Dict['xenbridge.Message', Dict[str, Any]]:
+    def get_all_records_where(self, expr: str) -> Dict['xenbridge.Message', 'xenbridge.Message.Record']:
         ...
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.Message':
         ...
     @XenMethod
-    def get_since(self, since: datetime.datetime) -> Dict['xenbridge.Message', Dict[str, Any]]:
+    def get_since(self, since: datetime.datetime) -> Dict['xenbridge.Message', 'xenbridge.Message.Record']:
         ...
@@ -16,6 +16,7 @@ class NetworkPurpose(XenEnum):
 
 class Network(XenObject):
     xenpath='network'
+    __slots__ = ()
 
     MTU: int = XenProperty(XenProperty.READWRITE, 'MTU in octets')
     PIFs: List['xenbridge.PIF'] = XenProperty(XenProperty.READONLY, 'list of connected pifs')
@@ -52,7 +53,7 @@ class Network(XenObject):
     def destroy(self) -> None:
         """Destroy the specified network instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Network.Record':
         """Get a record containing the current state of the given network."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -69,6 +70,7 @@ class Network(XenObject):
 
 class NetworkEndpoint(XenEndpoint):
     xenpath='network'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.Network':
         """Create a new network instance, and return its handle. The constructor args are:
@@ -78,7 +80,7 @@ class NetworkEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Network']:
         """Return a list of all the networks known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Network', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Network', 'xenbridge.Network.Record']:
         """Return a map of network references to network records for all networks known to
         the system."""
     @XenMethod
@@ -13,6 +13,7 @@ class SriovConfigurationMode(XenEnum):
 
 class NetworkSriov(XenObject):
     xenpath='network_sriov'
+    __slots__ = ()
 
     configuration_mode: SriovConfigurationMode = XenProperty(XenProperty.READONLY, 'The mode for configure network sriov')
     logical_PIF: 'xenbridge.PIF' = XenProperty(XenProperty.READONLY, 'The logical PIF to connect to the SR-IOV network after enable SR-IOV on the physical PIF')
@@ -25,7 +26,7 @@ class NetworkSriov(XenObject):
         """Disable SR-IOV on the specific PIF. It will destroy the network-sriov and the
         logical PIF accordingly."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.NetworkSriov.Record':
         """Get a record containing the current state of the given network_sriov."""
     @XenMethod
     def get_remaining_capacity(self) -> int:
@@ -34,6 +35,7 @@ class NetworkSriov(XenObject):
 
 class NetworkSriovEndpoint(XenEndpoint):
     xenpath='network_sriov'
+    __slots__ = ()
     @XenMethod
     def create(self, pif: 'xenbridge.PIF', network: 'xenbridge.Network') -> 'xenbridge.NetworkSriov':
         """Enable SR-IOV on the specific PIF. It will create a network-sriov based on the
@@ -43,7 +45,7 @@ class NetworkSriovEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.NetworkSriov']:
         """Return a list of all the network_sriovs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.NetworkSriov', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.NetworkSriov', 'xenbridge.NetworkSriov.Record']:
         """Return a map of network_sriov references to network_sriov records for all
         network_sriovs known to the system."""
     @XenMethod
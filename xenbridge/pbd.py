@@ -7,6 +7,7 @@ import datetime
 
 class PBD(XenObject):
     xenpath='PBD'
+    __slots__ = ()
 
     SR: 'xenbridge.SR' = XenProperty(XenProperty.READONLY, 'the storage repository that the pbd realises')
     currently_attached: bool = XenProperty(XenProperty.READONLY, 'When the currently_attached field is true, it means that the host has\nsuccessfully authenticated and mounted the remote storage device. In\nthe case of NFS this would typically mean the filesystem has been mounted;\nin the case of iSCSI this would typically mean that a connection to the\ntarget has been established.\nIf the connection to the storage fails (for example: if the network goes\ndown or a storage target fails), the host will keep trying to re-establish\nthe connection and the currently_attached field will remain true.\nThis implies that the currently_attached=true does not mean that the\nstorage is working well, or at all, simply that the host is trying to make\nit work.')
@@ -22,7 +23,7 @@ class PBD(XenObject):
     def destroy(self) -> None:
         """Destroy the specified PBD instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PBD.Record':
         """Get a record containing the current state of the given PBD."""
     @XenMethod
     def plug(self) -> None:
@@ -39,6 +40,7 @@ class PBD(XenObject):
 
 class PBDEndpoint(XenEndpoint):
     xenpath='PBD'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.PBD':
         """Create a new PBD instance, and return its handle. The constructor args are:
@@ -47,7 +49,7 @@ class PBDEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.PBD']:
         """Return a list of all the PBDs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PBD', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PBD', 'xenbridge.PBD.Record']:
         """Return a map of PBD references to PBD records for all PBDs known to the system."""
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.PBD':
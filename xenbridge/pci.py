@@ -7,6 +7,7 @@ import datetime
 
 class PCI(XenObject):
     xenpath='PCI'
+    __slots__ = ()
 
     class_name: str = XenProperty(XenProperty.READONLY, 'PCI class name')
     dependencies: List['xenbridge.PCI'] = XenProperty(XenProperty.READONLY, 'List of dependent PCI devices')
@@ -24,7 +25,7 @@ class PCI(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given PCI."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PCI.Record':
         """Get a record containing the current state of the given PCI."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -34,11 +35,12 @@ class PCI(XenObject):
 
 class PCIEndpoint(XenEndpoint):
     xenpath='PCI'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PCI']:
         """Return a list of all the PCIs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PCI', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PCI', 'xenbridge.PCI.Record']:
         """Return a map of PCI references to PCI records for all PCIs known to the system."""
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.PCI':
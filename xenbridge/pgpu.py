@@ -13,6 +13,7 @@ class PgpuDom0Access(XenEnum):
 
 class PGPU(XenObject):
     xenpath='PGPU'
+    __slots__ = ()
 
     GPU_group: 'xenbridge.GPUGroup' = XenProperty(XenProperty.READONLY, 'GPU group the pGPU is contained in')
     PCI: 'xenbridge.PCI' = XenProperty(XenProperty.READONLY, 'Link to underlying PCI device')
@@ -40,7 +41,7 @@ class PGPU(XenObject):
     def enable_dom0_access(self) -> PgpuDom0Access:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PGPU.Record':
         """Get a record containing the current state of the given PGPU."""
     @XenMethod
     def get_remaining_capacity(self, vgpu_type: 'xenbridge.VGPUType') -> int:
@@ -56,11 +57,12 @@ class PGPU(XenObject):
 
 class PGPUEndpoint(XenEndpoint):
     xenpath='PGPU'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PGPU']:
         """Return a list of all the PGPUs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PGPU', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PGPU', 'xenbridge.PGPU.Record']:
         """Return a map of PGPU references to PGPU records for all PGPUs known to the
         system."""
     @XenMethod
@@ -24,6 +24,7 @@ class PrimaryAddressType(XenEnum):
 
 class PIF(XenObject):
     xenpath='PIF'
+    __slots__ = ()
 
     DNS: str = XenProperty(XenProperty.READONLY, 'Comma separated list of the IP addresses of the DNS servers to use')
     IP: str = XenProperty(XenProperty.READONLY, 'IP address')
@@ -75,7 +76,7 @@ class PIF(XenObject):
     def forget(self) -> None:
         """Destroy the PIF object matching a particular network interface"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PIF.Record':
         """Get a record containing the current state of the given PIF."""
     @XenMethod
     def plug(self) -> None:
@@ -100,6 +101,7 @@ class PIF(XenObject):
 
 class PIFEndpoint(XenEndpoint):
     xenpath='PIF'
+    __slots__ = ()
     @XenMethod
     def create_VLAN(self, device: str, network: 'xenbridge.Network', host: 'xenbridge.Host', VLAN: int) -> 'xenbridge.PIF':
         """Create a VLAN interface from an existing physical interface. This call is
@@ -111,7 +113,7 @@ class PIFEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.PIF']:
         """Return a list of all the PIFs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PIF', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PIF', 'xenbridge.PIF.Record']:
         """Return a map of PIF references to PIF records for all PIFs known to the system."""
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.PIF':
@@ -7,6 +7,7 @@ import datetime
 
 class PIFMetrics(XenObject):
     xenpath='PIF_metrics'
+    __slots__ = ()
 
     carrier: bool = XenProperty(XenProperty.READONLY, 'Report if the PIF got a carrier or not')
     device_id: str = XenProperty(XenProperty.READONLY, 'Report device ID')
@@ -26,7 +27,7 @@ class PIFMetrics(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given PIF_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PIFMetrics.Record':
         """Get a record containing the current state of the given PIF_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -36,11 +37,12 @@ class PIFMetrics(XenObject):
 
 class PIFMetricsEndpoint(XenEndpoint):
     xenpath='PIF_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PIFMetrics']:
         """Return a list of all the PIF_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PIFMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PIFMetrics', 'xenbridge.PIFMetrics.Record']:
         """Return a map of PIF_metrics references to PIF_metrics records for all
         PIF_metrics instances known to the system."""
     @XenMethod
@@ -12,6 +12,7 @@ class PoolAllowedOperations(XenEnum):
 
 class Pool(XenObject):
     xenpath='pool'
+    __slots__ = ()
 
     allowed_operations: List[PoolAllowedOperations] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
     blobs: Dict[str, 'xenbridge.Blob'] = XenProperty(XenProperty.READONLY, 'Binary blobs associated with this pool')
@@ -102,7 +103,7 @@ class Pool(XenObject):
     def get_license_state(self) -> Dict[str, str]:
         """This call returns the license state for the pool"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Pool.Record':
         """Get a record containing the current state of the given pool."""
     @XenMethod
     def has_extension(self, name: str) -> bool:
@@ -133,6 +134,7 @@ class Pool(XenObject):
 
 class PoolEndpoint(XenEndpoint):
     xenpath='pool'
+    __slots__ = ()
     @XenMethod
     def certificate_install(self, name: str, cert: str) -> None:
         """Install a TLS CA certificate, pool-wide."""
@@ -192,7 +194,7 @@ class PoolEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Pool']:
         """Return a list of all the pools known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Pool', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Pool', 'xenbridge.Pool.Record']:
         """Return a map of pool references to pool records for all pools known to the
         system."""
     @XenMethod
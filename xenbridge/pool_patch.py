@@ -13,6 +13,7 @@ class AfterApplyGuidance(XenEnum):
 
 class PoolPatch(XenObject):
     xenpath='pool_patch'
+    __slots__ = ()
 
     after_apply_guidance: List[AfterApplyGuidance] = XenProperty(XenProperty.READONLY, 'What the client should do after this patch has been applied.')
     host_patches: List['xenbridge.HostPatch'] = XenProperty(XenProperty.READONLY, 'This hosts this patch is applied to.')
@@ -42,7 +43,7 @@ class PoolPatch(XenObject):
         """Removes the patch's files from all hosts in the pool, and removes the database
         entries.  Only works on unapplied patches."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PoolPatch.Record':
         """Get a record containing the current state of the given pool_patch."""
     @XenMethod
     def pool_apply(self) -> None:
@@ -63,11 +64,12 @@ class PoolPatch(XenObject):
 
 class PoolPatchEndpoint(XenEndpoint):
     xenpath='pool_patch'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PoolPatch']:
         """Return a list of all the pool_patchs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PoolPatch', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PoolPatch', 'xenbridge.PoolPatch.Record']:
         """Return a map of pool_patch references to pool_patch records for all pool_patchs
         known to the system."""
     @XenMethod
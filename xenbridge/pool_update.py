@@ -17,6 +17,7 @@ class LivepatchStatus(XenEnum):
 
 class PoolUpdate(XenObject):
     xenpath='pool_update'
+    __slots__ = ()
 
     after_apply_guidance: List[UpdateAfterApplyGuidance] = XenProperty(XenProperty.READONLY, 'What the client should do after this update has been applied.')
     enforce_homogeneity: bool = XenProperty(XenProperty.READONLY, 'Flag - if true, all hosts in a pool must apply this update')
@@ -40,7 +41,7 @@ class PoolUpdate(XenObject):
     def destroy(self) -> None:
         """Removes the database entry. Only works on unapplied update."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PoolUpdate.Record':
         """Get a record containing the current state of the given pool_update."""
     @XenMethod
     def pool_apply(self) -> None:
@@ -60,11 +61,12 @@ class PoolUpdate(XenObject):
 
 class PoolUpdateEndpoint(XenEndpoint):
     xenpath='pool_update'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PoolUpdate']:
         """Return a list of all the pool_updates known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PoolUpdate', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PoolUpdate', 'xenbridge.PoolUpdate.Record']:
         """Return a map of pool_update references to pool_update records for all
         pool_updates known to the system."""
     @XenMethod
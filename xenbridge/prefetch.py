@@ -0,0 +1,111 @@
+import inspect
+import typing
+import weakref
+from typing import Dict, List, Tuple
+from .xenobject import XenEndpoint, XenObject, RecordField, resolve_typehint
+
+
+def prefetch(connection, cls: type, paths: Tuple[str, ...]):
+    """
+    Load the records of `cls` and of the objects reachable through `paths`, for `Endpoint.prefetch()`
+
+    Every class on a path is fetched once with get_all_records, after which the references are joined locally.
+    Returns a Prefetched {object: record} for `cls`, or a coroutine of it on asynchronous connections.
+    """
+    classes, links = plan(cls, paths)
+    if connection.asynchronous:
+        return _prefetch_async(connection, cls, classes, links)
+    tables = {klass: connection.call(f'{klass.xenpath}.get_all_records') for klass in classes}
+    return attach(connection, cls, tables, links)
+
+
+async def _prefetch_async(connection, cls, classes, links):
+    import asyncio
+    results = await asyncio.gather(*[connection.call(f'{klass.xenpath}.get_all_records') for klass in classes])
+    return attach(connection, cls, dict(zip(classes, results)), links)
+
+
+def plan(cls: type, paths: Tuple[str, ...]) -> Tuple[List[type], List[Tuple[type, RecordField]]]:
+    """Validate the dotted paths, returning the classes to fetch and the (class, field) pairs to join"""
+    classes = [cls]
+    links = []
+    for path in paths:
+        klass = cls
+        for name in path.split('.'):
+            field = getattr(klass.Record, name, None)
+            if not isinstance(field, RecordField):
+                raise ValueError(f'{klass.__name__} has no field {name!r} (in {path!r})')
+            target = _target_class(klass, field)
+            if target is None:
+                raise ValueError(f'{klass.__name__}.{name} is not a reference to another object (in {path!r})')
+            if (klass, field) not in links:
+                links.append((klass, field))
+            if target not in classes:
+                classes.append(target)
+            klass = target
+    return classes, links
+
+
+def _target_class(cls: type, field: RecordField):
+    """Class referenced by a field of type X, Optional[X] or List[X], or None for other fields"""
+    if field.property.type is inspect.Signature.empty:
+        return None
+    hint = resolve_typehint(field.property.type, cls.__module__)
+    origin = typing.get_origin(hint)
+    if origin is list:
+        hint, = typing.get_args(hint)
+    elif origin is typing.Union:
+        hint = next((arg for arg in typing.get_args(hint) if arg is not type(None)), None)
+    return hint if XenEndpoint.issubclass(hint, XenObject) else None
+
+
+class Prefetched(dict):
+    """
+    Result of a prefetch, {object: record}
+
+    While the result is alive, properties of its objects and of the objects on the paths are read from the
+    fetched records. Releasing it, leaving its `with` block, or dropping the last reference to it detaches the
+    records again, after which the properties are read from the API.
+    """
+
+    def __init__(self, records, attached: List[Tuple[XenObject, typing.Any]]):
+        super().__init__(records)
+        self._release = weakref.finalize(self, _detach, attached)
+
+    def release(self):
+        """Stop reading properties of the prefetched objects from their records"""
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def _detach(attached: List[Tuple[XenObject, typing.Any]]):
+    for obj, record in attached:
+        if obj._record is record:       # Unless a later prefetch attached another record
+            obj._record = None
+    attached.clear()
+
+
+def attach(connection, cls: type, tables: Dict[type, Dict[str, Dict]], links) -> Prefetched:
+    """Attach the fetched records to their objects, and convert the fields on the paths to the related objects"""
+    # The result holds on to all objects, also the related ones, until it is released
+    records = {}
+    attached = []
+    for klass, table in tables.items():
+        records[klass] = {}
+        for ref, raw in table.items():
+            obj = klass(connection, ref)
+            obj._record = klass.Record(connection, raw)
+            records[klass][obj] = obj._record
+            attached.append((obj, obj._record))
+    for klass, field in links:
+        for record in records[klass].values():
+            try:
+                field.__get__(record)
+            except AttributeError:      # The record doesn't have the field
+                pass
+    return Prefetched(records[cls], attached)
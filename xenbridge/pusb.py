@@ -7,6 +7,7 @@ import datetime
 
 class PUSB(XenObject):
     xenpath='PUSB'
+    __slots__ = ()
 
     USB_group: 'xenbridge.USBGroup' = XenProperty(XenProperty.READONLY, 'USB group the PUSB is contained in')
     description: str = XenProperty(XenProperty.READONLY, 'USB device description')
@@ -27,7 +28,7 @@ class PUSB(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given PUSB."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PUSB.Record':
         """Get a record containing the current state of the given PUSB."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -37,11 +38,12 @@ class PUSB(XenObject):
 
 class PUSBEndpoint(XenEndpoint):
     xenpath='PUSB'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PUSB']:
         """Return a list of all the PUSBs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PUSB', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PUSB', 'xenbridge.PUSB.Record']:
         """Return a map of PUSB references to PUSB records for all PUSBs known to the
         system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class PVSCacheStorage(XenObject):
     xenpath='PVS_cache_storage'
+    __slots__ = ()
 
     SR: 'xenbridge.SR' = XenProperty(XenProperty.READONLY, 'SR providing storage for the PVS cache')
     VDI: 'xenbridge.VDI' = XenProperty(XenProperty.READONLY, 'The VDI used for caching')
@@ -19,12 +20,13 @@ class PVSCacheStorage(XenObject):
     def destroy(self) -> None:
         """Destroy the specified PVS_cache_storage instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PVSCacheStorage.Record':
         """Get a record containing the current state of the given PVS_cache_storage."""
 
 
 class PVSCacheStorageEndpoint(XenEndpoint):
     xenpath='PVS_cache_storage'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.PVSCacheStorage':
         """Create a new PVS_cache_storage instance, and return its handle. The constructor
@@ -33,7 +35,7 @@ class PVSCacheStorageEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.PVSCacheStorage']:
         """Return a list of all the PVS_cache_storages known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PVSCacheStorage', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PVSCacheStorage', 'xenbridge.PVSCacheStorage.Record']:
         """Return a map of PVS_cache_storage references to PVS_cache_storage records for
         all PVS_cache_storages known to the system."""
     @XenMethod
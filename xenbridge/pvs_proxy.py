@@ -14,6 +14,7 @@ class PvsProxyStatus(XenEnum):
 
 class PVSProxy(XenObject):
     xenpath='PVS_proxy'
+    __slots__ = ()
 
     VIF: 'xenbridge.VIF' = XenProperty(XenProperty.READONLY, 'VIF of the VM using the proxy')
     currently_attached: bool = XenProperty(XenProperty.READONLY, 'true = VM is currently proxied')
@@ -25,12 +26,13 @@ class PVSProxy(XenObject):
     def destroy(self) -> None:
         """remove (or switch off) a PVS proxy for this VM"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PVSProxy.Record':
         """Get a record containing the current state of the given PVS_proxy."""
 
 
 class PVSProxyEndpoint(XenEndpoint):
     xenpath='PVS_proxy'
+    __slots__ = ()
     @XenMethod
     def create(self, site: 'xenbridge.PVSSite', VIF: 'xenbridge.VIF') -> 'xenbridge.PVSProxy':
         """Configure a VM/VIF to use a PVS proxy"""
@@ -38,7 +40,7 @@ class PVSProxyEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.PVSProxy']:
         """Return a list of all the PVS_proxys known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PVSProxy', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PVSProxy', 'xenbridge.PVSProxy.Record']:
         """Return a map of PVS_proxy references to PVS_proxy records for all PVS_proxys
         known to the system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class PVSServer(XenObject):
     xenpath='PVS_server'
+    __slots__ = ()
 
     addresses: List[str] = XenProperty(XenProperty.READONLY, 'IPv4 addresses of this server')
     first_port: int = XenProperty(XenProperty.READONLY, 'First UDP port accepted by this server')
@@ -18,17 +19,18 @@ class PVSServer(XenObject):
     def forget(self) -> None:
         """forget a PVS server"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PVSServer.Record':
         """Get a record containing the current state of the given PVS_server."""
 
 
 class PVSServerEndpoint(XenEndpoint):
     xenpath='PVS_server'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PVSServer']:
         """Return a list of all the PVS_servers known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PVSServer', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PVSServer', 'xenbridge.PVSServer.Record']:
         """Return a map of PVS_server references to PVS_server records for all PVS_servers
         known to the system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class PVSSite(XenObject):
     xenpath='PVS_site'
+    __slots__ = ()
 
     PVS_uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier of the PVS site, as configured in PVS')
     cache_storage: List['xenbridge.PVSCacheStorage'] = XenProperty(XenProperty.READONLY, 'The SR used by PVS proxy for the cache')
@@ -20,17 +21,18 @@ class PVSSite(XenObject):
     def forget(self) -> None:
         """Remove a site's meta data"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.PVSSite.Record':
         """Get a record containing the current state of the given PVS_site."""
 
 
 class PVSSiteEndpoint(XenEndpoint):
     xenpath='PVS_site'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.PVSSite']:
         """Return a list of all the PVS_sites known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.PVSSite', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.PVSSite', 'xenbridge.PVSSite.Record']:
         """Return a map of PVS_site references to PVS_site records for all PVS_sites known
         to the system."""
     @XenMethod
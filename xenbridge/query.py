@@ -0,0 +1,106 @@
+import keyword
+from typing import Any
+from .xenobject import XenEndpoint, RecordField
+
+
+class XenQuery:
+    """
+    Expression in the query language of get_all_records_where, evaluated by the server
+
+    Queries are built from fields and combined with &, | and ~:
+    ```
+    running = XenQuery.field('power_state') == 'Running'
+    query = running & ~(XenQuery.field('is_a_template') == True)
+    ```
+    Field names are the names of the python properties. Fields in an API namespace are stored with a double
+    underscore in the database, like memory__static_max. The keyword arguments of `where()` are translated
+    with the fields of the class. `field()` only translates name_label and name_description, other namespaced
+    fields should be given by their database name.
+    """
+    __slots__ = ('expr',)
+
+    def __init__(self, expr: str):
+        self.expr = expr
+
+    @staticmethod
+    def field(name: str) -> 'QueryField':
+        return QueryField(name)
+
+    @classmethod
+    def all(cls, *queries: 'XenQuery') -> 'XenQuery':
+        """Combine queries, matching objects that match all of them"""
+        if not queries:
+            return cls('true')
+        query = queries[0]
+        for other in queries[1:]:
+            query = query & other
+        return query
+
+    def __and__(self, other: 'XenQuery') -> 'XenQuery':
+        return XenQuery(f'({self.expr}) and ({other.expr})')
+
+    def __or__(self, other: 'XenQuery') -> 'XenQuery':
+        return XenQuery(f'({self.expr}) or ({other.expr})')
+
+    def __invert__(self) -> 'XenQuery':
+        return XenQuery(f'not ({self.expr})')
+
+    def __str__(self):
+        return self.expr
+
+    def __repr__(self):
+        return f'<XenQuery {self.expr}>'
+
+
+class QueryField:
+    """Field of a XenQuery, comparing it to a value gives a XenQuery"""
+    __slots__ = ('name',)
+    NAMESPACED = {'name_label': 'name__label', 'name_description': 'name__description'}
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @property
+    def column(self) -> str:
+        """Name of the field in the database"""
+        name = self.name
+        if name.endswith('_') and keyword.iskeyword(name[:-1]):
+            name = name[:-1]
+        return self.NAMESPACED.get(name, name)
+
+    def __eq__(self, value) -> XenQuery:
+        return XenQuery(f'field "{self.column}"="{literal(value)}"')
+
+    def __ne__(self, value) -> XenQuery:
+        return ~(self == value)
+
+    __hash__ = None
+
+
+def literal(value: Any) -> str:
+    """Format a value as a string literal of the query language"""
+    value = XenEndpoint.xen2ref(value)      # Objects and enums
+    if isinstance(value, bool):
+        value = 'true' if value else 'false'
+    value = str(value)
+    if '"' in value:
+        raise ValueError('Query values can\'t contain double quotes')
+    return value
+
+
+def compile_query(cls: type, *queries: XenQuery, **fields) -> XenQuery:
+    """Build the query for `Endpoint.where()`, checking that the keyword arguments are fields of `cls`"""
+    queries = list(queries)
+    for name, value in fields.items():
+        queries.append(QueryField(_column(cls, name)) == value)
+    return XenQuery.all(*queries)
+
+
+def _column(cls: type, name: str) -> str:
+    # Fields can be given by their python name, or by their database name (like memory__static_max)
+    field = getattr(cls.Record, name, None)
+    if isinstance(field, RecordField):
+        return field.property.column
+    if any(field.property.column == name for field in cls.Record.fields.values()):
+        return name
+    raise ValueError(f'{cls.__name__} has no field {name!r}')
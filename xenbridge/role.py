@@ -7,6 +7,7 @@ import datetime
 
 class Role(XenObject):
     xenpath='role'
+    __slots__ = ()
 
     name_description: str = XenProperty(XenProperty.READONLY, 'what this role is for')
     name_label: str = XenProperty(XenProperty.READONLY, 'a short user-friendly name for the role')
@@ -23,17 +24,18 @@ class Role(XenObject):
     def get_permissions_name_label(self) -> List[str]:
         """This call returns a list of permission names given a role"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Role.Record':
         """Get a record containing the current state of the given role."""
 
 
 class RoleEndpoint(XenEndpoint):
     xenpath='role'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.Role']:
         """Return a list of all the roles known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Role', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Role', 'xenbridge.Role.Record']:
         """Return a map of role references to role records for all roles known to the
         system."""
     @XenMethod
@@ -11,6 +11,7 @@ class SdnControllerProtocol(XenEnum):
 
 class SDNController(XenObject):
     xenpath='SDN_controller'
+    __slots__ = ()
 
     address: str = XenProperty(XenProperty.READONLY, 'IP address of the controller')
     port: int = XenProperty(XenProperty.READONLY, 'TCP port of the controller')
@@ -21,17 +22,18 @@ class SDNController(XenObject):
     def forget(self) -> None:
         """Remove the OVS manager of the pool and destroy the db record."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.SDNController.Record':
         """Get a record containing the current state of the given SDN_controller."""
 
 
 class SDNControllerEndpoint(XenEndpoint):
     xenpath='SDN_controller'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.SDNController']:
         """Return a list of all the SDN_controllers known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.SDNController', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.SDNController', 'xenbridge.SDNController.Record']:
         """Return a map of SDN_controller references to SDN_controller records for all
         SDN_controllers known to the system."""
     @XenMethod
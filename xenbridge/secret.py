@@ -7,6 +7,7 @@ import datetime
 
 class Secret(XenObject):
     xenpath='secret'
+    __slots__ = ()
 
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'other_config')
     uuid: str = XenProperty(XenProperty.READONLY, 'Unique identifier/object reference')
@@ -19,7 +20,7 @@ class Secret(XenObject):
     def destroy(self) -> None:
         """Destroy the specified secret instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Secret.Record':
         """Get a record containing the current state of the given secret."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -29,6 +30,7 @@ class Secret(XenObject):
 
 class SecretEndpoint(XenEndpoint):
     xenpath='secret'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.Secret':
         """Create a new secret instance, and return its handle. The constructor args are:
@@ -37,7 +39,7 @@ class SecretEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Secret']:
         """Return a list of all the secrets known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Secret', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Secret', 'xenbridge.Secret.Record']:
         """Return a map of secret references to secret records for all secrets known to the
         system."""
     @XenMethod
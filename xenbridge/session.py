@@ -7,6 +7,7 @@ import datetime
 
 class Session(XenObject):
     xenpath='session'
+    __slots__ = ()
 
     auth_user_name: str = XenProperty(XenProperty.READONLY, 'the subject name of the user that was externally authenticated. If a session instance has is_local_superuser set, then the value of this field is undefined.')
     auth_user_sid: str = XenProperty(XenProperty.READONLY, 'the subject identifier of the user that was externally authenticated. If a session instance has is_local_superuser set, then the value of this field is undefined.')
@@ -28,7 +29,7 @@ class Session(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given session."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Session.Record':
         """Get a record containing the current state of the given session."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -38,6 +39,7 @@ class Session(XenObject):
 
 class SessionEndpoint(XenEndpoint):
     xenpath='session'
+    __slots__ = ()
     @XenMethod
     def change_password(self, old_pwd: str, new_pwd: str) -> None:
         """Change the account password; if your session is authenticated with root
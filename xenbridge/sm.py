@@ -7,6 +7,7 @@ import datetime
 
 class SM(XenObject):
     xenpath='SM'
+    __slots__ = ()
 
     capabilities: List[str] = XenProperty(XenProperty.READONLY, 'capabilities of the SM plugin')
     configuration: Dict[str, str] = XenProperty(XenProperty.READONLY, 'names and descriptions of device config keys')
@@ -27,7 +28,7 @@ class SM(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given SM."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.SM.Record':
         """Get a record containing the current state of the given SM."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -37,11 +38,12 @@ class SM(XenObject):
 
 class SMEndpoint(XenEndpoint):
     xenpath='SM'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.SM']:
         """Return a list of all the SMs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.SM', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.SM', 'xenbridge.SM.Record']:
         """Return a map of SM references to SM records for all SMs known to the system."""
     @XenMethod
     def get_by_name_label(self, label: str) -> List['xenbridge.SM']:
@@ -29,6 +29,7 @@ class StorageOperations(XenEnum):
 
 class SR(XenObject):
     xenpath='SR'
+    __slots__ = ()
 
     PBDs: List['xenbridge.PBD'] = XenProperty(XenProperty.READONLY, 'describes how particular hosts can see this storage repository')
     VDIs: List['xenbridge.VDI'] = XenProperty(XenProperty.READONLY, 'all virtual disks known to this storage repository')
@@ -93,10 +94,10 @@ class SR(XenObject):
     def forget_data_source_archives(self, data_source: str) -> None:
         """Forget the recorded statistics related to the specified data source"""
     @XenMethod
-    def get_data_sources(self) -> List[Dict[str, Any]]:
+    def get_data_sources(self) -> List['xenbridge.DataSource.Record']:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.SR.Record':
         """Get a record containing the current state of the given SR."""
     @XenMethod
     def query_data_source(self, data_source: str) -> float:
@@ -126,6 +127,7 @@ class SR(XenObject):
 
 class SREndpoint(XenEndpoint):
     xenpath='SR'
+    __slots__ = ()
     @XenMethod
     def create(self, host: 'xenbridge.Host', device_config: Dict[str, str], physical_size: int, name_label: str, name_description: str, type: str, content_type: str, shared: bool, sm_config: Dict[str, str]) -> 'xenbridge.SR':
         """Create a new Storage Repository and introduce it into the managed system,
@@ -135,7 +137,7 @@ class SREndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.SR']:
         """Return a list of all the SRs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.SR', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.SR', 'xenbridge.SR.Record']:
         """Return a map of SR references to SR records for all SRs known to the system."""
     @XenMethod
     def get_by_name_label(self, label: str) -> List['xenbridge.SR']:
@@ -161,7 +163,7 @@ class SREndpoint(XenEndpoint):
         backend-specific scan will be performed, returning results that will guide the
         user in improving the device_config."""
     @XenMethod
-    def probe_ext(self, host: 'xenbridge.Host', device_config: Dict[str, str], type: str, sm_config: Dict[str, str]) -> List[Dict[str, Any]]:
+    def probe_ext(self, host: 'xenbridge.Host', device_config: Dict[str, str], type: str, sm_config: Dict[str, str]) -> List['xenbridge.ProbeResult.Record']:
         """Perform a backend-specific scan, using the given device_config.  If the
         device_config is complete, then this will return a list of the SRs present of
         this type on the device, if any.  If the device_config is partial, then a
@@ -11,6 +11,7 @@ class SrHealth(XenEnum):
 
 class SrStat(XenObject):
     xenpath='sr_stat'
+    __slots__ = ()
 
     clustered: bool = XenProperty(XenProperty.READONLY, 'Indicates whether the SR uses clustered local storage.')
     free_space: int = XenProperty(XenProperty.READONLY, 'Number of bytes free on the backing storage (in bytes)')
@@ -23,4 +24,5 @@ class SrStat(XenObject):
 
 class SrStatEndpoint(XenEndpoint):
     xenpath='sr_stat'
+    __slots__ = ()
     ...
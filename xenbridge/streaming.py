@@ -0,0 +1,102 @@
+import base64
+import xmlrpc.client
+from typing import Any, Dict, List, Tuple
+from xml.parsers import expat
+
+
+class RecordStream:
+    """
+    Incremental decoder for an XMLRPC response whose value is a map, like the result of get_all_records
+
+    Chunks of the response body are fed to the decoder as they arrive. Members of the map are returned as
+    (key, value) pairs as soon as they are decoded, and are not kept, so memory use is bounded by a single
+    record instead of the whole response. The rest of the response (Status, ErrorDescription) is available
+    as `response` once the stream is closed, with an empty map as its Value.
+    """
+
+    def __init__(self):
+        self.response = None
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._data
+        # Open structs and arrays, as [container, name of the current member, whether members are streamed]
+        self._stack: List[list] = []
+        self._text: List[str] = []
+        self._typed = False     # Whether the current <value> has a type element (untyped values are strings)
+        self._items: List[Tuple[str, Any]] = []
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        """Decode a chunk of the response, returning the members that were completed"""
+        self._parser.Parse(chunk, False)
+        items, self._items = self._items, []
+        return items
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """Finish decoding, returning the last members"""
+        self._parser.Parse(b'', True)
+        if not isinstance(self.response, dict):
+            raise ValueError('Got an unknown response!')
+        items, self._items = self._items, []
+        return items
+
+    def _start(self, tag: str, attrs):
+        if tag == 'struct' or tag == 'array':
+            # The map to stream is the Value of the outer {'Status': ..., 'Value': ...} struct
+            streamed = tag == 'struct' and len(self._stack) == 1 and self._stack[0][1] == 'Value'
+            self._stack.append([{} if tag == 'struct' else [], None, streamed])
+        elif tag == 'value':
+            self._typed = False
+        self._text = []
+
+    def _data(self, text: str):
+        self._text.append(text)
+
+    def _end(self, tag: str):
+        text = ''.join(self._text)
+        if tag == 'name':
+            self._stack[-1][1] = text
+        elif tag == 'value':
+            if not self._typed:
+                self._add(text)
+            self._typed = True      # The enclosing <value> (if any) holds a struct or array
+        elif tag == 'struct' or tag == 'array':
+            container, _, _ = self._stack.pop()
+            self._add(container)
+        elif tag in SCALARS:
+            self._add(SCALARS[tag](text))
+        else:
+            return
+        self._typed = True
+        self._text = []
+
+    def _add(self, value):
+        if not self._stack:
+            self.response = value
+            return
+        container, name, streamed = self._stack[-1]
+        if streamed:
+            self._items.append((name, value))
+        elif isinstance(container, dict):
+            container[name] = value
+        else:
+            container.append(value)
+
+
+def _binary(text: str):
+    return xmlrpc.client.Binary(base64.decodebytes(text.encode('ascii')))
+
+
+# Same types as xmlrpc.client.loads() with its default arguments
+SCALARS: Dict[str, Any] = {
+    'string': str,
+    'boolean': lambda text: text.strip() == '1',
+    'int': int,
+    'i4': int,
+    'i8': int,
+    'double': float,
+    'dateTime.iso8601': xmlrpc.client.DateTime,
+    'base64': _binary,
+    'nil': lambda text: None,
+}
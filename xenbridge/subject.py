@@ -7,6 +7,7 @@ import datetime
 
 class Subject(XenObject):
     xenpath='subject'
+    __slots__ = ()
 
     other_config: Dict[str, str] = XenProperty(XenProperty.READONLY, 'additional configuration')
     roles: List['xenbridge.Role'] = XenProperty(XenProperty.READONLY, 'the roles associated with this subject')
@@ -23,7 +24,7 @@ class Subject(XenObject):
     def get_permissions_name_label(self) -> List[str]:
         """This call returns a list of permission names given a subject"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Subject.Record':
         """Get a record containing the current state of the given subject."""
     @XenMethod
     def remove_from_roles(self, role: 'xenbridge.Role') -> None:
@@ -32,6 +33,7 @@ class Subject(XenObject):
 
 class SubjectEndpoint(XenEndpoint):
     xenpath='subject'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.Subject':
         """Create a new subject instance, and return its handle. The constructor args are:
@@ -40,7 +42,7 @@ class SubjectEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Subject']:
         """Return a list of all the subjects known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Subject', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Subject', 'xenbridge.Subject.Record']:
         """Return a map of subject references to subject records for all subjects known to
         the system."""
     @XenMethod
@@ -17,6 +17,7 @@ class TaskStatusType(XenEnum):
 
 class Task(XenObject):
     xenpath='task'
+    __slots__ = ()
 
     allowed_operations: List[TaskAllowedOperations] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
     backtrace: str = XenProperty(XenProperty.READONLY, 'Function call trace for debugging.')
@@ -48,7 +49,7 @@ class Task(XenObject):
     def destroy(self) -> None:
         """Destroy the task object"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Task.Record':
         """Get a record containing the current state of the given task."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -58,6 +59,7 @@ class Task(XenObject):
 
 class TaskEndpoint(XenEndpoint):
     xenpath='task'
+    __slots__ = ()
     @XenMethod
     def create(self, label: str, description: str) -> 'xenbridge.Task':
         """Create a new task object which must be manually destroyed."""
@@ -65,7 +67,7 @@ class TaskEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Task']:
         """Return a list of all the tasks known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Task', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Task', 'xenbridge.Task.Record']:
         """Return a map of task references to task records for all tasks known to the
         system."""
     @XenMethod
@@ -0,0 +1,202 @@
+import concurrent.futures
+import logging
+import threading
+import xmlrpc.client
+from typing import Any, Callable, Dict, List, Optional
+from xml.parsers.expat import ExpatError
+from .xenobject import XenError, compile_converter, xenclass
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TaskFuture(concurrent.futures.Future):
+    """
+    Future for the result of a xapi task, like the Task returned by `vm.clean_shutdown.start_async()`
+
+    The future is completed from the events of the task, without polling. The result is decoded using the
+    `type` field of the task, so a task that creates an object returns it as its XenObject; a failed task raises
+    its XenError. With `destroy`, the task is destroyed on the server once it is done. The future can also be
+    awaited in asyncio code. Cancelling the future cancels it right away, and the task on the server in the
+    background.
+    """
+
+    def __init__(self, task: 'xenbridge.Task', destroy: bool = True):
+        super().__init__()
+        if task.connection.asynchronous:
+            raise TypeError('Task futures follow the event pump, which runs in a thread; '
+                            'use a synchronous connection')
+        self.task = task
+        self.destroy = destroy
+        self.progress = 0.0
+        self._progress_callbacks: List[Callable[['TaskFuture'], Any]] = []
+        TaskMonitor.of(task.connection).watch(self)
+
+    def add_progress_callback(self, fn: Callable[['TaskFuture'], Any]):
+        """Call `fn(future)` every time the progress of the task changes, see `future.progress`"""
+        self._progress_callbacks.append(fn)
+
+    def cancel(self) -> bool:
+        # Doesn't wait for the server, asyncio calls this on the event loop when an awaiting task is cancelled
+        if self.done():
+            return self.cancelled()
+        if not super().cancel():
+            return False
+        threading.Thread(target=self._cancel_task, name='XenTaskCancel', daemon=True).start()
+        return True
+
+    def __await__(self):
+        import asyncio
+        return asyncio.wrap_future(self).__await__()
+
+    def __repr__(self):
+        return f'<TaskFuture {self.task.ref} {self._state.lower()} {self.progress:.0%}>'
+
+    def _cancel_task(self):
+        try:
+            self.task.cancel()
+        except XenError:
+            pass        # Not cancellable, or already done; it is still destroyed once it is done
+        except Exception:
+            LOGGER.exception('exception cancelling the task of %r', self)
+
+    def _set_progress(self, progress: float):
+        if progress == self.progress:
+            return
+        self.progress = progress
+        for callback in self._progress_callbacks:
+            try:
+                callback(self)
+            except Exception:
+                LOGGER.exception('exception calling progress callback for %r', self)
+
+
+class TaskMonitor:
+    """
+    Completes the TaskFutures of a connection from the events of the task class
+
+    All futures share a single subscription to the event pump, which is closed when no task is watched.
+    """
+
+    _create_lock = threading.Lock()
+
+    @classmethod
+    def of(cls, connection) -> 'TaskMonitor':
+        """The monitor of a connection, created on first use"""
+        with cls._create_lock:
+            if connection.task_monitor is None:
+                connection.task_monitor = cls(connection)
+            return connection.task_monitor
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._futures: Dict[str, TaskFuture] = {}
+        self._subscription = None
+        self._lock = threading.Lock()
+
+    def watch(self, future: TaskFuture):
+        ref = future.task.ref
+        with self._lock:
+            self._futures[ref] = future
+            if self._subscription is None:
+                # Only the events of watched tasks are queued
+                self._subscription = self.connection.subscribe(['task'], lambda event: event.ref.ref in self._futures,
+                                                               maxsize=10000)
+                threading.Thread(target=self._run, args=(self._subscription,), name='XenTaskMonitor',
+                                 daemon=True).start()
+        # The task may already be done before the subscription started
+        self._refresh(future)
+
+    def _run(self, subscription):
+        dropped = 0
+        while True:
+            try:
+                event = subscription.get()
+            except StopIteration:
+                return
+            except Exception as e:
+                # The event pump failed, the watched tasks can't be followed anymore
+                with self._lock:
+                    if self._subscription is not subscription:
+                        return
+                    self._subscription = None
+                    futures = list(self._futures.values())
+                for future in futures:
+                    self._finish(future, exception=e)
+                return
+            if subscription.dropped != dropped:
+                # Events of some tasks were lost, read their current state instead
+                dropped = subscription.dropped
+                for future in list(self._futures.values()):
+                    self._refresh(future)
+            future = self._futures.get(event.ref.ref)
+            if future is None:
+                continue
+            if event.snapshot is None:
+                error = XenError({'ErrorDescription': ['HANDLE_INVALID', 'task', future.task.ref]})
+                self._finish(future, exception=error)
+                continue
+            try:
+                self._update(future, event.snapshot.raw)
+            except Exception as e:
+                self._finish(future, exception=e)
+
+    def _refresh(self, future: TaskFuture):
+        try:
+            raw = future.task.get_record().raw
+        except XenError as e:
+            self._finish(future, exception=e)
+        else:
+            self._update(future, raw)
+
+    def _update(self, future: TaskFuture, raw: Dict[str, Any]):
+        future._set_progress(float(raw.get('progress', future.progress)))
+        status = raw['status']
+        if status == 'success':
+            self._finish(future, result=self._decode(raw))
+        elif status == 'failure':
+            error_info = raw['error_info'] or ['TASK_FAILED', future.task.ref]
+            self._finish(future, exception=XenError({'ErrorDescription': error_info}))
+        elif status == 'cancelled':
+            self._finish(future, cancelled=True)
+
+    def _decode(self, raw: Dict[str, Any]):
+        result = raw.get('result', '')
+        if not result:
+            return None
+        try:
+            # The result is the XMLRPC encoding of the value, like '<value>OpaqueRef:...</value>'
+            (value,), _ = xmlrpc.client.loads(f'<params><param>{result}</param></params>')
+        except ExpatError:
+            value = result
+        try:
+            cls = xenclass(raw.get('type') or '')
+        except ValueError:
+            return value
+        return compile_converter(List[cls] if isinstance(value, list) else cls)(self.connection, value)
+
+    def _finish(self, future: TaskFuture, result=None, exception: Optional[BaseException] = None,
+                cancelled=False):
+        with self._lock:
+            if self._futures.get(future.task.ref) is not future:
+                return      # Already finished
+            del self._futures[future.task.ref]
+            subscription = None
+            if not self._futures:
+                subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            subscription.close()
+        if cancelled:
+            super(TaskFuture, future).cancel()
+        elif not future.done():
+            try:
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+            except concurrent.futures.InvalidStateError:
+                pass        # Cancelled in the meantime
+        if future.destroy:
+            try:
+                future.task.destroy()
+            except XenError:
+                pass
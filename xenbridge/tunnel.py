@@ -11,6 +11,7 @@ class TunnelProtocol(XenEnum):
 
 class Tunnel(XenObject):
     xenpath='tunnel'
+    __slots__ = ()
 
     access_PIF: 'xenbridge.PIF' = XenProperty(XenProperty.READONLY, 'The interface through which the tunnel is accessed')
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'Additional configuration')
@@ -29,7 +30,7 @@ class Tunnel(XenObject):
     def destroy(self) -> None:
         """Destroy a tunnel"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.Tunnel.Record':
         """Get a record containing the current state of the given tunnel."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -43,6 +44,7 @@ class Tunnel(XenObject):
 
 class TunnelEndpoint(XenEndpoint):
     xenpath='tunnel'
+    __slots__ = ()
     @XenMethod
     def create(self, transport_PIF: 'xenbridge.PIF', network: 'xenbridge.Network', protocol: TunnelProtocol) -> 'xenbridge.Tunnel':
         """Create a tunnel"""
@@ -50,7 +52,7 @@ class TunnelEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.Tunnel']:
         """Return a list of all the tunnels known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.Tunnel', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.Tunnel', 'xenbridge.Tunnel.Record']:
         """Return a map of tunnel references to tunnel records for all tunnels known to the
         system."""
     @XenMethod
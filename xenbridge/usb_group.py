@@ -7,6 +7,7 @@ import datetime
 
 class USBGroup(XenObject):
     xenpath='USB_group'
+    __slots__ = ()
 
     PUSBs: List['xenbridge.PUSB'] = XenProperty(XenProperty.READONLY, 'List of PUSBs in the group')
     VUSBs: List['xenbridge.VUSB'] = XenProperty(XenProperty.READONLY, 'List of VUSBs using the group')
@@ -22,7 +23,7 @@ class USBGroup(XenObject):
     def destroy(self) -> None:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.USBGroup.Record':
         """Get a record containing the current state of the given USB_group."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -32,6 +33,7 @@ class USBGroup(XenObject):
 
 class USBGroupEndpoint(XenEndpoint):
     xenpath='USB_group'
+    __slots__ = ()
     @XenMethod
     def create(self, name_label: str, name_description: str, other_config: Dict[str, str]) -> 'xenbridge.USBGroup':
         ...
@@ -39,7 +41,7 @@ class USBGroupEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.USBGroup']:
         """Return a list of all the USB_groups known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.USBGroup', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.USBGroup', 'xenbridge.USBGroup.Record']:
         """Return a map of USB_group references to USB_group records for all USB_groups
         known to the system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class User(XenObject):
     xenpath='user'
+    __slots__ = ()
 
     fullname: str = XenProperty(XenProperty.READWRITE, 'full name')
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'additional configuration')
@@ -20,7 +21,7 @@ class User(XenObject):
     def destroy(self) -> None:
         """Destroy the specified user instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.User.Record':
         """Get a record containing the current state of the given user."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -30,6 +31,7 @@ class User(XenObject):
 
 class UserEndpoint(XenEndpoint):
     xenpath='user'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.User':
         """Create a new user instance, and return its handle. The constructor args are:
@@ -24,6 +24,7 @@ class VbdMode(XenEnum):
 
 class VBD(XenObject):
     xenpath='VBD'
+    __slots__ = ()
 
     VDI: 'xenbridge.VDI' = XenProperty(XenProperty.READONLY, 'the virtual disk')
     VM: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'the virtual machine')
@@ -65,7 +66,7 @@ class VBD(XenObject):
     def eject(self) -> None:
         """Remove the media from the device and leave it empty"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VBD.Record':
         """Get a record containing the current state of the given VBD."""
     @XenMethod
     def insert(self, vdi: 'xenbridge.VDI') -> None:
@@ -91,6 +92,7 @@ class VBD(XenObject):
 
 class VBDEndpoint(XenEndpoint):
     xenpath='VBD'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VBD':
         """Create a new VBD instance, and return its handle. The constructor args are: VM*,
@@ -101,7 +103,7 @@ class VBDEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VBD']:
         """Return a list of all the VBDs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VBD', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VBD', 'xenbridge.VBD.Record']:
         """Return a map of VBD references to VBD records for all VBDs known to the system."""
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.VBD':
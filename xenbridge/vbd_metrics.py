@@ -7,6 +7,7 @@ import datetime
 
 class VBDMetrics(XenObject):
     xenpath='VBD_metrics'
+    __slots__ = ()
 
     io_read_kbs: float = XenProperty(XenProperty.READONLY, 'Read bandwidth (KiB/s)')
     io_write_kbs: float = XenProperty(XenProperty.READONLY, 'Write bandwidth (KiB/s)')
@@ -18,7 +19,7 @@ class VBDMetrics(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given VBD_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VBDMetrics.Record':
         """Get a record containing the current state of the given VBD_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -28,11 +29,12 @@ class VBDMetrics(XenObject):
 
 class VBDMetricsEndpoint(XenEndpoint):
     xenpath='VBD_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.VBDMetrics']:
         """Return a list of all the VBD_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VBDMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VBDMetrics', 'xenbridge.VBDMetrics.Record']:
         """Return a map of VBD_metrics references to VBD_metrics records for all
         VBD_metrics instances known to the system."""
     @XenMethod
@@ -41,6 +41,7 @@ class OnBoot(XenEnum):
 
 class VDI(XenObject):
     xenpath='VDI'
+    __slots__ = ()
 
     SR: 'xenbridge.SR' = XenProperty(XenProperty.READONLY, 'storage repository in which the VDI resides')
     VBDs: List['xenbridge.VBD'] = XenProperty(XenProperty.READONLY, 'list of vbds that refer to this disk')
@@ -122,7 +123,7 @@ class VDI(XenObject):
     def forget(self) -> None:
         """Removes a VDI record from the database"""
     @XenMethod
-    def get_nbd_info(self) -> List[Dict[str, Any]]:
+    def get_nbd_info(self) -> List['xenbridge.VdiNbdServerInfo.Record']:
         """Get details specifying how to access this VDI via a Network Block Device server.
         For each of a set of NBD server addresses on which the VDI is available, the
         return value set contains a vdi_nbd_server_info object that contains an
@@ -133,7 +134,7 @@ class VDI(XenObject):
         VDI, any of the vdi_nbd_server_info objects can be used to make a connection to
         a server, and then the VDI will be available by requesting the exportname."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VDI.Record':
         """Get a record containing the current state of the given VDI."""
     @XenMethod
     def list_changed_blocks(self, vdi_to: 'xenbridge.VDI') -> str:
@@ -185,6 +186,7 @@ class VDI(XenObject):
 
 class VDIEndpoint(XenEndpoint):
     xenpath='VDI'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VDI':
         """Create a new VDI instance, and return its handle. The constructor args are:
@@ -194,7 +196,7 @@ class VDIEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VDI']:
         """Return a list of all the VDIs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VDI', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VDI', 'xenbridge.VDI.Record']:
         """Return a map of VDI references to VDI records for all VDIs known to the system."""
     @XenMethod
     def get_by_name_label(self, label: str) -> List['xenbridge.VDI']:
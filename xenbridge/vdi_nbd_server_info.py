@@ -7,6 +7,7 @@ import datetime
 
 class VdiNbdServerInfo(XenObject):
     xenpath='vdi_nbd_server_info'
+    __slots__ = ()
 
     address: str = XenProperty(XenProperty.READONLY, 'An address on which the server can be reached; this can be IPv4, IPv6, or a DNS name.')
     cert: str = XenProperty(XenProperty.READONLY, 'The TLS certificate of the server')
@@ -17,4 +18,5 @@ class VdiNbdServerInfo(XenObject):
 
 class VdiNbdServerInfoEndpoint(XenEndpoint):
     xenpath='vdi_nbd_server_info'
+    __slots__ = ()
     ...
@@ -7,6 +7,7 @@ import datetime
 
 class VGPU(XenObject):
     xenpath='VGPU'
+    __slots__ = ()
 
     GPU_group: 'xenbridge.GPUGroup' = XenProperty(XenProperty.READONLY, 'GPU group used by the vGPU')
     PCI: 'xenbridge.PCI' = XenProperty(XenProperty.READONLY, 'Device passed trough to VM, either as full device or SR-IOV virtual function')
@@ -28,7 +29,7 @@ class VGPU(XenObject):
     def destroy(self) -> None:
         ...
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VGPU.Record':
         """Get a record containing the current state of the given VGPU."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -38,6 +39,7 @@ class VGPU(XenObject):
 
 class VGPUEndpoint(XenEndpoint):
     xenpath='VGPU'
+    __slots__ = ()
     @XenMethod
     def create(self, VM: 'xenbridge.VM', GPU_group: 'xenbridge.GPUGroup', device: str, other_config: Dict[str, str], type: 'xenbridge.VGPUType') -> 'xenbridge.VGPU':
         ...
@@ -45,7 +47,7 @@ class VGPUEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VGPU']:
         """Return a list of all the VGPUs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VGPU', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VGPU', 'xenbridge.VGPU.Record']:
         """Return a map of VGPU references to VGPU records for all VGPUs known to the
         system."""
     @XenMethod
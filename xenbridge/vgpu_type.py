@@ -14,6 +14,7 @@ class VgpuTypeImplementation(XenEnum):
 
 class VGPUType(XenObject):
     xenpath='VGPU_type'
+    __slots__ = ()
 
     VGPUs: List['xenbridge.VGPU'] = XenProperty(XenProperty.READONLY, 'List of VGPUs of this type')
     compatible_types_in_vm: List['xenbridge.VGPUType'] = XenProperty(XenProperty.READONLY, 'List of VGPU types which are compatible in one VM')
@@ -33,17 +34,18 @@ class VGPUType(XenObject):
     vendor_name: str = XenProperty(XenProperty.READONLY, 'Name of VGPU vendor')
 
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VGPUType.Record':
         """Get a record containing the current state of the given VGPU_type."""
 
 
 class VGPUTypeEndpoint(XenEndpoint):
     xenpath='VGPU_type'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.VGPUType']:
         """Return a list of all the VGPU_types known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VGPUType', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VGPUType', 'xenbridge.VGPUType.Record']:
         """Return a map of VGPU_type references to VGPU_type records for all VGPU_types
         known to the system."""
     @XenMethod
@@ -23,6 +23,7 @@ class VifIpv6ConfigurationMode(XenEnum):
 
 class VIF(XenObject):
     xenpath='VIF'
+    __slots__ = ()
 
     MAC: str = XenProperty(XenProperty.READONLY, 'ethernet MAC address of virtual interface, as exposed to guest')
     MAC_autogenerated: bool = XenProperty(XenProperty.READONLY, 'true if the MAC was autogenerated; false indicates it was set manually')
@@ -74,7 +75,7 @@ class VIF(XenObject):
     def destroy(self) -> None:
         """Destroy the specified VIF instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VIF.Record':
         """Get a record containing the current state of the given VIF."""
     @XenMethod
     def move(self, network: 'xenbridge.Network') -> None:
@@ -106,6 +107,7 @@ class VIF(XenObject):
 
 class VIFEndpoint(XenEndpoint):
     xenpath='VIF'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VIF':
         """Create a new VIF instance, and return its handle. The constructor args are:
@@ -116,7 +118,7 @@ class VIFEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VIF']:
         """Return a list of all the VIFs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VIF', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VIF', 'xenbridge.VIF.Record']:
         """Return a map of VIF references to VIF records for all VIFs known to the system."""
     @XenMethod
     def get_by_uuid(self, uuid: str) -> 'xenbridge.VIF':
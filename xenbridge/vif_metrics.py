@@ -7,6 +7,7 @@ import datetime
 
 class VIFMetrics(XenObject):
     xenpath='VIF_metrics'
+    __slots__ = ()
 
     io_read_kbs: float = XenProperty(XenProperty.READONLY, 'Read bandwidth (KiB/s)')
     io_write_kbs: float = XenProperty(XenProperty.READONLY, 'Write bandwidth (KiB/s)')
@@ -18,7 +19,7 @@ class VIFMetrics(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given VIF_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VIFMetrics.Record':
         """Get a record containing the current state of the given VIF_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -28,11 +29,12 @@ class VIFMetrics(XenObject):
 
 class VIFMetricsEndpoint(XenEndpoint):
     xenpath='VIF_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.VIFMetrics']:
         """Return a list of all the VIF_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VIFMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VIFMetrics', 'xenbridge.VIFMetrics.Record']:
         """Return a map of VIF_metrics references to VIF_metrics records for all
         VIF_metrics instances known to the system."""
     @XenMethod
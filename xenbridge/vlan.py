@@ -7,6 +7,7 @@ import datetime
 
 class VLAN(XenObject):
     xenpath='VLAN'
+    __slots__ = ()
 
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'additional configuration')
     tag: int = XenProperty(XenProperty.READONLY, 'VLAN tag in use')
@@ -21,7 +22,7 @@ class VLAN(XenObject):
     def destroy(self) -> None:
         """Destroy a VLAN mux/demuxer"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VLAN.Record':
         """Get a record containing the current state of the given VLAN."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -31,6 +32,7 @@ class VLAN(XenObject):
 
 class VLANEndpoint(XenEndpoint):
     xenpath='VLAN'
+    __slots__ = ()
     @XenMethod
     def create(self, tagged_PIF: 'xenbridge.PIF', tag: int, network: 'xenbridge.Network') -> 'xenbridge.VLAN':
         """Create a VLAN mux/demuxer"""
@@ -38,7 +40,7 @@ class VLANEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VLAN']:
         """Return a list of all the VLANs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VLAN', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VLAN', 'xenbridge.VLAN.Record']:
         """Return a map of VLAN references to VLAN records for all VLANs known to the
         system."""
     @XenMethod
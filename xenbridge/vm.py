@@ -77,29 +77,30 @@ class DomainType(XenEnum):
 
 class VM(XenObject):
     xenpath='VM'
+    __slots__ = ()
 
-    HVM_boot_params: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'HVM boot params')
-    HVM_boot_policy: str = XenProperty(XenProperty.READONLY, 'HVM boot policy')
-    HVM_shadow_multiplier: float = XenProperty(XenProperty.READONLY, 'multiplier applied to the amount of shadow that will be made available to the guest')
+    HVM_boot_params: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'HVM boot params', column='HVM__boot_params')
+    HVM_boot_policy: str = XenProperty(XenProperty.READONLY, 'HVM boot policy', column='HVM__boot_policy')
+    HVM_shadow_multiplier: float = XenProperty(XenProperty.READONLY, 'multiplier applied to the amount of shadow that will be made available to the guest', column='HVM__shadow_multiplier')
     NVRAM: Dict[str, str] = XenProperty(XenProperty.READONLY, 'initial value for guest NVRAM (containing UEFI variables, etc). Cannot be changed while the VM is running')
     PCI_bus: str = XenProperty(XenProperty.READWRITE, 'PCI bus path for pass-through devices')
-    PV_args: str = XenProperty(XenProperty.READWRITE, 'kernel command-line arguments')
-    PV_bootloader: str = XenProperty(XenProperty.READWRITE, 'name of or path to bootloader')
-    PV_bootloader_args: str = XenProperty(XenProperty.READWRITE, 'miscellaneous arguments for the bootloader')
-    PV_kernel: str = XenProperty(XenProperty.READWRITE, 'path to the kernel')
-    PV_legacy_args: str = XenProperty(XenProperty.READWRITE, 'to make Zurich guests boot')
-    PV_ramdisk: str = XenProperty(XenProperty.READWRITE, 'path to the initrd')
+    PV_args: str = XenProperty(XenProperty.READWRITE, 'kernel command-line arguments', column='PV__args')
+    PV_bootloader: str = XenProperty(XenProperty.READWRITE, 'name of or path to bootloader', column='PV__bootloader')
+    PV_bootloader_args: str = XenProperty(XenProperty.READWRITE, 'miscellaneous arguments for the bootloader', column='PV__bootloader_args')
+    PV_kernel: str = XenProperty(XenProperty.READWRITE, 'path to the kernel', column='PV__kernel')
+    PV_legacy_args: str = XenProperty(XenProperty.READWRITE, 'to make Zurich guests boot', column='PV__legacy_args')
+    PV_ramdisk: str = XenProperty(XenProperty.READWRITE, 'path to the initrd', column='PV__ramdisk')
     VBDs: List['xenbridge.VBD'] = XenProperty(XenProperty.READONLY, 'virtual block devices')
-    VCPUs_at_startup: int = XenProperty(XenProperty.READONLY, 'Boot number of VCPUs')
-    VCPUs_max: int = XenProperty(XenProperty.READONLY, 'Max number of VCPUs')
-    VCPUs_params: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'configuration parameters for the selected VCPU policy')
+    VCPUs_at_startup: int = XenProperty(XenProperty.READONLY, 'Boot number of VCPUs', column='VCPUs__at_startup')
+    VCPUs_max: int = XenProperty(XenProperty.READONLY, 'Max number of VCPUs', column='VCPUs__max')
+    VCPUs_params: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'configuration parameters for the selected VCPU policy', column='VCPUs__params')
     VGPUs: List['xenbridge.VGPU'] = XenProperty(XenProperty.READONLY, 'Virtual GPUs')
     VIFs: List['xenbridge.VIF'] = XenProperty(XenProperty.READONLY, 'virtual network interfaces')
     VTPMs: List['xenbridge.VTPM'] = XenProperty(XenProperty.READONLY, 'virtual TPMs')
     VUSBs: List['xenbridge.VUSB'] = XenProperty(XenProperty.READONLY, 'vitual usb devices')
-    actions_after_crash: OnCrashBehaviour = XenProperty(XenProperty.READONLY, 'action to take if the guest crashes')
-    actions_after_reboot: OnNormalExit = XenProperty(XenProperty.READWRITE, 'action to take after the guest has rebooted itself')
-    actions_after_shutdown: OnNormalExit = XenProperty(XenProperty.READWRITE, 'action to take after the guest has shutdown itself')
+    actions_after_crash: OnCrashBehaviour = XenProperty(XenProperty.READONLY, 'action to take if the guest crashes', column='actions__after_crash')
+    actions_after_reboot: OnNormalExit = XenProperty(XenProperty.READWRITE, 'action to take after the guest has rebooted itself', column='actions__after_reboot')
+    actions_after_shutdown: OnNormalExit = XenProperty(XenProperty.READWRITE, 'action to take after the guest has shutdown itself', column='actions__after_shutdown')
     affinity: 'xenbridge.Host' = XenProperty(XenProperty.READWRITE, 'A host which the VM has some affinity for (or NULL). This is used as a hint to the start call when it decides where to run the VM. Resource constraints may cause the VM to be started elsewhere.')
     allowed_operations: List[VmOperations] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
     appliance: 'xenbridge.VMAppliance' = XenProperty(XenProperty.READONLY, 'the appliance to which this VM belongs')
@@ -128,12 +129,12 @@ class VM(XenObject):
     is_vmss_snapshot: bool = XenProperty(XenProperty.READONLY, 'true if this snapshot was created by the snapshot schedule')
     last_boot_CPU_flags: Dict[str, str] = XenProperty(XenProperty.READONLY, 'describes the CPU flags on which the VM was last booted')
     last_booted_record: str = XenProperty(XenProperty.READONLY, 'marshalled value containing VM record at time of last boot')
-    memory_dynamic_max: int = XenProperty(XenProperty.READONLY, 'Dynamic maximum (bytes)')
-    memory_dynamic_min: int = XenProperty(XenProperty.READONLY, 'Dynamic minimum (bytes)')
-    memory_overhead: int = XenProperty(XenProperty.READONLY, 'The VM.memory_* fields describe how much virtual RAM the\nVM can see. Every running VM requires extra host memory to store\nthings like\n\nshadow copies of page tables, needed during migration or\nif hardware assisted paging is not available\nvideo RAM for the virtual graphics card\nrecords in the hypervisor describing the VM and the vCPUs\n\nThese memory "overheads" are recomputed every time the VM\'s\nconfiguration changes, and the result is stored in\nVM.memory_overhead.\nFor more information, read about\nHost memory accounting')
-    memory_static_max: int = XenProperty(XenProperty.READONLY, 'Statically-set (i.e. absolute) maximum (bytes). The value of this field at VM start time acts as a hard limit of the amount of memory a guest can use. New values only take effect on reboot.')
-    memory_static_min: int = XenProperty(XenProperty.READONLY, 'Statically-set (i.e. absolute) mininum (bytes). The value of this field indicates the least amount of memory this VM can boot with without crashing.')
-    memory_target: int = XenProperty(XenProperty.READONLY, 'Dynamically-set memory target (bytes). The value of this field indicates the current target for memory available to this VM.')
+    memory_dynamic_max: int = XenProperty(XenProperty.READONLY, 'Dynamic maximum (bytes)', column='memory__dynamic_max')
+    memory_dynamic_min: int = XenProperty(XenProperty.READONLY, 'Dynamic minimum (bytes)', column='memory__dynamic_min')
+    memory_overhead: int = XenProperty(XenProperty.READONLY, 'The VM.memory_* fields describe how much virtual RAM the\nVM can see. Every running VM requires extra host memory to store\nthings like\n\nshadow copies of page tables, needed during migration or\nif hardware assisted paging is not available\nvideo RAM for the virtual graphics card\nrecords in the hypervisor describing the VM and the vCPUs\n\nThese memory "overheads" are recomputed every time the VM\'s\nconfiguration changes, and the result is stored in\nVM.memory_overhead.\nFor more information, read about\nHost memory accounting', column='memory__overhead')
+    memory_static_max: int = XenProperty(XenProperty.READONLY, 'Statically-set (i.e. absolute) maximum (bytes). The value of this field at VM start time acts as a hard limit of the amount of memory a guest can use. New values only take effect on reboot.', column='memory__static_max')
+    memory_static_min: int = XenProperty(XenProperty.READONLY, 'Statically-set (i.e. absolute) mininum (bytes). The value of this field indicates the least amount of memory this VM can boot with without crashing.', column='memory__static_min')
+    memory_target: int = XenProperty(XenProperty.READONLY, 'Dynamically-set memory target (bytes). The value of this field indicates the current target for memory available to this VM.', column='memory__target')
     metrics: 'xenbridge.VMMetrics' = XenProperty(XenProperty.READONLY, 'metrics associated with this VM')
     name_description: str = XenProperty(XenProperty.READWRITE, 'a notes field containing human-readable description')
     name_label: str = XenProperty(XenProperty.READWRITE, 'a human-readable name')
@@ -269,7 +270,7 @@ class VM(XenObject):
     def get_allowed_VIF_devices(self) -> List[str]:
         """Returns a list of the allowed values that a VIF device field can take"""
     @XenMethod
-    def get_boot_record(self) -> Dict[str, Any]:
+    def get_boot_record(self) -> 'xenbridge.VM.Record':
         """Returns a record describing the VM's dynamic state, initialised when the VM
         boots and updated to reflect runtime configuration changes e.g. CPU hotplug"""
     @XenMethod
@@ -277,13 +278,13 @@ class VM(XenObject):
         """Return true if the VM is currently 'co-operative' i.e. is expected to reach a
         balloon target and actually has done"""
     @XenMethod
-    def get_data_sources(self) -> List[Dict[str, Any]]:
+    def get_data_sources(self) -> List['xenbridge.DataSource.Record']:
         ...
     @XenMethod
     def get_possible_hosts(self) -> List['xenbridge.Host']:
         """Return the list of hosts on which this VM may run."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VM.Record':
         """Get a record containing the current state of the given VM."""
     @XenMethod
     def hard_reboot(self) -> None:
@@ -452,6 +453,7 @@ class VM(XenObject):
 
 class VMEndpoint(XenEndpoint):
     xenpath='VM'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VM':
         """NOT RECOMMENDED! VM.clone or VM.copy (or VM.import) is a better choice in almost
@@ -481,7 +483,7 @@ class VMEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VM']:
         """Return a list of all the VMs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VM', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VM', 'xenbridge.VM.Record']:
         """Return a map of VM references to VM records for all VMs known to the system."""
     @XenMethod
     def get_by_name_label(self, label: str) -> List['xenbridge.VM']:
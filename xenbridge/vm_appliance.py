@@ -13,6 +13,7 @@ class VmApplianceOperation(XenEnum):
 
 class VMAppliance(XenObject):
     xenpath='VM_appliance'
+    __slots__ = ()
 
     VMs: List['xenbridge.VM'] = XenProperty(XenProperty.READONLY, 'all VMs in this appliance')
     allowed_operations: List[VmApplianceOperation] = XenProperty(XenProperty.READONLY, 'list of the operations allowed in this state. This list is advisory only and the server state may have changed by the time this field is read by a client.')
@@ -34,7 +35,7 @@ class VMAppliance(XenObject):
     def get_SRs_required_for_recovery(self, session_to: 'xenbridge.Session') -> List['xenbridge.SR']:
         """Get the list of SRs required by the VM appliance to recover."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VMAppliance.Record':
         """Get a record containing the current state of the given VM_appliance."""
     @XenMethod
     def hard_shutdown(self) -> None:
@@ -53,6 +54,7 @@ class VMAppliance(XenObject):
 
 class VMApplianceEndpoint(XenEndpoint):
     xenpath='VM_appliance'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VMAppliance':
         """Create a new VM_appliance instance, and return its handle. The constructor args
@@ -61,7 +63,7 @@ class VMApplianceEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VMAppliance']:
         """Return a list of all the VM_appliances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VMAppliance', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VMAppliance', 'xenbridge.VMAppliance.Record']:
         """Return a map of VM_appliance references to VM_appliance records for all
         VM_appliances known to the system."""
     @XenMethod
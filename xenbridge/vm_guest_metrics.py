@@ -12,6 +12,7 @@ class TristateType(XenEnum):
 
 class VMGuestMetrics(XenObject):
     xenpath='VM_guest_metrics'
+    __slots__ = ()
 
     PV_drivers_detected: bool = XenProperty(XenProperty.READONLY, "At least one of the guest's devices has successfully connected to the backend.")
     PV_drivers_up_to_date: bool = XenProperty(XenProperty.READONLY, 'Logically equivalent to PV_drivers_detected')
@@ -33,7 +34,7 @@ class VMGuestMetrics(XenObject):
         """Add the given key-value pair to the other_config field of the given
         VM_guest_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VMGuestMetrics.Record':
         """Get a record containing the current state of the given VM_guest_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -43,11 +44,12 @@ class VMGuestMetrics(XenObject):
 
 class VMGuestMetricsEndpoint(XenEndpoint):
     xenpath='VM_guest_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.VMGuestMetrics']:
         """Return a list of all the VM_guest_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VMGuestMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VMGuestMetrics', 'xenbridge.VMGuestMetrics.Record']:
         """Return a map of VM_guest_metrics references to VM_guest_metrics records for all
         VM_guest_metrics instances known to the system."""
     @XenMethod
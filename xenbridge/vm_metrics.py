@@ -13,17 +13,18 @@ class DomainType(XenEnum):
 
 class VMMetrics(XenObject):
     xenpath='VM_metrics'
+    __slots__ = ()
 
-    VCPUs_CPU: Dict[int, int] = XenProperty(XenProperty.READONLY, 'VCPU to PCPU map')
-    VCPUs_flags: Dict[int, List[str]] = XenProperty(XenProperty.READONLY, 'CPU flags (blocked,online,running)')
-    VCPUs_number: int = XenProperty(XenProperty.READONLY, 'Current number of VCPUs')
-    VCPUs_params: Dict[str, str] = XenProperty(XenProperty.READONLY, 'The live equivalent to VM.VCPUs_params')
-    VCPUs_utilisation: Dict[int, float] = XenProperty(XenProperty.READONLY, "Utilisation for all of guest's current VCPUs")
+    VCPUs_CPU: Dict[int, int] = XenProperty(XenProperty.READONLY, 'VCPU to PCPU map', column='VCPUs__CPU')
+    VCPUs_flags: Dict[int, List[str]] = XenProperty(XenProperty.READONLY, 'CPU flags (blocked,online,running)', column='VCPUs__flags')
+    VCPUs_number: int = XenProperty(XenProperty.READONLY, 'Current number of VCPUs', column='VCPUs__number')
+    VCPUs_params: Dict[str, str] = XenProperty(XenProperty.READONLY, 'The live equivalent to VM.VCPUs_params', column='VCPUs__params')
+    VCPUs_utilisation: Dict[int, float] = XenProperty(XenProperty.READONLY, "Utilisation for all of guest's current VCPUs", column='VCPUs__utilisation')
     current_domain_type: DomainType = XenProperty(XenProperty.READONLY, 'The current domain type of the VM (for running,suspended, or paused VMs). The last-known domain type for halted VMs.')
     hvm: bool = XenProperty(XenProperty.READONLY, 'hardware virtual machine')
     install_time: datetime.datetime = XenProperty(XenProperty.READONLY, 'Time at which the VM was installed')
     last_updated: datetime.datetime = XenProperty(XenProperty.READONLY, 'Time at which this information was last updated')
-    memory_actual: int = XenProperty(XenProperty.READONLY, "Guest's actual memory (bytes)")
+    memory_actual: int = XenProperty(XenProperty.READONLY, "Guest's actual memory (bytes)", column='memory__actual')
     nested_virt: bool = XenProperty(XenProperty.READONLY, 'VM supports nested virtualisation')
     nomigrate: bool = XenProperty(XenProperty.READONLY, "VM is immobile and can't migrate between hosts")
     other_config: Dict[str, str] = XenProperty(XenProperty.READWRITE, 'additional configuration')
@@ -35,7 +36,7 @@ class VMMetrics(XenObject):
     def add_to_other_config(self, key: str, value: str) -> None:
         """Add the given key-value pair to the other_config field of the given VM_metrics."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VMMetrics.Record':
         """Get a record containing the current state of the given VM_metrics."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -45,11 +46,12 @@ class VMMetrics(XenObject):
 
 class VMMetricsEndpoint(XenEndpoint):
     xenpath='VM_metrics'
+    __slots__ = ()
     @XenMethod
     def get_all(self) -> List['xenbridge.VMMetrics']:
         """Return a list of all the VM_metrics instances known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VMMetrics', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VMMetrics', 'xenbridge.VMMetrics.Record']:
         """Return a map of VM_metrics references to VM_metrics records for all VM_metrics
         instances known to the system."""
     @XenMethod
@@ -24,6 +24,7 @@ class VmppArchiveTargetType(XenEnum):
 
 class VMPP(XenObject):
     xenpath='VMPP'
+    __slots__ = ()
 
     VMs: List['xenbridge.VM'] = XenProperty(XenProperty.READONLY, 'all VMs attached to this protection policy')
     alarm_config: Dict[str, str] = XenProperty(XenProperty.READONLY, 'configuration for the alarm')
@@ -65,7 +66,7 @@ class VMPP(XenObject):
     def get_alerts(self, hours_from_now: int) -> List[str]:
         """This call fetches a history of alerts for a given protection policy"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VMPP.Record':
         """Get a record containing the current state of the given VMPP."""
     @XenMethod
     def protect_now(self) -> str:
@@ -86,6 +87,7 @@ class VMPP(XenObject):
 
 class VMPPEndpoint(XenEndpoint):
     xenpath='VMPP'
+    __slots__ = ()
     @XenMethod
     def archive_now(self, snapshot: 'xenbridge.VM') -> str:
         """This call archives the snapshot provided as a parameter"""
@@ -100,7 +102,7 @@ class VMPPEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VMPP']:
         """Return a list of all the VMPPs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VMPP', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VMPP', 'xenbridge.VMPP.Record']:
         """Return a map of VMPP references to VMPP records for all VMPPs known to the
         system."""
     @XenMethod
@@ -16,6 +16,7 @@ class VmssType(XenEnum):
 
 class VMSS(XenObject):
     xenpath='VMSS'
+    __slots__ = ()
 
     VMs: List['xenbridge.VM'] = XenProperty(XenProperty.READONLY, 'all VMs attached to this snapshot schedule')
     enabled: bool = XenProperty(XenProperty.READWRITE, 'enable or disable this snapshot schedule')
@@ -35,7 +36,7 @@ class VMSS(XenObject):
     def destroy(self) -> None:
         """Destroy the specified VMSS instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VMSS.Record':
         """Get a record containing the current state of the given VMSS."""
     @XenMethod
     def remove_from_schedule(self, key: str) -> None:
@@ -47,6 +48,7 @@ class VMSS(XenObject):
 
 class VMSSEndpoint(XenEndpoint):
     xenpath='VMSS'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VMSS':
         """Create a new VMSS instance, and return its handle. The constructor args are:
@@ -56,7 +58,7 @@ class VMSSEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VMSS']:
         """Return a list of all the VMSSs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VMSS', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VMSS', 'xenbridge.VMSS.Record']:
         """Return a map of VMSS references to VMSS records for all VMSSs known to the
         system."""
     @XenMethod
@@ -7,6 +7,7 @@ import datetime
 
 class VTPM(XenObject):
     xenpath='VTPM'
+    __slots__ = ()
 
     VM: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'the virtual machine')
     backend: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'the domain where the backend is located')
@@ -16,12 +17,13 @@ class VTPM(XenObject):
     def destroy(self) -> None:
         """Destroy the specified VTPM instance."""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VTPM.Record':
         """Get a record containing the current state of the given VTPM."""
 
 
 class VTPMEndpoint(XenEndpoint):
     xenpath='VTPM'
+    __slots__ = ()
     @XenMethod
     def create(self, args: Dict[str, Any]) -> 'xenbridge.VTPM':
         """Create a new VTPM instance, and return its handle. The constructor args are:
@@ -12,6 +12,7 @@ class VusbOperations(XenEnum):
 
 class VUSB(XenObject):
     xenpath='VUSB'
+    __slots__ = ()
 
     USB_group: 'xenbridge.USBGroup' = XenProperty(XenProperty.READONLY, 'USB group used by the VUSB')
     VM: 'xenbridge.VM' = XenProperty(XenProperty.READONLY, 'VM that owns the VUSB')
@@ -28,7 +29,7 @@ class VUSB(XenObject):
     def destroy(self) -> None:
         """Removes a VUSB record from the database"""
     @XenMethod
-    def get_record(self) -> Dict[str, Any]:
+    def get_record(self) -> 'xenbridge.VUSB.Record':
         """Get a record containing the current state of the given VUSB."""
     @XenMethod
     def remove_from_other_config(self, key: str) -> None:
@@ -41,6 +42,7 @@ class VUSB(XenObject):
 
 class VUSBEndpoint(XenEndpoint):
     xenpath='VUSB'
+    __slots__ = ()
     @XenMethod
     def create(self, VM: 'xenbridge.VM', USB_group: 'xenbridge.USBGroup', other_config: Dict[str, str]) -> 'xenbridge.VUSB':
         """Create a new VUSB record in the database only"""
@@ -48,7 +50,7 @@ class VUSBEndpoint(XenEndpoint):
     def get_all(self) -> List['xenbridge.VUSB']:
         """Return a list of all the VUSBs known to the system."""
     @XenMethod
-    def get_all_records(self) -> Dict['xenbridge.VUSB', Dict[str, Any]]:
+    def get_all_records(self) -> Dict['xenbridge.VUSB', 'xenbridge.VUSB.Record']:
         """Return a map of VUSB references to VUSB records for all VUSBs known to the
         system."""
     @XenMethod
@@ -1,5 +1,19 @@
+import collections
+import contextlib
+import copy
+import http.client
+import sys
+import threading
+import time
 import typing
+import urllib.parse
+import weakref
+import zlib
 from . import Session, XenError
+from .cache import XenCache
+from .events import NETWORK_ERRORS, EventPump, Subscription, XenEvent, XenEventStream
+from .jsonrpc import JsonRpcProxy
+from .streaming import RecordStream
 import xmlrpc.client
 try:
     import requests
@@ -8,21 +22,64 @@ except ImportError:
 
 
 class XenConnectionBase:
+    asynchronous = False
 
-    def __init__(self, host: str, user: str, passwd: str, version='1.0', emergency_mode=False, **kwargs):
+    def __init__(self, host: str, user: str, passwd: str, version='1.0', emergency_mode=False,
+                 pool_size=4, idle_timeout=60.0, max_requests=0, max_sessions=1, coalesce=False, protocol='xmlrpc',
+                 compression=True, cache=None, cache_file=None, cache_indexes=None, **kwargs):
+        if protocol not in ('xmlrpc', 'jsonrpc'):
+            raise ValueError(f'Unknown protocol {protocol!r}, use \'xmlrpc\' or \'jsonrpc\'')
         self.host = host
-        self.proxy = xmlrpc.client.ServerProxy(self.host, **kwargs)
+        self.protocol = protocol
+        self._identity_map = weakref.WeakValueDictionary()
+        self.cache: typing.Optional[XenCache] = None
+        if 'transport' not in kwargs:
+            transport = JsonRpcTransport if protocol == 'jsonrpc' else PooledTransport
+            kwargs['transport'] = transport(kwargs.get('use_datetime', False),
+                                            kwargs.get('use_builtin_types', False),
+                                            headers=kwargs.get('headers', ()),
+                                            https=urllib.parse.urlsplit(host).scheme == 'https',
+                                            context=kwargs.get('context'),
+                                            pool_size=pool_size,
+                                            idle_timeout=idle_timeout,
+                                            max_requests=max_requests,
+                                            compression=compression)
+        self.transport = kwargs['transport']
+        if protocol == 'jsonrpc':
+            self.proxy = JsonRpcProxy(self.host, self.transport)
+        else:
+            self.proxy = xmlrpc.client.ServerProxy(self.host, **kwargs)
         self.user = user
         self.passwd = passwd
         self.api_version = version
-        if emergency_mode:
-            self.current_session = self.slave_local_login_with_password(user, passwd)
-        else:
-            self.current_session = self.login_with_password(user, passwd, version=version, originator='XenBridge')
+        self.emergency_mode = emergency_mode
+        self.sessions = SessionPool(self.new_session, max_sessions)
+        self.flights = SingleFlight() if coalesce else None
+        self.event_pump = EventPump(self)
+        self.task_monitor = None        # Created by the first TaskFuture, see TaskMonitor
+        self.sessions.primary()     # Log in now, so bad credentials are reported straight away
+        if cache is not None:
+            self.enable_cache(cache, path=cache_file, indexes=cache_indexes)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Endpoints are declared as annotations (see XenConnection), and created on first use
+        for name, endpoint in vars(cls).get('__annotations__', {}).items():
+            if name in vars(cls):
+                continue
+            attribute = EndpointAttribute(endpoint)
+            attribute.__set_name__(cls, name)
+            setattr(cls, name, attribute)
 
-        for member, endpoint in typing.get_type_hints(self.__class__).items():
-            if not hasattr(self, member):
-                setattr(self, member, endpoint(self))
+    @property
+    def current_session(self) -> Session:
+        return self.sessions.primary()
+
+    def new_session(self) -> Session:
+        """Create a new session with the credentials of this connection"""
+        if self.emergency_mode:
+            return self.slave_local_login_with_password(self.user, self.passwd)
+        return self.login_with_password(self.user, self.passwd, version=self.api_version, originator='XenBridge')
 
     def login_with_password(self, uname, pwd, version, originator) -> Session:
         """Attempt to authenticate the user, returning a session reference if successful"""
@@ -35,16 +92,122 @@ class XenConnectionBase:
         session_ref = self._call_api('session.slave_local_login_with_password', uname, pwd)
         return Session(self, session_ref)
 
+    def enable_cache(self, classes: typing.Iterable[typing.Union[str, type]], timeout: float = 30.0,
+                     path: str = None, indexes: typing.Dict[str, typing.Iterable[str]] = None) -> XenCache:
+        """Mirror all records of the given classes (for example ['VM', 'host']) in memory,
+        kept up to date with the event system. Properties of these objects are then read from the cache.
+        If a path is given, the cache is restored from that file and saved to it when the connection is closed.
+        `indexes` maps class names to the fields to index, for example {'VM': ['resident_on', 'tags']}."""
+        if self.cache is not None:
+            self.cache.stop()
+        self.cache = XenCache(self, classes, timeout=timeout, path=path, indexes=indexes)
+        self.cache.start()
+        return self.cache
+
+    def events(self, classes: typing.Iterable[str] = ('*',), token: str = None, timeout: float = 30.0):
+        """Iterate over the changes of objects of the given classes (like ['vm', 'host'], or '*' for all)
+        as XenEvent objects, see XenEventStream. By default, only changes from now on are returned."""
+        return XenEventStream(self, classes, token=token, timeout=timeout)
+
+    def subscribe(self, classes: typing.Iterable[str] = ('*',), predicate: typing.Callable[[XenEvent], bool] = None,
+                  maxsize: int = 1000) -> Subscription:
+        """Receive the changes of objects of the given classes for which `predicate(event)` is true,
+        from the event pump that is shared by all subscribers of this connection (see EventPump)"""
+        return self.event_pump.subscribe(classes, predicate, maxsize)
+
+    def batch(self, max_concurrency: int = None) -> 'XenBatch':
+        """Dispatch independent calls concurrently, see XenBatch.
+        By default, as many calls are made at once as the connection pool allows."""
+        from .batch import XenBatch
+        return XenBatch(max_concurrency or getattr(self.transport, 'pool_size', 4))
+
+    def map(self, fn: typing.Callable, objects: typing.Iterable, max_concurrency: int = None) -> list:
+        """Call `fn(obj)` for every object concurrently, like `xen.map(VM.get_record, vms)`.
+        Returns the results in order, with the XenError in place of the result for calls that failed."""
+        from .batch import map_sync
+        return map_sync(fn, objects, max_concurrency or getattr(self.transport, 'pool_size', 4))
+
+    def close(self):
+        """Log out all sessions and close all persistent connections to the server"""
+        self.event_pump.stop()
+        if self.cache is not None:
+            self.cache.stop()
+            if self.cache.path is not None:
+                self.cache.save()
+        try:
+            for session in self.sessions.close():
+                try:
+                    self._call_api('session.logout', session.ref)
+                except XenError as e:
+                    if e.error_code != 'SESSION_INVALID':
+                        raise
+                except NETWORK_ERRORS:
+                    pass
+        finally:
+            self.proxy('close')()
+
     def call(self, method, *args):
-        # Make a call with our session ID
-        return self._call_api(method, self.current_session.ref, *args)
+        if self.flights is not None and is_read_method(method):
+            # Identical reads that are already in flight share their result
+            return self.flights.do((method, repr(args)), self._call_session, method, *args)
+        return self._call_session(method, *args)
+
+    def _call_session(self, method, *args):
+        # Make a call with a session from the pool, logging in again if the session has expired
+        slot = self.sessions.acquire()
+        try:
+            for retry in (False, True):
+                session = slot.get()
+                try:
+                    return self._call_api(method, session.ref, *args)
+                except XenError as e:
+                    # Don't log in again for a call that was still running when the connection was closed
+                    if e.error_code != 'SESSION_INVALID' or retry or self.sessions.closed:
+                        raise
+                    slot.invalidate(session)
+        finally:
+            self.sessions.release(slot)
+
+    def iter_call(self, method, *args) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+        """Make a call that returns a map (like VM.get_all_records), yielding its (key, value) pairs while the
+        response is being received, without holding the whole response in memory.
+        Over JSON-RPC, or with a transport that can't stream, the full response is received first."""
+        if self.protocol != 'xmlrpc' or not hasattr(self.transport, 'stream'):
+            yield from self.call(method, *args).items()
+            return
+        parts = urllib.parse.urlsplit(self.host)
+        handler = urllib.parse.urlunsplit(('', '', *parts[2:])) or '/RPC2'      # Same as ServerProxy
+        slot = self.sessions.acquire()
+        try:
+            for retry in (False, True):
+                session = slot.get()
+                request_body = xmlrpc.client.dumps((session.ref, *args), method).encode('utf-8', 'xmlcharrefreplace')
+                stream = RecordStream()
+                for chunk in self.transport.stream(parts.netloc, handler, request_body):
+                    yield from stream.feed(chunk)
+                yield from stream.close()
+                try:
+                    self._unwrap(stream.response)
+                    return
+                except XenError as e:
+                    # A failed call has no members, so it can be retried with a new session
+                    if e.error_code != 'SESSION_INVALID' or retry:
+                        raise
+                    slot.invalidate(session)
+        finally:
+            self.sessions.release(slot)
 
     def _call_api(self, method: str, *args):
         # print(f'Calling {method} with {args}')
-        func = self.proxy
-        for attr in method.split('.'):
-            func = getattr(func, attr)
-        result = func(*args)
+        func = getattr(self.proxy, method)      # ServerProxy accepts dotted method names as-is
+        if is_long_poll(method) and hasattr(self.transport, 'unbounded'):
+            # A long poll would hold a connection of the pool until it returns, starving other calls
+            with self.transport.unbounded():
+                return self._unwrap(func(*args))
+        return self._unwrap(func(*args))
+
+    @staticmethod
+    def _unwrap(result):
         if result['Status'] == 'Success':
             return result['Value']
         elif result['Status'] == 'Failure':
@@ -53,6 +216,377 @@ class XenConnectionBase:
             raise ValueError('Got an unknown response!')
 
 
+def is_read_method(method: str) -> bool:
+    """Whether an API method only reads, like VM.get_record or host.get_all_records.
+    Calls in the Async namespace are not, they start a new task."""
+    return not method.startswith('Async.') and method.rpartition('.')[2].startswith('get_')
+
+
+def is_long_poll(method: str) -> bool:
+    """Whether an API method waits on the server for events, which can take until its timeout"""
+    return method in ('event.from', 'event.next')
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls that run at the same time
+
+    The first caller of `do()` for a key runs the function, callers with the same key that arrive while it is
+    running wait for it and get a copy of its result (or the same exception), so callers can't see each other's
+    changes to it. Results are not kept after the call returns.
+    """
+
+    def __init__(self):
+        self._flights: typing.Dict[typing.Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: typing.Hashable, fn: typing.Callable, *args):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+        try:
+            flight.result = fn(*args)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class EndpointAttribute:
+    """
+    Endpoint of a connection, like `xen.VM`, created when it is first accessed
+
+    The endpoint class can be given by name, it is then looked up in the module of the connection class, which
+    imports the module of the endpoint lazily. The endpoint is stored on the connection, so later accesses
+    don't go through the descriptor.
+    """
+    __slots__ = ('endpoint', 'module', 'name')
+
+    def __init__(self, endpoint: typing.Union[str, type]):
+        self.endpoint = endpoint
+
+    def __set_name__(self, owner, name):
+        self.module = owner.__module__
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if isinstance(self.endpoint, str):
+            self.endpoint = getattr(sys.modules[self.module], self.endpoint)
+        value = instance.__dict__[self.name] = self.endpoint(instance)
+        return value
+
+
+class SessionPool:
+    """
+    Sessions shared by the threads that use a connection, at most `max_sessions` of them
+
+    Every call takes the session with the fewest calls in flight. A new session is only logged in when all
+    sessions are busy and the limit hasn't been reached, as xapi limits the number of sessions per user.
+    Expired sessions are replaced by logging in again. `close()` empties the pool, after which new sessions
+    are only logged in for new calls.
+    """
+
+    def __init__(self, login: typing.Callable[[], Session], max_sessions=1):
+        if max_sessions < 1:
+            raise ValueError('max_sessions should be at least 1')
+        self.login = login
+        self.max_sessions = max_sessions
+        self._slots: typing.List[_SessionSlot] = []
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def __len__(self):
+        return len(self._slots)
+
+    def primary(self) -> Session:
+        """The first session of the pool, logging in if there is none yet"""
+        with self._lock:
+            if not self._slots:
+                self._slots.append(_SessionSlot(self.login))
+                self.closed = False
+            slot = self._slots[0]
+        return slot.get()
+
+    def acquire(self) -> '_SessionSlot':
+        with self._lock:
+            slot = min(self._slots, key=lambda slot: slot.in_flight, default=None)
+            if slot is None or (slot.in_flight and len(self._slots) < self.max_sessions):
+                slot = _SessionSlot(self.login)
+                self._slots.append(slot)
+                self.closed = False
+            slot.in_flight += 1
+        return slot
+
+    def release(self, slot: '_SessionSlot'):
+        with self._lock:
+            slot.in_flight -= 1
+
+    def close(self) -> typing.List[Session]:
+        """Empty the pool, returning the sessions that were logged in, so they can be logged out"""
+        with self._lock:
+            slots, self._slots = self._slots, []
+            self.closed = True
+        return [slot.session for slot in slots if slot.session is not None]
+
+
+class _SessionSlot:
+    __slots__ = ('login', 'session', 'in_flight', '_lock')
+
+    def __init__(self, login: typing.Callable[[], Session]):
+        self.login = login
+        self.session: typing.Optional[Session] = None
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self) -> Session:
+        # Logging in happens outside of the pool's lock, so other sessions stay usable meanwhile
+        session = self.session
+        if session is None:
+            with self._lock:
+                if self.session is None:
+                    self.session = self.login()
+                session = self.session
+        return session
+
+    def invalidate(self, session: Session):
+        """Log in again, unless another thread already replaced the expired session"""
+        with self._lock:
+            if self.session is session:
+                self.session = None
+
+
+class PooledTransport(xmlrpc.client.Transport):
+    """
+    Thread-safe Transport that keeps a pool of persistent HTTP/1.1 connections
+
+    At most `pool_size` requests are in flight at once, callers beyond that wait for a free connection.
+    Idle connections are dropped after `idle_timeout` seconds, and a connection is recycled after
+    `max_requests` requests (0 means unlimited).
+
+    With `compression`, the server may send gzip or deflate compressed responses, which are decompressed while
+    they are received. Requests larger than `compress_threshold` bytes are sent gzipped, which is off by default
+    as not every server accepts compressed requests.
+
+    Requests made within `unbounded()` don't count towards `pool_size`, this is used for long polls.
+    """
+    content_type = 'text/xml'
+
+    def __init__(self, use_datetime=False, use_builtin_types=False,
+                 *, headers=(), https=False, context=None, pool_size=4, idle_timeout=60.0, max_requests=0,
+                 timeout=None, verbose=False, compression=True, compress_threshold=None):
+        if pool_size < 1:
+            raise ValueError('pool_size should be at least 1')
+        xmlrpc.client.Transport.__init__(self,
+                                         use_datetime=use_datetime,
+                                         use_builtin_types=use_builtin_types,
+                                         headers=headers)
+        self.use_https = https
+        self.verbose = verbose
+        self.context = context
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.accept_gzip_encoding = compression
+        self.encode_threshold = compress_threshold
+        self._idle = collections.deque()        # Idle _PooledConnection objects, most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def unbounded(self):
+        """Requests of the current thread within this block don't wait for (or take) a slot of the pool"""
+        self._local.unbounded = True
+        try:
+            yield
+        finally:
+            self._local.unbounded = False
+
+    def _slot(self):
+        return contextlib.nullcontext() if getattr(self._local, 'unbounded', False) else self._slots
+
+    def request(self, host, handler, request_body, verbose=False):
+        with self._slot():
+            conn, response = self._open(host, handler, request_body, verbose)
+            try:
+                result = self._parse(host, handler, response)
+            except Exception:
+                conn.close()
+                raise
+            self._release(conn, not response.will_close)
+            return result
+
+    def stream(self, host, handler, request_body, chunk_size=65536) -> typing.Iterator[bytes]:
+        """Make a request, yielding the (decompressed) response body in chunks as they arrive"""
+        with self._slot():
+            conn, response = self._open(host, handler, request_body)
+            try:
+                if response.status != 200:
+                    response.read()
+                    raise xmlrpc.client.ProtocolError(host + handler, response.status, response.reason,
+                                                      dict(response.getheaders()))
+                yield from self._body(response, chunk_size)
+            except BaseException:
+                # Also when the caller stops early, the rest of the body is still on the connection
+                conn.close()
+                raise
+            self._release(conn, not response.will_close)
+
+    def parse_response(self, response):
+        parser, unmarshaller = self.getparser()
+        for chunk in self._body(response):
+            if self.verbose:
+                print('body:', repr(chunk))
+            parser.feed(chunk)
+        parser.close()
+        return unmarshaller.close()
+
+    @staticmethod
+    def _body(response, chunk_size=65536) -> typing.Iterator[bytes]:
+        """Read the body of a response in chunks, decompressing it while it is received"""
+        encoding = response.getheader('Content-Encoding', '').lower()
+        if encoding not in ('gzip', 'deflate'):
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)     # Detects the gzip or zlib header
+        while True:
+            chunk = response.read(chunk_size)
+            if not chunk:
+                break
+            # Limit the output per step, compressed responses can expand a hundredfold
+            while chunk:
+                yield decompressor.decompress(chunk, chunk_size)
+                chunk = decompressor.unconsumed_tail
+        yield decompressor.flush()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, collections.deque()
+        for conn in idle:
+            conn.close()
+
+    def make_connection(self, host):
+        chost, _, x509 = self.get_host_info(host)
+        if self.use_https:
+            return http.client.HTTPSConnection(chost, None, context=self.context, timeout=self.timeout,
+                                               **(x509 or {}))
+        return http.client.HTTPConnection(chost, timeout=self.timeout)
+
+    def _acquire(self, host, fresh=False):
+        if not fresh:
+            now = time.monotonic()
+            with self._lock:
+                expired = [conn for conn in self._idle if now - conn.last_used > self.idle_timeout]
+                for conn in expired:
+                    self._idle.remove(conn)
+                for conn in reversed(self._idle):
+                    if conn.host == host:
+                        self._idle.remove(conn)
+                        break
+                else:
+                    conn = None
+            for old in expired:
+                old.close()
+            if conn is not None:
+                return conn
+        return _PooledConnection(host, self.make_connection(host))
+
+    def _release(self, conn, reusable=True):
+        conn.requests += 1
+        if not reusable or (self.max_requests and conn.requests >= self.max_requests):
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(conn)
+
+    def _open(self, host, handler, request_body, verbose=False):
+        # Retry once on a fresh connection if a reused connection has gone cold
+        for fresh in (False, True):
+            conn = self._acquire(host, fresh)
+            try:
+                return conn, self._send(conn, handler, request_body, verbose)
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                conn.close()
+                if fresh or conn.requests == 0:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+    def _send(self, conn, handler, request_body, verbose=False):
+        _, extra_headers, _ = self.get_host_info(conn.host)
+        http_conn = conn.connection
+        if verbose:
+            http_conn.set_debuglevel(1)
+        headers = list(self._headers) + list(extra_headers or ())
+        if self.accept_gzip_encoding:
+            http_conn.putrequest('POST', handler, skip_accept_encoding=True)
+            headers.append(('Accept-Encoding', 'gzip, deflate'))
+        else:
+            http_conn.putrequest('POST', handler)
+        headers.append(('Content-Type', self.content_type))
+        headers.append(('User-Agent', self.user_agent))
+        self.send_headers(http_conn, headers)
+        self.send_content(http_conn, request_body)
+        return http_conn.getresponse()
+
+    def _parse(self, host, handler, response):
+        if response.status != 200:
+            response.read()
+            raise xmlrpc.client.ProtocolError(host + handler, response.status, response.reason,
+                                              dict(response.getheaders()))
+        return self.parse_response(response)
+
+
+class JsonRpcTransport(PooledTransport):
+    """PooledTransport for JSON-RPC requests, returning the raw response body to be decoded by JsonRpcProxy"""
+    content_type = 'application/json'
+
+    def parse_response(self, response):
+        return b''.join(self._body(response))
+
+
+class _PooledConnection:
+    __slots__ = ('host', 'connection', 'last_used', 'requests')
+
+    def __init__(self, host, connection: http.client.HTTPConnection):
+        self.host = host
+        self.connection = connection
+        self.last_used = time.monotonic()
+        self.requests = 0
+
+    def close(self):
+        self.connection.close()
+
+
 class RequestsTransport(xmlrpc.client.Transport):
     """
     Drop in Transport for xmlrpclib that uses Requests instead of httplib
@@ -79,7 +613,7 @@ class RequestsTransport(xmlrpc.client.Transport):
         """
         Make an xmlrpc request.
         """
-        headers = {'User-Agent': self.user_agent}
+        headers = {'User-Agent': self.user_agent, 'Accept-Encoding': 'gzip, deflate'}
         url = self._build_url(host, handler)
         resp = requests.post(url, data=request_body, headers=headers, stream=True)
         try:
@@ -87,7 +621,12 @@ class RequestsTransport(xmlrpc.client.Transport):
         except requests.RequestException as e:
             raise xmlrpc.client.ProtocolError(url, resp.status_code, str(e), resp.headers)
         else:
-            return self.parse_response(resp.raw)
+            # iter_content() decompresses the body while it is received
+            parser, unmarshaller = self.getparser()
+            for chunk in resp.iter_content(65536):
+                parser.feed(chunk)
+            parser.close()
+            return unmarshaller.close()
 
     def _build_url(self, host, handler):
         """
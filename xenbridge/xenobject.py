@@ -1,5 +1,11 @@
+import collections.abc
 import functools
+import importlib
 import inspect
+import keyword
+import queue
+import time
+import types
 from typing import Any, Tuple, Union, Dict
 import datetime
 import sys
@@ -8,54 +14,70 @@ import enum
 
 
 class XenEndpoint:
+    # Instances only hold a reference to the connection, subclasses should define `__slots__ = ()`
+    # to keep it that way. The API class name (xenpath) is stored on the class
+    __slots__ = ('connection',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, 'xenpath'):
+            cls.xenpath = cls.__name__
+
     def __init__(self, connection):
         self.connection = connection
-        if not hasattr(self, 'xenpath'):
-            self.xenpath = self.__class__.__name__
 
     def call(self, methodname, *args):
         return self.connection.call(self.xenpath + '.' + methodname, *self.xen2ref(args))
 
+    def start_task(self, methodname, *args):
+        """Call the Async variant of a method, which returns a Task right away instead of waiting for the result"""
+        result = self.connection.call('Async.' + self.xenpath + '.' + methodname, *self.xen2ref(args))
+        convert = compile_converter(xenclass('task'))
+        if self.connection.asynchronous:
+            return _convert_async(convert, self.connection, result)
+        return convert(self.connection, result)
+
     def ref2xen(self, obj, typehint):
-        if typehint is None or self.issubclass(typehint, None.__class__):
-            return None
-        if typing.get_origin(typehint) is list:
-            # List[x]
-            hint_args = typing.get_args(typehint)
-            return [self.ref2xen(itm, hint_args[0]) for itm in obj]
-        if typing.get_origin(typehint) is tuple:
-            # Tuple[x,y]
-            hint_args = typing.get_args(typehint)
-            if hint_args[-1] is Ellipsis:
-                hint_args = hint_args[:-1]
-                hint_args += (hint_args[-1]) * (len(obj) - len(hint_args))
-            return tuple(self.ref2xen(itm, hint) for itm, hint in zip(obj, hint_args))
-        if typing.get_origin(typehint) is dict:
-            # Dict[x,y]
-            key_hint, val_hint = typing.get_args(typehint)
-            return {self.ref2xen(key, key_hint): self.ref2xen(val, val_hint) for (key, val) in obj.items()}
-        if typing.get_origin(typehint) is typing.Union:
-            # Optional[x] -> Union[x, None]
-            hint_arg = None
-            for arg in typing.get_args(typehint):
-                if not self.issubclass(arg, None.__class__):     # arg != NoneType
-                    if hint_arg is not None:
-                        raise ValueError("Type hint 'Union' not supported")
-                    hint_arg = arg
-            if obj is None:
-                return None
-            return self.ref2xen(obj, hint_arg)
-        if self.issubclass(typehint, (bool, int, float)):
-            # Basic types
-            return typehint(obj)
-        if self.issubclass(typehint, XenObject):
-            return typehint(self.connection, obj)
-        if self.issubclass(typehint, XenEnum):
-            return typehint(obj)
-        if typehint is datetime.datetime:
-            date = datetime.datetime.strptime(obj.value, '%Y%m%dT%H:%M:%SZ')
-            return date.replace(tzinfo=datetime.timezone.utc)
-        return obj
+        return compile_converter(typehint)(self.connection, obj)
+
+    def index(self, field: str):
+        """Index of the cached objects of this class by the value of a field, for example
+        `xen.VM.index('resident_on')[host]`. Requires the class to be cached, see XenConnection.enable_cache()"""
+        if self.connection.cache is None or not self.connection.cache.running:
+            raise ValueError('Indexes need a running cache, enable it with enable_cache()')
+        return self.connection.cache.index(self.xenpath, field)
+
+    def where(self, *queries, **fields):
+        """Get the records of the objects of this class that match a query, filtered by the server.
+        Keyword arguments are compared for equality, and combined with the XenQuery arguments:
+        `xen.VM.where(power_state='Running', is_a_template=False)`"""
+        from .query import compile_query
+        cls = xenclass(self.xenpath)
+        query = compile_query(cls, *queries, **fields)
+        result = self.connection.call(f'{self.xenpath}.get_all_records_where', str(query))
+        convert = compile_converter(Dict[cls, cls.Record])
+        if self.connection.asynchronous:
+            return _convert_async(convert, self.connection, result)
+        return convert(self.connection, result)
+
+    def prefetch(self, *paths: str):
+        """Get the records of all objects of this class, together with the records of related objects.
+        Paths are dotted field names, like `xen.VM.prefetch('VBDs.VDI.SR', 'VIFs.network')`. Every class on a
+        path is fetched once, and properties of the returned objects (and of the objects on the paths) are read
+        from the records without an API call, until the result is released (see Prefetched).
+        The records are a snapshot, they don't follow changes on the server"""
+        from .prefetch import prefetch
+        return prefetch(self.connection, xenclass(self.xenpath), paths)
+
+    def iter_all_records(self):
+        """Iterate over (object, record) of all objects of this class, like get_all_records(), decoding the
+        records while they are received. Only one record at a time is kept in memory."""
+        if self.connection.asynchronous:
+            raise TypeError('Records can\'t be streamed on an asynchronous connection, use get_all_records()')
+        cls = xenclass(self.xenpath)
+        connection = self.connection
+        return ((cls(connection, ref), cls.Record(connection, raw))
+                for ref, raw in connection.iter_call(f'{self.xenpath}.get_all_records'))
 
     @classmethod
     def xen2ref(cls, value: Any):
@@ -67,6 +89,8 @@ class XenEndpoint:
             return value.ref
         if isinstance(value, XenEnum):
             return value.value
+        if isinstance(value, XenRecord):
+            return dict(value.raw)
         return value
 
     @staticmethod
@@ -74,7 +98,220 @@ class XenEndpoint:
         return inspect.isclass(cls) and issubclass(cls, classinfo)
 
 
+def _identity(connection, obj):
+    return obj
+
+
+def _none(connection, obj):
+    return None
+
+
+def _datetime(connection, obj):
+    # XMLRPC gives a xmlrpc.client.DateTime, JSON-RPC a string
+    date = datetime.datetime.strptime(obj if isinstance(obj, str) else obj.value, '%Y%m%dT%H:%M:%SZ')
+    return date.replace(tzinfo=datetime.timezone.utc)
+
+
+async def _convert_async(convert, connection, result):
+    return convert(connection, await result)
+
+
+async def _resolved(value):
+    return value
+
+
+def resolve_typehint(typehint, module: str):
+    """Evaluate the forward references (like 'xenbridge.VM') in a type hint, within the namespace of `module`"""
+    holder = types.SimpleNamespace(__annotations__={'hint': typehint})
+    return typing.get_type_hints(holder, sys.modules[module].__dict__)['hint']
+
+
+@functools.lru_cache(maxsize=None)
+def compile_converter(typehint) -> typing.Callable[[Any, Any], Any]:
+    """Build a function `convert(connection, obj)` that casts an API value to the type in `typehint`.
+    Type hints are only inspected once, the resulting converter is cached per type hint."""
+    issubclass = XenEndpoint.issubclass
+    if typehint is None or issubclass(typehint, None.__class__):
+        return _none
+    origin = typing.get_origin(typehint)
+    if origin is list:
+        # List[x]
+        item_hint, = typing.get_args(typehint)
+        if issubclass(item_hint, XenObject):
+            return lambda connection, obj: [item_hint(connection, itm) for itm in obj]
+        convert_item = compile_converter(item_hint)
+        if convert_item is _identity:
+            return _identity
+        return lambda connection, obj: [convert_item(connection, itm) for itm in obj]
+    if origin is tuple:
+        # Tuple[x,y] or Tuple[x, ...]
+        hint_args = typing.get_args(typehint)
+        if len(hint_args) == 2 and hint_args[-1] is Ellipsis:
+            convert_item = compile_converter(hint_args[0])
+            return lambda connection, obj: tuple(convert_item(connection, itm) for itm in obj)
+        converters = tuple(compile_converter(hint) for hint in hint_args)
+        return lambda connection, obj: tuple(convert(connection, itm) for convert, itm in zip(converters, obj))
+    if origin is dict:
+        # Dict[x,y]
+        key_hint, val_hint = typing.get_args(typehint)
+        convert_key = compile_converter(key_hint)
+        convert_val = compile_converter(val_hint)
+        if convert_key is _identity and convert_val is _identity:
+            return _identity
+        if convert_val is _identity:
+            if issubclass(key_hint, XenObject):
+                return lambda connection, obj: {key_hint(connection, key): val for key, val in obj.items()}
+            return lambda connection, obj: {convert_key(connection, key): val for key, val in obj.items()}
+        if convert_key is _identity:
+            return lambda connection, obj: {key: convert_val(connection, val) for key, val in obj.items()}
+        return lambda connection, obj: {convert_key(connection, key): convert_val(connection, val)
+                                        for key, val in obj.items()}
+    if origin is typing.Union:
+        # Optional[x] -> Union[x, None]
+        hint_arg = None
+        for arg in typing.get_args(typehint):
+            if not issubclass(arg, None.__class__):     # arg != NoneType
+                if hint_arg is not None:
+                    raise ValueError("Type hint 'Union' not supported")
+                hint_arg = arg
+        convert = compile_converter(hint_arg)
+        if convert is _identity:
+            return _identity
+        return lambda connection, obj: None if obj is None else convert(connection, obj)
+    if issubclass(typehint, (bool, int, float)):
+        # Basic types
+        return lambda connection, obj: typehint(obj)
+    if issubclass(typehint, XenObject):
+        return typehint
+    if issubclass(typehint, XenRecord):
+        return typehint
+    if issubclass(typehint, XenEnum):
+        return lambda connection, obj: typehint(obj)
+    if typehint is datetime.datetime:
+        return _datetime
+    return _identity
+
+
+_xenclasses: Dict[str, type] = {}     # Lowercase API class name -> XenObject subclass
+
+
+def xenclass(name: str) -> type:
+    """Get the XenObject subclass for an API class name, like 'VM' or 'vbd' (case-insensitive)"""
+    try:
+        return _xenclasses[name.lower()]
+    except KeyError:
+        pass
+    # Class modules are imported lazily, and named after the lowercase API class name
+    try:
+        importlib.import_module(f'.{name.lower()}', __package__)
+        return _xenclasses[name.lower()]
+    except (ImportError, ValueError, KeyError):
+        raise ValueError(f'Unknown class {name!r}') from None
+
+
+class XenRecord(collections.abc.Mapping):
+    """
+    Record of an object, as returned by get_record() and get_all_records()
+    Fields are only converted to the type of the corresponding XenProperty when they are first accessed,
+    either as an attribute (record.power_state) or by their API name (record['power_state']).
+    Every XenObject subclass gets its own record type, for example VM.Record
+    """
+    __slots__ = ('connection', 'raw')
+    fields: Dict[str, 'RecordField'] = {}       # API field name -> RecordField
+
+    def __init__(self, connection, raw: Dict[str, Any]):
+        self.connection = connection
+        self.raw = raw
+
+    def __getitem__(self, key):
+        field = self.fields.get(key)
+        if field is None:
+            return self.raw[key]
+        return field.__get__(self)
+
+    def __contains__(self, key):
+        return key in self.raw
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __repr__(self):
+        return f'<{self.__class__.__qualname__} {self.raw!r}>'
+
+    @classmethod
+    def for_class(cls, xenclass: type):
+        """Create the record type for a XenObject subclass, with a field for every XenProperty"""
+        properties = {}
+        for klass in reversed(xenclass.__mro__):
+            properties.update((name, prop) for name, prop in vars(klass).items() if isinstance(prop, XenProperty))
+        # Converted values are stored in slots named after the field, prefixed with an underscore
+        record = type(f'{xenclass.__name__}Record', (cls,), {
+            '__slots__': tuple(f'_{name}' for name in properties),
+            '__module__': xenclass.__module__,
+            '__qualname__': f'{xenclass.__qualname__}.Record',
+        })
+        record.fields = {}
+        for name, prop in properties.items():
+            field = RecordField(prop, getattr(record, f'_{name}'))
+            setattr(record, name, field)
+            record.fields[prop.key] = field
+        return record
+
+
+class RecordField:
+    """Descriptor for a field of a XenRecord, converting the raw value when first accessed"""
+    __slots__ = ('property', 'slot')
+
+    def __init__(self, prop: 'XenProperty', slot):
+        self.property = prop
+        self.slot = slot
+
+    def __get__(self, instance: XenRecord, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        try:
+            raw = instance.raw[self.property.key]
+        except KeyError:
+            raise AttributeError(f'Record has no field {self.property.key!r}') from None
+        value = self.property.converter()(instance.connection, raw)
+        self.slot.__set__(instance, value)
+        return value
+
+
 class XenObject(XenEndpoint):
+    # With slots, an object takes 64 bytes on 64-bit CPython (connection, ref, the prefetched record and a
+    # weakref slot for the identity map), against 100-150 bytes (depending on the python version) with a __dict__.
+    __slots__ = ('ref', '_record', '__weakref__')
+
+    def __new__(cls, connection, ref):
+        # The connection's identity map makes sure every reference maps to a single object
+        identity_map = getattr(connection, '_identity_map', None)
+        if identity_map is None:
+            return cls._new()
+        key = (cls, ref)
+        obj = identity_map.get(key)
+        if obj is None:
+            obj = identity_map.setdefault(key, cls._new())
+        return obj
+
+    @classmethod
+    def _new(cls):
+        obj = super().__new__(cls)
+        obj._record = None      # Set by prefetch(), not in __init__ as that also runs for existing objects
+        return obj
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.Record = XenRecord.for_class(cls)
+        _xenclasses.setdefault(cls.xenpath.lower(), cls)
+
     def __init__(self, connection, ref):
         XenEndpoint.__init__(self, connection)
         self.ref = ref
@@ -82,8 +319,66 @@ class XenObject(XenEndpoint):
     def call(self, methodname, *args):
         return XenEndpoint.call(self, methodname, self, *args)      # Add object ref (self) to arguments
 
+    def start_task(self, methodname, *args):
+        return XenEndpoint.start_task(self, methodname, self, *args)
+
+    def wait_until(self, predicate: typing.Callable[['XenRecord'], bool], timeout: float = None) -> 'XenRecord':
+        """Wait until `predicate(record)` is true for the record of this object, like
+        `vm.wait_until(lambda record: record.power_state == VmPowerState.RUNNING, timeout=60)`.
+        Follows the events of the object instead of polling. Returns the record, or raises TimeoutError."""
+        if self.connection.asynchronous:
+            return self._wait_until_async(predicate, timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Only the latest state matters, older events can be dropped
+        with self.connection.subscribe([self.xenpath], lambda event: event.ref == self, maxsize=1) as subscription:
+            # The injected event holds the current record, later changes follow it
+            self.connection.call('event.inject', self.xenpath, self.ref)
+            while True:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    event = subscription.get(remaining)
+                except queue.Empty:
+                    raise TimeoutError(f'Condition on {self!r} not met within {timeout} seconds') from None
+                if event.snapshot is None:
+                    raise XenError({'ErrorDescription': ['HANDLE_INVALID', self.xenpath, self.ref]})
+                if predicate(event.snapshot):
+                    return event.snapshot
+
+    async def _wait_until_async(self, predicate, timeout):
+        import asyncio
+        from .events import XenEventStream
+        # Changes after the injected event's token are returned by the stream, so the record read after it is current
+        token = await self.connection.call('event.inject', self.xenpath, self.ref)
+        record = await self.get_record()
+        if predicate(record):
+            return record
+
+        async def follow():
+            async for event in XenEventStream(self.connection, [self.xenpath], token=token):
+                if event.ref != self:
+                    continue
+                if event.snapshot is None:
+                    raise XenError({'ErrorDescription': ['HANDLE_INVALID', self.xenpath, self.ref]})
+                if predicate(event.snapshot):
+                    return event.snapshot
+        try:
+            return await asyncio.wait_for(follow(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'Condition on {self!r} not met within {timeout} seconds') from None
+
+    def __eq__(self, other):
+        if isinstance(other, XenObject):
+            return self.ref == other.ref and self.xenpath == other.xenpath
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.ref)
+
     def __repr__(self):
         labels = [self.__class__.__qualname__]
+        if self.connection.asynchronous:
+            # Properties can't be awaited here
+            return f"<{labels[0]} {self.ref}>"
         try:
             labels.append(f"'{self.name_label}'")
         except AttributeError: pass
@@ -104,15 +399,45 @@ def XenMethod(func: typing.Callable = None, methodname: str = None, sig: inspect
         if arg.kind in (inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_KEYWORD):
             raise SystemError(f'Argument {arg.name} of function {methodname} is a keyword argument, which is not supported by XMLRPC')
 
+    # Name of the method in the API (python keywords have an underscore appended, like from_)
+    apiname = methodname[:-1] if methodname.endswith('_') and keyword.iskeyword(methodname[:-1]) else methodname
+    # Calls that pass every argument positionally don't need to be bound to the signature
+    positional = all(arg.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for arg in sig.parameters.values())
+    n_args = len(sig.parameters) - 1
+    has_return = sig.return_annotation is not inspect.Signature.empty
+    converter = None
+
     def wrapper(self: XenEndpoint, *args, **kwargs):
+        if kwargs or not positional or len(args) != n_args:
+            args = bind(self, args, kwargs)
+        result = self.call(apiname, *args)
+        if not has_return:
+            return result
+        if self.connection.asynchronous:
+            return convert_async(self, result)
+        return (converter or resolve(self))(self.connection, result)
+
+    def start_async(self: XenEndpoint, *args, **kwargs):
+        if kwargs or not positional or len(args) != n_args:
+            args = bind(self, args, kwargs)
+        return self.start_task(apiname, *args)
+
+    def bind(self: XenEndpoint, args, kwargs):
         arguments = sig.bind(self, *args, **kwargs)
         arguments.apply_defaults()
-        arguments = arguments.args[1:]       # Remove 'self'
-        result = self.call(methodname, *arguments)
-        if sig.return_annotation is not inspect.Signature.empty:
-            module_ns = sys.modules[self.__class__.__module__].__dict__
-            result = self.ref2xen(result, typing.get_type_hints(getattr(self, methodname), module_ns).get('return'))
-        return result
+        return arguments.args[1:]       # Remove 'self'
+
+    def resolve(self: XenEndpoint):
+        # Forward references like 'xenbridge.VM' can only be evaluated once the package is imported,
+        # so the return type is resolved on the first call and memoised
+        nonlocal converter
+        module_ns = sys.modules[self.__class__.__module__].__dict__
+        converter = compile_converter(typing.get_type_hints(wrapper, module_ns).get('return'))
+        return converter
+
+    async def convert_async(self: XenEndpoint, result):
+        result = await result
+        return (converter or resolve(self))(self.connection, result)
 
     if func is not None:
         wrapper = functools.wraps(func)(wrapper)       # Apply @functools.wraps(func) decorator
@@ -125,7 +450,72 @@ def XenMethod(func: typing.Callable = None, methodname: str = None, sig: inspect
         if sig.return_annotation is not inspect.Signature.empty:
             wrapper.__annotations__['return'] = sig.return_annotation
         wrapper.__signature__ = sig
-    return wrapper
+    wrapper.start_async = start_async
+    return XenMethodDescriptor(wrapper)
+
+
+class XenMethodDescriptor:
+    """
+    Method of an endpoint or object, as created by @XenMethod
+
+    Besides calling it, a method can be started as a task with `start_async()`, for example
+    `vm.clean_shutdown.start_async()`. This calls `Async.VM.clean_shutdown`, which returns a Task right away.
+    """
+
+    def __init__(self, function: typing.Callable):
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.start_async = function.start_async
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return BoundXenMethod(self.function, instance)
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def __repr__(self):
+        return f'<XenMethod {self.__qualname__}>'
+
+
+class _BoundDoc:
+    """__doc__ of BoundXenMethod, which is the docstring of the API method on instances"""
+
+    def __init__(self, doc: str):
+        self.doc = doc
+
+    def __get__(self, instance, owner=None):
+        return self.doc if instance is None else instance.func.__doc__
+
+
+class BoundXenMethod(functools.partial):
+    """XenMethod bound to an endpoint or object"""
+    __slots__ = ()
+    __doc__ = _BoundDoc(__doc__)
+    __name__ = property(lambda self: self.func.__name__)
+    __wrapped__ = property(lambda self: self.func)
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        # Without 'self', which is bound
+        sig = inspect.signature(self.func)
+        return sig.replace(parameters=list(sig.parameters.values())[1:])
+
+    def __eq__(self, other):
+        if not isinstance(other, BoundXenMethod):
+            return NotImplemented
+        return self.func is other.func and self.args[0] == other.args[0]
+
+    def __hash__(self):
+        return hash((self.func, self.args[0]))
+
+    def start_async(self, *args, **kwargs) -> 'xenbridge.Task':
+        """Start the call as a task, returning the Task without waiting for the call to complete"""
+        return self.func.start_async(*self.args, *args, **kwargs)
+
+    def __repr__(self):
+        return f'<bound XenMethod {self.func.__qualname__} of {self.args[0]!r}>'
 
 
 class XenProperty:
@@ -133,43 +523,80 @@ class XenProperty:
     WRITEONLY = 0b10
     READWRITE = READONLY | WRITEONLY
 
-    def __init__(self, access_type=READWRITE, description: str=None, typehint=None):
+    def __init__(self, access_type=READWRITE, description: str=None, typehint=None, column: str=None):
         self.read = bool(access_type & XenProperty.READONLY)
         self.write = bool(access_type & XenProperty.WRITEONLY)
         self.type = typehint
+        self._converter = None
+        self.column = column
         if description is not None:
             self.__doc__ = description
 
     def __set_name__(self, owner, name):
         self._target = owner
         self._field = name
+        # Name of the field in the API (python keywords have an underscore appended)
+        self.key = name[:-1] if name.endswith('_') and keyword.iskeyword(name[:-1]) else name
+        # Name of the database column, which differs for namespaced fields (like memory__static_max)
+        self.column = self.column or self.key
         if self.type is None and hasattr(owner, '__annotations__'):
             self.type = owner.__annotations__.get(self._field, inspect.Signature.empty)
         if self.read:
             methodname_get = 'get_' + self._field
             sig = inspect.Signature([inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)],
                                     return_annotation=self.type)
-            self.fget = XenMethod(methodname=methodname_get, sig=sig)
-            self.fget.__qualname__ = owner.__qualname__ + '.' + methodname_get
-            setattr(owner, methodname_get, self.fget)
+            method = XenMethod(methodname=methodname_get, sig=sig)
+            method.__qualname__ = method.function.__qualname__ = owner.__qualname__ + '.' + methodname_get
+            setattr(owner, methodname_get, method)
+            self.fget = method.function
         if self.write:
             methodname_set = 'set_' + self._field
             sig = inspect.Signature([inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD),
                                      inspect.Parameter('value', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=self.type)],
                                     return_annotation=None)
-            self.fset = XenMethod(methodname=methodname_set, sig=sig)
-            self.fset.__qualname__ = owner.__qualname__ + '.' + methodname_set
-            setattr(owner, methodname_set, self.fset)
+            method = XenMethod(methodname=methodname_set, sig=sig)
+            method.__qualname__ = method.function.__qualname__ = owner.__qualname__ + '.' + methodname_set
+            setattr(owner, methodname_set, method)
+            self.fset = method.function
+
+    def converter(self):
+        """Function `convert(connection, obj)` that casts a raw value of this field to its annotated type"""
+        if self._converter is None:
+            if self.type is inspect.Signature.empty:
+                self._converter = _identity
+            else:
+                self._converter = compile_converter(resolve_typehint(self.type, self._target.__module__))
+        return self._converter
 
     def __get__(self, instance: XenEndpoint, owner=None):
         if not self.read:
             raise AttributeError('Unreadable attribute')
+        cache = instance.connection.cache
+        if cache is not None and cache.running:
+            raw = cache.get_raw(instance)
+            if raw is not None and self.key in raw:
+                return self.converter()(instance.connection, raw[self.key])
+        record = instance._record
+        if record is not None and self.key in record.raw:
+            value = record.fields[self.key].__get__(record)
+            return _resolved(value) if instance.connection.asynchronous else value
         return self.fget(instance)
 
     def __set__(self, instance, value):
         if not self.write:
             raise AttributeError('Can\'t set attribute')
+        if instance.connection.asynchronous:
+            raise TypeError(f'Can\'t set attribute on an asynchronous connection, '
+                            f'use "await obj.set_{self._field}(value)" instead')
         self.fset(instance, value)
+        record = instance._record
+        if record is not None and self.key in record.fields:
+            # Keep the prefetched record in line with our own change
+            record.raw[self.key] = XenEndpoint.xen2ref(value)
+            try:
+                record.fields[self.key].slot.__delete__(record)
+            except AttributeError:
+                pass
 
 
 class XenEnum(enum.Enum):